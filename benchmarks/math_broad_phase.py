@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import goodgame as gg  # noqa
+
+
+def make_rects(count: int, world: float, size: float) -> list:
+    return [
+        (random.uniform(0, world), random.uniform(0, world), random.uniform(1, size), random.uniform(1, size))
+        for _ in range(count)
+    ]
+
+
+def move_rects(rects: list, speed: float) -> list:
+    return [
+        (r[0] + random.uniform(-speed, speed), r[1] + random.uniform(-speed, speed), r[2], r[3]) for r in rects
+    ]
+
+
+def brute_force(math: gg.Math, rects: list) -> set:
+    pairs = set()
+    has_intersection = math.has_intersection
+    for i in range(len(rects)):
+        rect = rects[i]
+        for j in range(i + 1, len(rects)):
+            if has_intersection(rect, rects[j]):
+                pairs.add((i, j))
+    return pairs
+
+
+def run_index(index: any, rects: list, frames: int, speed: float) -> tuple:
+    index.rebuild(rects)
+    pairs = index.query_pairs()
+    start = time.perf_counter()
+    for _ in range(frames):
+        rects = move_rects(rects, speed)
+        for i in range(len(rects)):
+            index.move(i, rects[i])
+        pairs = index.query_pairs()
+    return (time.perf_counter() - start) / frames, pairs
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    brute_count = min(count, int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+    world = (count ** 0.5) * 40
+    random.seed(0)
+    rects = make_rects(count, world, 24)
+    math = gg.Math()
+    start = time.perf_counter()
+    brute_pairs = brute_force(math, rects[:brute_count])
+    brute_time = time.perf_counter() - start
+    print(f'brute force ({brute_count} rects): {brute_time * 1000:.1f} ms, {len(brute_pairs)} pairs')
+    print(f'brute force ({count} rects, estimated): {brute_time * (count / brute_count) ** 2 * 1000:.1f} ms')
+    for index in (gg.SpatialHash(48), gg.QuadTree((0, 0, world + 24, world + 24))):
+        index.rebuild(rects[:brute_count])
+        assert index.query_pairs() == brute_pairs
+        random.seed(1)
+        frame_time, pairs = run_index(index, rects, 10, 4.0)
+        print(f'{type(index).__name__} ({count} rects): {frame_time * 1000:.1f} ms/frame, {len(pairs)} pairs')
+    math.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 from .exceptions import FlagNotFoundError, SDLError
 from .app import App
-from .clock import Clock, Timer, Animation, Counter
+from .clock import Clock, Timer, Animation, Counter, Scheduler
+from .tween import TweenSystem
 from .events import CommonEvent, QuitEvent, AudioDeviceEvent, DropEvent, TouchFingerEvent, KeyboardEvent,\
     MouseMotionEvent, MouseButtonEvent, MouseWheelEvent, TextEditingEvent, TextInputEvent, DisplayEvent, WindowEvent,\
     JoyAxisEvent, JoyBallEvent, JoyButtonEvent, JoyDeviceEvent, JoyHatEvent, JoyBatteryEvent, ControllerAxisEvent,\
@@ -11,15 +12,21 @@ from .window import Window
 from .surface import Surface, SurfaceAnimation
 from .texture import Texture
 from .renderer import Renderer
+from .batch import SpriteBatch
+from .commands import CommandBuffer
+from .atlas import TextureAtlas, TextureRegion, SkylinePacker
 from .cursor import CursorManager, Cursor
 from .touch import TouchDevice, Finger
 from .sensor import Sensor
 from .gamecontroller import GameController
 from .joystick import Joystick
 from .mixer import Mixer, Music, Chunk
-from .ttf import TTF
+from .ttf import TTF, FontManager
+from .text import GlyphAtlas, SDFGlyphAtlas, TextLayout, TextCache
 from .loader import Loader
-from .math import Math
+from .replay import EventRecorder, EventPlayer
+from .uploader import TextureUploader
+from .math import Math, SpatialHash, QuadTree
 from .opengl import GLContext
 from .bmf import BMFont, BMChar
 
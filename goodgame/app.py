@@ -1,10 +1,12 @@
 import os
 import ctypes
+import operator
 from .exceptions import FlagNotFoundError, SDLError
+from .clock import Clock
 from .events import CommonEvent, QuitEvent, AudioDeviceEvent, DropEvent, TouchFingerEvent, KeyboardEvent,\
     MouseMotionEvent, MouseButtonEvent, MouseWheelEvent, TextEditingEvent, TextInputEvent, DisplayEvent, WindowEvent,\
     JoyAxisEvent, JoyBallEvent, JoyButtonEvent, JoyDeviceEvent, JoyHatEvent, JoyBatteryEvent, ControllerAxisEvent,\
-    ControllerButtonEvent, ControllerDeviceEvent, ControllerTouchpadEvent, ControllerSensorEvent
+    ControllerButtonEvent, ControllerDeviceEvent, ControllerTouchpadEvent, ControllerSensorEvent, EventBlock
 from .sdl import SDLVersion, sdl_dir
 from .surface import Surface, SurfaceAnimation
 from .video import PixelFormat
@@ -76,6 +78,65 @@ except NameError:
     MIX_INIT_OPUS = 0x00000040
 
 
+event_dispatch_map = {
+    SDL_AUDIODEVICEADDED: ('on_audio_device_add', AudioDeviceEvent, 'adevice', False),
+    SDL_AUDIODEVICEREMOVED: ('on_audio_device_remove', AudioDeviceEvent, 'adevice', False),
+    SDL_QUIT: ('on_quit', QuitEvent, 'quit', False),
+    SDL_DROPFILE: ('on_drop_file', DropEvent, 'drop', True),
+    SDL_DROPTEXT: ('on_drop_text', DropEvent, 'drop', True),
+    SDL_DROPBEGIN: ('on_drop_begin', DropEvent, 'drop', True),
+    SDL_DROPCOMPLETE: ('on_drop_complete', DropEvent, 'drop', True),
+    SDL_FINGERMOTION: ('on_finger_move', TouchFingerEvent, 'tfinger', True),
+    SDL_FINGERDOWN: ('on_finger_down', TouchFingerEvent, 'tfinger', True),
+    SDL_FINGERUP: ('on_finger_up', TouchFingerEvent, 'tfinger', True),
+    SDL_KEYDOWN: ('on_key_down', KeyboardEvent, 'key', True),
+    SDL_KEYUP: ('on_key_up', KeyboardEvent, 'key', True),
+    SDL_TEXTEDITING: ('on_text_edit', TextEditingEvent, 'edit', True),
+    SDL_MOUSEMOTION: ('on_mouse_move', MouseMotionEvent, 'motion', True),
+    SDL_MOUSEBUTTONDOWN: ('on_mouse_down', MouseButtonEvent, 'button', True),
+    SDL_MOUSEBUTTONUP: ('on_mouse_up', MouseButtonEvent, 'button', True),
+    SDL_MOUSEWHEEL: ('on_mouse_wheel', MouseWheelEvent, 'wheel', True),
+    SDL_TEXTINPUT: ('on_text_input', TextInputEvent, 'text', True),
+    SDL_WINDOWEVENT: ('on_window_event', WindowEvent, 'window', True),
+    SDL_APP_TERMINATING: ('on_terminate', CommonEvent, 'common', False),
+    SDL_APP_LOWMEMORY: ('on_low_memory', CommonEvent, 'common', False),
+    SDL_APP_WILLENTERBACKGROUND: ('on_will_enter_background', CommonEvent, 'common', False),
+    SDL_APP_DIDENTERBACKGROUND: ('on_did_enter_background', CommonEvent, 'common', False),
+    SDL_APP_WILLENTERFOREGROUND: ('on_will_enter_foreground', CommonEvent, 'common', False),
+    SDL_APP_DIDENTERFOREGROUND: ('on_did_enter_foreground', CommonEvent, 'common', False),
+    SDL_RENDER_TARGETS_RESET: ('on_render_targets_reset', CommonEvent, 'common', False),
+    SDL_RENDER_DEVICE_RESET: ('on_render_device_reset', CommonEvent, 'common', False),
+    SDL_TEXTEDITING_EXT: ('on_text_edit_ext', TextEditingEvent, 'editExt', True),
+    SDL_DISPLAYEVENT: ('on_display_event', DisplayEvent, 'display', True),
+    SDL_LOCALECHANGED: ('on_locale_change', CommonEvent, 'common', False),
+    SDL_KEYMAPCHANGED: ('on_keymap_change', CommonEvent, 'common', False),
+    SDL_CLIPBOARDUPDATE: ('on_clipboard_update', CommonEvent, 'common', False),
+    SDL_JOYAXISMOTION: ('on_joy_axis_move', JoyAxisEvent, 'jaxis', False),
+    SDL_JOYBALLMOTION: ('on_joy_ball_move', JoyBallEvent, 'jball', False),
+    SDL_JOYBUTTONDOWN: ('on_joy_button_down', JoyButtonEvent, 'jbutton', False),
+    SDL_JOYBUTTONUP: ('on_joy_button_up', JoyButtonEvent, 'jbutton', False),
+    SDL_JOYDEVICEADDED: ('on_joy_device_add', JoyDeviceEvent, 'jdevice', False),
+    SDL_JOYDEVICEREMOVED: ('on_joy_device_remove', JoyDeviceEvent, 'jdevice', False),
+    SDL_JOYHATMOTION: ('on_joy_hat_move', JoyHatEvent, 'jhat', False),
+    SDL_JOYBATTERYUPDATED: ('on_joy_battery_update', JoyBatteryEvent, 'jbattery', False),
+    SDL_CONTROLLERAXISMOTION: ('on_controller_axis_move', ControllerAxisEvent, 'caxis', False),
+    SDL_CONTROLLERBUTTONDOWN: ('on_controller_button_down', ControllerButtonEvent, 'cbutton', False),
+    SDL_CONTROLLERBUTTONUP: ('on_controller_button_up', ControllerButtonEvent, 'cbutton', False),
+    SDL_CONTROLLERDEVICEADDED: ('on_controller_device_add', ControllerDeviceEvent, 'cdevice', False),
+    SDL_CONTROLLERDEVICEREMOVED: ('on_controller_device_remove', ControllerDeviceEvent, 'cdevice', False),
+    SDL_CONTROLLERDEVICEREMAPPED: ('on_controller_device_remap', ControllerDeviceEvent, 'cdevice', False),
+    SDL_CONTROLLERTOUCHPADDOWN: ('on_controller_touchpad_down', ControllerTouchpadEvent, 'ctouchpad', False),
+    SDL_CONTROLLERTOUCHPADMOTION: ('on_controller_touchpad_move', ControllerTouchpadEvent, 'ctouchpad', False),
+    SDL_CONTROLLERTOUCHPADUP: ('on_controller_touchpad_up', ControllerTouchpadEvent, 'ctouchpad', False),
+    SDL_CONTROLLERSENSORUPDATE: ('on_controller_sensor_update', ControllerSensorEvent, 'csensor', False)
+}
+required_events = {
+    SDL_QUIT, SDL_WINDOWEVENT, SDL_APP_TERMINATING, SDL_APP_LOWMEMORY, SDL_APP_WILLENTERBACKGROUND,
+    SDL_APP_DIDENTERBACKGROUND, SDL_APP_WILLENTERFOREGROUND, SDL_APP_DIDENTERFOREGROUND, SDL_RENDER_TARGETS_RESET,
+    SDL_RENDER_DEVICE_RESET
+}
+
+
 class App:
     def __init__(self) -> None:
         self.destroyed = True
@@ -154,83 +215,21 @@ class App:
             'nv21': SDL_PIXELFORMAT_NV21
         }
         self.r_format_map = {b: a for a, b in self.format_map.items()}
+        self.sdl_event = SDL_Event()
+        self.event_names = None
+        self.event_block = None
+        self.coalesce_events = False
         self.event_map = {
-            SDL_AUDIODEVICEADDED: lambda: self.on_audio_device_add(AudioDeviceEvent(self.sdl_event.adevice)),
-            SDL_AUDIODEVICEREMOVED: lambda: self.on_audio_device_remove(AudioDeviceEvent(self.sdl_event.adevice)),
-            SDL_QUIT: lambda: self.on_quit(QuitEvent(self.sdl_event.quit)),
-            SDL_DROPFILE: lambda: self.on_drop_file(DropEvent(self.sdl_event.drop, self)),
-            SDL_DROPTEXT: lambda: self.on_drop_text(DropEvent(self.sdl_event.drop, self)),
-            SDL_DROPBEGIN: lambda: self.on_drop_begin(DropEvent(self.sdl_event.drop, self)),
-            SDL_DROPCOMPLETE: lambda: self.on_drop_complete(DropEvent(self.sdl_event.drop, self)),
-            SDL_FINGERMOTION: lambda: self.on_finger_move(TouchFingerEvent(self.sdl_event.tfinger, self)),
-            SDL_FINGERDOWN: lambda: self.on_finger_down(TouchFingerEvent(self.sdl_event.tfinger, self)),
-            SDL_FINGERUP: lambda: self.on_finger_up(TouchFingerEvent(self.sdl_event.tfinger, self)),
-            SDL_KEYDOWN: lambda: self.on_key_down(KeyboardEvent(self.sdl_event.key, self)),
-            SDL_KEYUP: lambda: self.on_key_up(KeyboardEvent(self.sdl_event.key, self)),
-            SDL_TEXTEDITING: lambda: self.on_text_edit(TextEditingEvent(self.sdl_event.edit, self)),
-            SDL_MOUSEMOTION: lambda: self.on_mouse_move(MouseMotionEvent(self.sdl_event.motion, self)),
-            SDL_MOUSEBUTTONDOWN: lambda: self.on_mouse_down(MouseButtonEvent(self.sdl_event.button, self)),
-            SDL_MOUSEBUTTONUP: lambda: self.on_mouse_up(MouseButtonEvent(self.sdl_event.button, self)),
-            SDL_MOUSEWHEEL: lambda: self.on_mouse_wheel(MouseWheelEvent(self.sdl_event.wheel, self)),
-            SDL_TEXTINPUT: lambda: self.on_text_input(TextInputEvent(self.sdl_event.text, self)),
-            SDL_WINDOWEVENT: lambda: self.on_window_event(WindowEvent(self.sdl_event.window, self)),
-            SDL_APP_TERMINATING: lambda: self.on_terminate(CommonEvent(self.sdl_event.common)),
-            SDL_APP_LOWMEMORY: lambda: self.on_low_memory(CommonEvent(self.sdl_event.common)),
-            SDL_APP_WILLENTERBACKGROUND: lambda: self.on_will_enter_background(CommonEvent(self.sdl_event.common)),
-            SDL_APP_DIDENTERBACKGROUND: lambda: self.on_did_enter_background(CommonEvent(self.sdl_event.common)),
-            SDL_APP_WILLENTERFOREGROUND: lambda: self.on_will_enter_foreground(CommonEvent(self.sdl_event.common)),
-            SDL_APP_DIDENTERFOREGROUND: lambda: self.on_did_enter_foreground(CommonEvent(self.sdl_event.common)),
-            SDL_RENDER_TARGETS_RESET: lambda: self.on_render_targets_reset(CommonEvent(self.sdl_event.common)),
-            SDL_RENDER_DEVICE_RESET: lambda: self.on_render_device_reset(CommonEvent(self.sdl_event.common)),
-            SDL_TEXTEDITING_EXT: lambda: self.on_text_edit_ext(TextEditingEvent(self.sdl_event.edit, self)),
-            SDL_DISPLAYEVENT: lambda: self.on_display_event(DisplayEvent(self.sdl_event.display, self)),
-            SDL_LOCALECHANGED: lambda: self.on_locale_change(CommonEvent(self.sdl_event.common)),
-            SDL_KEYMAPCHANGED: lambda: self.on_keymap_change(CommonEvent(self.sdl_event.common)),
-            SDL_CLIPBOARDUPDATE: lambda: self.on_clipboard_update(CommonEvent(self.sdl_event.common)),
-            SDL_JOYAXISMOTION: lambda: self.on_joy_axis_move(JoyAxisEvent(self.sdl_event.jaxis)),
-            SDL_JOYBALLMOTION: lambda: self.on_joy_ball_move(JoyBallEvent(self.sdl_event.jball)),
-            SDL_JOYBUTTONDOWN: lambda: self.on_joy_button_down(JoyButtonEvent(self.sdl_event.jbutton)),
-            SDL_JOYBUTTONUP: lambda: self.on_joy_button_up(JoyButtonEvent(self.sdl_event.jbutton)),
-            SDL_JOYDEVICEADDED: lambda: self.on_joy_device_add(JoyDeviceEvent(self.sdl_event.jdevice)),
-            SDL_JOYDEVICEREMOVED: lambda: self.on_joy_device_remove(JoyDeviceEvent(self.sdl_event.jdevice)),
-            SDL_JOYHATMOTION: lambda: self.on_joy_hat_move(JoyHatEvent(self.sdl_event.jhat)),
-            SDL_JOYBATTERYUPDATED: lambda: self.on_joy_battery_update(JoyBatteryEvent(self.sdl_event.jbattery)),
-            SDL_CONTROLLERAXISMOTION: lambda: self.on_controller_axis_move(ControllerAxisEvent(self.sdl_event.caxis)),
-            SDL_CONTROLLERBUTTONDOWN: lambda: self.on_controller_button_down(
-                ControllerButtonEvent(self.sdl_event.cbutton)
-            ),
-            SDL_CONTROLLERBUTTONUP: lambda: self.on_controller_button_up(
-                ControllerButtonEvent(self.sdl_event.cbutton)
-            ),
-            SDL_CONTROLLERDEVICEADDED: lambda: self.on_controller_device_add(
-                ControllerDeviceEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERDEVICEREMOVED: lambda: self.on_controller_device_remove(
-                ControllerDeviceEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERDEVICEREMAPPED: lambda: self.on_controller_device_remap(
-                ControllerDeviceEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERTOUCHPADDOWN: lambda: self.on_controller_touchpad_down(
-                ControllerTouchpadEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERTOUCHPADMOTION: lambda: self.on_controller_touchpad_move(
-                ControllerTouchpadEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERTOUCHPADUP: lambda: self.on_controller_touchpad_up(
-                ControllerTouchpadEvent(self.sdl_event.cdevice)
-            ),
-            SDL_CONTROLLERSENSORUPDATE: lambda: self.on_controller_sensor_update(
-                ControllerSensorEvent(self.sdl_event.cdevice)
-            )
+            event_type: self.make_dispatcher(*dispatch_info) for event_type, dispatch_info in event_dispatch_map.items()
         }
         self.windows = {}
         self.running = False
+        self.fixed_step = 1 / 60
+        self.accumulator = 0.0
         self.rel_mouse_mode = False
         self.mouse_capture = False
         self.platform = self.bts(SDL_GetPlatform())
         self.keyboard_state_ptr = SDL_GetKeyboardState(None)
-        self.sdl_event = SDL_Event()
         self.destroyed = False
         # TODO:
         #  handle more errors
@@ -438,8 +437,7 @@ class App:
     ) -> Surface:
         if pixel_format:
             surf = SDL_CreateRGBSurfaceWithFormatFrom(
-                data, int(size[0]), int(size[1]), depth, pitch, mask[0],
-                mask[1], mask[2], mask[3], pixel_format.pixel_format
+                data, int(size[0]), int(size[1]), depth, pitch, pixel_format.pixel_format
             )
         else:
             surf = SDL_CreateRGBSurfaceFrom(
@@ -453,15 +451,16 @@ class App:
             self, size: any, depth: int = 32, mask: any = (0, 0, 0, 0), pixel_format: PixelFormat = None
     ) -> Surface:
         if pixel_format:
-            surf = SDL_CreateRGBSurfaceWithFormat(
-                0, int(size[0]), int(size[1]), depth, mask[0], mask[1], mask[2], mask[3], pixel_format.pixel_format
-            )
+            surf = SDL_CreateRGBSurfaceWithFormat(0, int(size[0]), int(size[1]), depth, pixel_format.pixel_format)
         else:
             surf = SDL_CreateRGBSurface(0, int(size[0]), int(size[1]), depth, mask[0], mask[1], mask[2], mask[3])
         if not surf:
             self.raise_error()
         return Surface(surf, self)
 
+    def surface_from_array(self, array: any, pixel_format: any = None) -> Surface:
+        return Surface.from_array(self, array, pixel_format)
+
     def surface_from_bmp(self, path: str) -> Surface:
         surf = SDL_LoadBMP(self.stb(path))
         if not surf:
@@ -480,17 +479,70 @@ class App:
             self.raise_error(IMG_GetError)
         return SurfaceAnimation(anim, self)
 
+    def make_dispatcher(self, handler_name: str, event_class: any, field_name: str, with_app: bool) -> any:
+        get_field = operator.attrgetter(field_name)
+        sdl_event = self.sdl_event
+        if with_app:
+            return lambda: getattr(self, handler_name)(event_class(get_field(sdl_event), self))
+        return lambda: getattr(self, handler_name)(event_class(get_field(sdl_event)))
+
+    def set_event_enabled(self, event_type: int, enabled: bool) -> None:
+        SDL_EventState(event_type, SDL_ENABLE if enabled else SDL_IGNORE)
+
+    def is_event_enabled(self, event_type: int) -> bool:
+        return SDL_EventState(event_type, SDL_QUERY) == SDL_ENABLE
+
+    def subscribe(self, events: any) -> None:
+        handler_map = {dispatch_info[0]: event_type for event_type, dispatch_info in event_dispatch_map.items()}
+        event_types = set(handler_map.get(event, event) for event in events) | required_events
+        for event_type in event_dispatch_map:
+            if event_type < SDL_USEREVENT:
+                self.set_event_enabled(event_type, event_type in event_types)
+
     def poll_events(self) -> None:
-        while SDL_PollEvent(self.sdl_event):
-            (self.event_map.get(self.sdl_event.type) or self.on_unknown_event)()
+        sdl_event = self.sdl_event
+        event_map = self.event_map
+        while SDL_PollEvent(sdl_event):
+            (event_map.get(sdl_event.type) or self.on_unknown_event)()
+
+    def set_event_drain(self, enabled: bool, block_size: int = 256, coalesce: bool = False) -> None:
+        if enabled:
+            self.event_block = EventBlock(block_size)
+            self.coalesce_events = coalesce
+            self.poll_events = self.drain_events
+        else:
+            self.event_block = None
+            self.coalesce_events = False
+            self.__dict__.pop('poll_events', None)
+
+    def drain_events(self) -> None:
+        sdl_event_ptr = ctypes.addressof(self.sdl_event)
+        sdl_event = self.sdl_event
+        event_map = self.event_map
+        block = self.event_block
+        addresses = block.addresses
+        event_size = block.event_size
+        SDL_PumpEvents()
+        while True:
+            count = block.peep()
+            if count < 0:
+                self.raise_error()
+            for i in block.coalesce(count) if self.coalesce_events else range(count):
+                ctypes.memmove(sdl_event_ptr, addresses[i], event_size)
+                (event_map.get(sdl_event.type) or self.on_unknown_event)()
+            if count < block.size:
+                break
 
     def on_unknown_event(self) -> None:
-        event_names = []
-        for var_name in sdl_dir:
-            if not var_name.startswith('SDL_'):
-                continue
-            if eval(var_name) == self.sdl_event.type:
-                event_names.append(var_name)
+        if self.event_names is None:
+            self.event_names = {}
+            for var_name in sdl_dir:
+                if not var_name.startswith('SDL_'):
+                    continue
+                value = globals().get(var_name)
+                if isinstance(value, int):
+                    self.event_names.setdefault(value, []).append(var_name)
+        event_names = self.event_names.get(self.sdl_event.type, ())
         print(f'Unknown event {self.sdl_event.type}: {", ".join(event_names)}')
 
     def run_loop(self) -> None:
@@ -498,6 +550,39 @@ class App:
         while self.running:
             self.on_tick()
 
+    def run_fixed_loop(
+            self, step: float = 1 / 60, max_steps: int = 5, fps_limit: float = None, clock: Clock = None
+    ) -> None:
+        if clock is None:
+            clock = Clock(1 / step if fps_limit is None else fps_limit, True)
+        old_fps_limit, old_pacing = clock.fps_limit, clock.pacing
+        if fps_limit is not None:
+            clock.fps_limit = fps_limit
+        clock.pacing = True
+        clock.reset()
+        self.fixed_step = step
+        self.accumulator = 0.0
+        self.running = True
+        try:
+            while self.running:
+                if not clock.tick():
+                    continue
+                self.accumulator += clock.delta
+                self.poll_events()
+                steps = 0
+                while self.running and self.accumulator >= step:
+                    if steps >= max_steps:
+                        self.accumulator %= step
+                        break
+                    self.on_fixed_update(step)
+                    self.accumulator -= step
+                    steps += 1
+                if not self.running:
+                    break
+                self.on_render(self.accumulator / step)
+        finally:
+            clock.fps_limit, clock.pacing = old_fps_limit, old_pacing
+
     def stop_loop(self) -> None:
         self.running = False
 
@@ -638,6 +723,12 @@ class App:
     def on_tick(self) -> None:
         pass
 
+    def on_fixed_update(self, dt: float) -> None:
+        pass
+
+    def on_render(self, alpha: float) -> None:
+        pass
+
     def on_audio_device_add(self, event: AudioDeviceEvent) -> None:
         pass
 
@@ -707,7 +798,7 @@ class App:
         pass
 
     def on_window_event(self, event: WindowEvent) -> None:
-        event.window.event_map.get(self.sdl_event.window.event)(event)
+        event.window.event_map.get(event.event)(event)
 
     def on_terminate(self, event: CommonEvent) -> None:
         pass
@@ -0,0 +1,224 @@
+from .texture import Texture
+from .surface import Surface
+
+
+class TextureRegion:
+    region = True
+
+    def __init__(self, page: Texture, rect: any) -> None:
+        self.page = page
+        self.texture = page.texture
+        self.rect = (int(rect[0]), int(rect[1]), int(rect[2]), int(rect[3]))
+        self.w, self.h = self.rect[2], self.rect[3]
+        self.size = self.w, self.h
+
+    @property
+    def color_mod(self) -> tuple:
+        return self.page.color_mod
+
+    @property
+    def alpha_mod(self) -> int:
+        return self.page.alpha_mod
+
+    @property
+    def blend_mode(self) -> int:
+        return self.page.blend_mode
+
+    @property
+    def scale_mode(self) -> str:
+        return self.page.scale_mode
+
+    @property
+    def format(self) -> any:
+        return self.page.format
+
+    def map_rect(self, src_rect: any = None) -> tuple:
+        if not src_rect:
+            return self.rect
+        return self.rect[0] + src_rect[0], self.rect[1] + src_rect[1], src_rect[2], src_rect[3]
+
+    def sub_region(self, rect: any) -> any:
+        return TextureRegion(self.page, self.map_rect(rect))
+
+    def get_size(self) -> tuple:
+        return self.size
+
+    def get_w(self) -> int:
+        return self.w
+
+    def get_h(self) -> int:
+        return self.h
+
+    def get_format(self) -> any:
+        return self.page.format
+
+    def get_page_size(self) -> tuple:
+        return self.page.get_size()
+
+    def destroy(self) -> bool:
+        return True
+
+
+class SkylinePacker:
+    def __init__(self, size: any) -> None:
+        self.size = (int(size[0]), int(size[1]))
+        self.skyline = [[0, 0, self.size[0]]]
+
+    def fit(self, index: int, w: int, h: int) -> int:
+        x, y = self.skyline[index][0], self.skyline[index][1]
+        if x + w > self.size[0]:
+            return -1
+        width_left = w
+        while width_left > 0:
+            y = max(y, self.skyline[index][1])
+            if y + h > self.size[1]:
+                return -1
+            width_left -= self.skyline[index][2]
+            index += 1
+        return y
+
+    def insert(self, size: any) -> any:
+        w, h = int(size[0]), int(size[1])
+        best_index, best_bottom, best_width, best_y = -1, self.size[1] + 1, self.size[0] + 1, 0
+        for i in range(len(self.skyline)):
+            y = self.fit(i, w, h)
+            if y < 0:
+                continue
+            if y + h < best_bottom or (y + h == best_bottom and self.skyline[i][2] < best_width):
+                best_index, best_bottom, best_width, best_y = i, y + h, self.skyline[i][2], y
+        if best_index < 0:
+            return None
+        x = self.skyline[best_index][0]
+        self.add_level(best_index, x, best_y, w, h)
+        return x, best_y
+
+    def add_level(self, index: int, x: int, y: int, w: int, h: int) -> None:
+        self.skyline.insert(index, [x, y + h, w])
+        i = index + 1
+        while i < len(self.skyline):
+            node, prev = self.skyline[i], self.skyline[i - 1]
+            shrink = prev[0] + prev[2] - node[0]
+            if shrink <= 0:
+                break
+            node[0] += shrink
+            node[2] -= shrink
+            if node[2] > 0:
+                break
+            del self.skyline[i]
+        i = 0
+        while i < len(self.skyline) - 1:
+            if self.skyline[i][1] == self.skyline[i + 1][1]:
+                self.skyline[i][2] += self.skyline[i + 1][2]
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+    def reset(self) -> None:
+        self.skyline = [[0, 0, self.size[0]]]
+
+
+class TextureAtlas:
+    def __init__(
+            self,
+            renderer: any,
+            page_size: any = (1024, 1024),
+            padding: int = 1,
+            pixel_format: str = 'rgba32',
+            scale_mode: str = None
+    ) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.page_size = (int(page_size[0]), int(page_size[1]))
+        self.padding = int(padding)
+        self.format = renderer.pixel_format_from_str(pixel_format)
+        self.scale_mode = scale_mode
+        self.pages = []
+        self.packers = []
+        self.regions = {}
+        self.destroyed = False
+
+    def create_page(self, size: any) -> int:
+        page = self.renderer.create_texture(size, self.format)
+        page.set_blend_mode('blend')
+        if self.scale_mode:
+            page.set_scale_mode(self.scale_mode)
+        bak_target = self.renderer.target
+        self.renderer.set_target(page)
+        self.renderer.clear((0, 0, 0, 0))
+        self.renderer.set_target(bak_target)
+        self.pages.append(page)
+        self.packers.append(SkylinePacker(size))
+        return len(self.pages) - 1
+
+    def allocate(self, size: any) -> tuple:
+        padded = (int(size[0]) + self.padding * 2, int(size[1]) + self.padding * 2)
+        for page_id in range(len(self.packers)):
+            pos = self.packers[page_id].insert(padded)
+            if pos:
+                return self.pages[page_id], (pos[0] + self.padding, pos[1] + self.padding, int(size[0]), int(size[1]))
+        page_id = self.create_page((max(self.page_size[0], padded[0]), max(self.page_size[1], padded[1])))
+        pos = self.packers[page_id].insert(padded)
+        return self.pages[page_id], (pos[0] + self.padding, pos[1] + self.padding, int(size[0]), int(size[1]))
+
+    def add_surface(self, surf: Surface, key: any = None) -> TextureRegion:
+        page, rect = self.allocate(surf.size)
+        converted = surf if surf.format.pixel_format == self.format.pixel_format else surf.convert(self.format)
+        if converted.must_lock:
+            converted.lock()
+        page.update(converted.surface.contents.pixels, converted.surface.contents.pitch, rect)
+        if converted.must_lock:
+            converted.unlock()
+        if converted is not surf:
+            converted.destroy()
+        return self.add_region(TextureRegion(page, rect), key)
+
+    def add_texture(self, texture: any, key: any = None) -> TextureRegion:
+        page, rect = self.allocate(texture.get_size())
+        if self.renderer.command_buffer:
+            with self.renderer.command_buffer.paused():
+                self.copy_texture(texture, page, rect)
+        else:
+            self.copy_texture(texture, page, rect)
+        return self.add_region(TextureRegion(page, rect), key)
+
+    def copy_texture(self, texture: any, page: Texture, rect: tuple) -> None:
+        bak_target = self.renderer.target
+        bak_blend_mode = texture.blend_mode
+        texture.set_blend_mode('none')
+        self.renderer.set_target(page)
+        self.renderer.blit(texture, dst_rect=rect)
+        self.renderer.set_target(bak_target)
+        texture.set_blend_mode_int(bak_blend_mode)
+
+    def add_surfaces(self, surfaces: any, keys: any = None) -> list:
+        order = sorted(range(len(surfaces)), key=lambda _x: -surfaces[_x].h)
+        result = [None] * len(surfaces)
+        for i in order:
+            result[i] = self.add_surface(surfaces[i], keys and keys[i])
+        return result
+
+    def add_region(self, region: TextureRegion, key: any = None) -> TextureRegion:
+        if key is not None:
+            self.regions[key] = region
+        return region
+
+    def get(self, key: any) -> TextureRegion:
+        return self.regions.get(key)
+
+    def clear(self) -> None:
+        self.regions.clear()
+        for page in self.pages:
+            page.destroy()
+        self.pages.clear()
+        self.packers.clear()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.clear()
+        del self.renderer
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
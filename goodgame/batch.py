@@ -0,0 +1,153 @@
+import math
+import ctypes
+from .sdl import sdl_dir
+from sdl2 import *
+
+
+class SpriteBatch:
+    def __init__(self, renderer: any, capacity: int = 1024) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.capacity = max(int(capacity), 1)
+        self.use_geometry = 'SDL_RenderGeometryRaw' in sdl_dir
+        self.xy = (ctypes.c_float * (self.capacity * 8))()
+        self.uv = (ctypes.c_float * (self.capacity * 8))()
+        self.colors = (ctypes.c_ubyte * (self.capacity * 16))()
+        self.colors_ptr = ctypes.cast(self.colors, ctypes.POINTER(SDL_Color))
+        self.indices = (ctypes.c_int * (self.capacity * 6))(*(
+            base + offset for base in range(0, self.capacity * 4, 4) for offset in (0, 1, 2, 2, 3, 0)
+        ))
+        self.texture = None
+        self.tex_size = (1, 1)
+        self.count = 0
+        self.drawing = False
+        self.destroyed = False
+
+    def begin(self) -> None:
+        self.drawing = True
+
+    def end(self) -> None:
+        self.flush()
+        self.drawing = False
+
+    def flush(self) -> None:
+        if not self.count:
+            return
+        SDL_RenderGeometryRaw(
+            self.renderer.renderer,
+            self.texture,
+            self.xy, 8,
+            self.colors_ptr, 4,
+            self.uv, 8,
+            self.count * 4,
+            self.indices, self.count * 6, 4
+        )
+        self.count = 0
+
+    def blit(self, texture: any, src_rect: any = None, dst_rect: any = None) -> None:
+        self.draw(texture, src_rect, dst_rect)
+
+    def blit_ex(
+            self, texture: any, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
+            center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False
+    ) -> None:
+        self.draw(texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical)
+
+    def draw(
+            self, texture: any, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
+            center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False,
+            color_mod: any = None, alpha_mod: float = None
+    ) -> None:
+        command_buffer = self.renderer.command_buffer
+        if command_buffer and command_buffer.recording and self is not command_buffer.batch:
+            return command_buffer.draw(
+                texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical, color_mod, alpha_mod
+            )
+        if not self.use_geometry:
+            return self.draw_fallback(
+                texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical, color_mod, alpha_mod
+            )
+        if texture.region:
+            src_rect = texture.map_rect(src_rect)
+        if texture.texture is not self.texture:
+            self.flush()
+            self.texture = texture.texture
+            self.tex_size = texture.get_page_size() if texture.region else texture.get_size()
+        elif self.count >= self.capacity:
+            self.flush()
+        tw, th = self.tex_size
+        if src_rect:
+            sw, sh = src_rect[2], src_rect[3]
+            u1, v1 = src_rect[0] / tw, src_rect[1] / th
+            u2, v2 = (src_rect[0] + sw) / tw, (src_rect[1] + sh) / th
+        else:
+            sw, sh = tw, th
+            u1, v1, u2, v2 = 0.0, 0.0, 1.0, 1.0
+        if flip_horizontal:
+            u1, u2 = u2, u1
+        if flip_vertical:
+            v1, v2 = v2, v1
+        if not dst_rect:
+            viewport = self.renderer.get_viewport()
+            x, y, w, h = 0.0, 0.0, viewport[2], viewport[3]
+        elif len(dst_rect) > 2:
+            x, y, w, h = dst_rect[0], dst_rect[1], dst_rect[2], dst_rect[3]
+        else:
+            x, y, w, h = dst_rect[0], dst_rect[1], sw, sh
+        i = self.count * 8
+        if angle:
+            cx, cy = (center[0], center[1]) if center else (w / 2, h / 2)
+            rad = math.radians(angle)
+            s, c = math.sin(rad), math.cos(rad)
+            x += cx
+            y += cy
+            min_x, min_y, max_x, max_y = -cx, -cy, w - cx, h - cy
+            self.xy[i:i + 8] = (
+                x + c * min_x - s * min_y, y + s * min_x + c * min_y,
+                x + c * max_x - s * min_y, y + s * max_x + c * min_y,
+                x + c * max_x - s * max_y, y + s * max_x + c * max_y,
+                x + c * min_x - s * max_y, y + s * min_x + c * max_y
+            )
+        else:
+            self.xy[i:i + 8] = (x, y, x + w, y, x + w, y + h, x, y + h)
+        self.uv[i:i + 8] = (u1, v1, u2, v1, u2, v2, u1, v2)
+        color_mod = color_mod or texture.color_mod
+        j = self.count * 16
+        self.colors[j:j + 16] = (
+            int(color_mod[0]), int(color_mod[1]), int(color_mod[2]),
+            int(texture.alpha_mod if alpha_mod is None else alpha_mod)
+        ) * 4
+        self.count += 1
+
+    def draw_fallback(
+            self, texture: any, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
+            center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False,
+            color_mod: any = None, alpha_mod: float = None
+    ) -> None:
+        if src_rect and dst_rect and len(dst_rect) < 3:
+            dst_rect = (dst_rect[0], dst_rect[1], src_rect[2], src_rect[3])
+        bak_color_mod, bak_alpha_mod = texture.color_mod, texture.alpha_mod
+        if color_mod:
+            SDL_SetTextureColorMod(texture.texture, int(color_mod[0]), int(color_mod[1]), int(color_mod[2]))
+        if alpha_mod is not None:
+            SDL_SetTextureAlphaMod(texture.texture, int(alpha_mod))
+        command_buffer = self.renderer.command_buffer
+        blit_ex = command_buffer.original_methods['blit_ex'] if command_buffer and command_buffer.recording else\
+            self.renderer.blit_ex
+        blit_ex(texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical)
+        if color_mod:
+            SDL_SetTextureColorMod(texture.texture, bak_color_mod[0], bak_color_mod[1], bak_color_mod[2])
+        if alpha_mod is not None:
+            SDL_SetTextureAlphaMod(texture.texture, bak_alpha_mod)
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.count = 0
+        self.texture = None
+        del self.renderer
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
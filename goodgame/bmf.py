@@ -1,4 +1,16 @@
+import os
+import re
+import sys
+import struct
+import marshal
+from collections import OrderedDict
+from xml.etree import ElementTree
 from .texture import Texture
+from .atlas import TextureRegion
+
+attribute_re = re.compile(r'(\w+)=(?:"(.*?)"(?=\s|$)|(\S*))')
+number_re = re.compile(r'-?\d+$')
+cache_version = 1
 
 
 class BMChar:
@@ -12,17 +24,16 @@ class BMChar:
         self.x_adv = data['xadvance']
         self.page = data['page']
         self.channel = data['chnl']
-        self.letter = data['letter']
+        self.letter = data.get('letter') or self.chr
         if not self.size[0] or not self.size[1]:
             self.texture = None
             return
-        self.texture = renderer.crop_texture(page, (
+        self.texture = TextureRegion(page, (
             self.pos[0],
             self.pos[1],
             self.size[0],
             self.size[1]
         ))
-        self.texture.set_blend_mode('blend')
         self.destroyed = False
 
     def __add__(self, other: any) -> int:
@@ -48,7 +59,7 @@ class BMChar:
 
 
 class BMFont:
-    def __init__(self, renderer: any, data: str, files: dict = None) -> None:
+    def __init__(self, renderer: any, data: str, files: dict = None, layout_cache_size: int = 256) -> None:
         self.destroyed = True
         self.renderer = renderer
         self.format = self.renderer.pixel_format_from_str('rgba8888')
@@ -60,57 +71,141 @@ class BMFont:
         self.num_chars = 0
         self.num_kernings = 0
         self.chars = {}
+        self.kernings = {}
+        self.layouts = OrderedDict()
+        self.layout_cache_size = layout_cache_size
         self.data = self.parse()
         self.parse_data()
         self.destroyed = False
         # TODO:
         #  render lines (including split by width, wrap align, etc)
 
-    def render(self, line: str) -> Texture:
-        chars = [self.chars.get(char_str) or self.chars['?'] for char_str in line]
-        tex: Texture = self.renderer.create_texture(
-            (sum(chars) + chars[-1].size[0] - chars[-1].x_adv, self.common['lineHeight']),
-            self.format
-        )
-        self.renderer.set_target(tex)
-        self.renderer.clear((0, 0, 0, 0))
-        cur_x = 0
-        for char in chars:
-            char.texture and self.renderer.blit(char.texture, dst_rect=(cur_x + char.offset[0], char.offset[1]))
-            cur_x += char.x_adv
-        self.renderer.set_target(None)
-        return tex
+    def get_char(self, char_str: str) -> BMChar:
+        return self.chars.get(char_str) or self.chars['?']
 
-    def render_lines(self, lines: str, y_offset: float = 0, wrap_align: str = 'left') -> Texture:
-        num_lines = lines.count('\n') + 1
-        lines_spl = lines.split('\n')
-        chars = [[self.chars.get(char_str) or self.chars['?'] for char_str in line] for line in lines_spl]
-        widths = [sum(chars[i]) + chars[i][-1].size[0] - chars[i][-1].x_adv for i in range(num_lines)]
-        width = max(widths)
-        tex: Texture = self.renderer.create_texture(
-            (width, self.common['lineHeight'] * num_lines),
-            self.format
-        )
-        self.renderer.set_target(tex)
-        self.renderer.clear((0, 0, 0, 0))
+    def layout(self, text: str, y_offset: float = 0, wrap_align: str = 'left') -> tuple:
+        key = (text, y_offset, wrap_align)
+        layout = self.layouts.get(key)
+        if layout:
+            self.layouts.move_to_end(key)
+            return layout
+        kernings = self.kernings
+        line_height = self.common['lineHeight']
+        lines = []
+        for line in text.split('\n'):
+            glyphs = []
+            cur_x = 0
+            prev_char = None
+            for char_str in line:
+                char = self.get_char(char_str)
+                if prev_char and kernings:
+                    cur_x += kernings.get(prev_char + char_str, 0)
+                char.texture and glyphs.append((char.texture, cur_x + char.offset[0], char.offset[1]))
+                cur_x += char.x_adv
+                prev_char = char_str
+            lines.append((cur_x + char.size[0] - char.x_adv if line else 0, glyphs))
+        width = max(line[0] for line in lines)
+        placed = []
         cur_y = 0
-        for i in range(num_lines):
+        for line_width, glyphs in lines:
             if wrap_align == 'right':
-                cur_x = width - widths[i]
+                cur_x = width - line_width
             elif wrap_align == 'center':
-                cur_x = width / 2 - widths[i] / 2
+                cur_x = width / 2 - line_width / 2
             else:
                 cur_x = 0
-            for char in chars[i]:
-                char.texture and self.renderer.blit(
-                    char.texture,
-                    dst_rect=(cur_x + char.offset[0], cur_y + char.offset[1])
-                )
-                cur_x += char.x_adv
-            cur_y += self.common['lineHeight'] + y_offset
-        self.renderer.set_target(None)
+            placed.extend((region, cur_x + x, cur_y + y) for region, x, y in glyphs)
+            cur_y += line_height + y_offset
+        layout = self.layouts[key] = (width, line_height * len(lines), tuple(placed))
+        if len(self.layouts) > self.layout_cache_size:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def measure(self, text: str, y_offset: float = 0) -> tuple:
+        layout = self.layout(text, y_offset)
+        return layout[0], layout[1]
+
+    def draw(
+            self, text: str, pos: any, color: any = None, scale: float = 1.0, y_offset: float = 0,
+            wrap_align: str = 'left'
+    ) -> None:
+        glyphs = self.layout(text, y_offset, wrap_align)[2]
+        own_batch = not (self.renderer.batch and self.renderer.batch.drawing)
+        batch = self.renderer.begin_batch() if own_batch else self.renderer.batch
+        color_mod = color and (color[0], color[1], color[2])
+        alpha_mod = color[3] if color and len(color) > 3 else None
+        x, y = pos[0], pos[1]
+        for region, glyph_x, glyph_y in glyphs:
+            batch.draw(
+                region, dst_rect=(x + glyph_x * scale, y + glyph_y * scale, region.w * scale, region.h * scale),
+                color_mod=color_mod, alpha_mod=alpha_mod
+            )
+        own_batch and self.renderer.end_batch()
+
+    def render(self, line: str) -> Texture:
+        return self.render_lines(line)
+
+    def render_lines(self, lines: str, y_offset: float = 0, wrap_align: str = 'left') -> Texture:
+        width, height, glyphs = self.layout(lines, y_offset, wrap_align)
+        tex: Texture = self.renderer.create_texture((max(width, 1), height), self.format)
+        bak_target = self.renderer.target
+        batch = self.renderer.batch
+        drawing = batch and batch.drawing
+        drawing and batch.flush()
+        self.renderer.set_target(tex)
+        self.renderer.clear((0, 0, 0, 0))
+        self.draw(lines, (0, 0), y_offset=y_offset, wrap_align=wrap_align)
+        drawing and batch.flush()
+        self.renderer.set_target(bak_target)
         return tex
 
+    @staticmethod
+    def from_file(
+            renderer: any, path: str, files: dict = None, cache: bool = False, layout_cache_size: int = 256
+    ) -> any:
+        data = BMFont.load_cache(path) if cache else None
+        if data is None:
+            with open(path, 'rb') as f:
+                data = BMFont.parse_bytes(f.read(), renderer.app.encoding)
+            cache and BMFont.save_cache(path, data)
+        if files is None:
+            files = {}
+            for name, values in data:
+                if name == 'page' and values['file'] not in files:
+                    files[values['file']] = renderer.texture_from_file(
+                        os.path.join(os.path.dirname(path), values['file'])
+                    )
+        return BMFont(renderer, data, files, layout_cache_size)
+
+    @staticmethod
+    def get_cache_path(path: str) -> str:
+        return path + '.cache'
+
+    @staticmethod
+    def get_cache_key(path: str) -> tuple:
+        stat = os.stat(path)
+        return cache_version, stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def load_cache(path: str) -> any:
+        try:
+            with open(BMFont.get_cache_path(path), 'rb') as f:
+                key, data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not tuple(key) == BMFont.get_cache_key(path):
+            return None
+        return data
+
+    @staticmethod
+    def save_cache(path: str, data: list) -> bool:
+        try:
+            with open(BMFont.get_cache_path(path), 'wb') as f:
+                marshal.dump((BMFont.get_cache_key(path), data), f)
+        except OSError:
+            return False
+        return True
+
     def parse_data(self) -> None:
         for data in self.data:
             if data[0] == 'info':
@@ -123,42 +218,128 @@ class BMFont:
                 self.num_chars = data[1]['count']
             elif data[0] == 'char':
                 bm_char = BMChar(self.renderer, data[1], self.pages[data[1]['page']])
-                if bm_char.letter == 'space':
+                if bm_char.letter == 'space' or bm_char.letter == ' ':
                     self.chars[' '] = bm_char
                     if not self.chars.get('\n'):
-                        data[1]['letter'] = '\n'
-                        self.chars['\n'] = BMChar(self.renderer, data[1], self.pages[data[1]['page']])
+                        self.chars['\n'] = BMChar(
+                            self.renderer, dict(data[1], letter='\n'), self.pages[data[1]['page']]
+                        )
                 else:
                     self.chars[bm_char.letter] = bm_char
             elif data[0] == 'kernings':
                 self.num_kernings = data[1]['count']
+            elif data[0] == 'kerning':
+                self.kernings[chr(data[1]['first']) + chr(data[1]['second'])] = data[1]['amount']
 
     def parse(self) -> list:
-        data_spl = self.raw_data.split('\n')
+        if isinstance(self.raw_data, list):
+            return self.raw_data
+        if isinstance(self.raw_data, (bytes, bytearray)):
+            return self.parse_bytes(self.raw_data, self.renderer.app.encoding)
+        return self.parse_str(self.raw_data)
+
+    @staticmethod
+    def parse_bytes(data: bytes, encoding: str = 'utf-8') -> list:
+        if data[:3] == b'BMF':
+            return BMFont.parse_binary(data)
+        return BMFont.parse_str(data.decode(encoding, errors='replace'))
+
+    @staticmethod
+    def parse_str(data: str) -> list:
+        data = data.lstrip('\ufeff \t\r\n')
+        if data.startswith('<'):
+            return BMFont.parse_xml(data)
+        return BMFont.parse_text(data)
+
+    @staticmethod
+    def parse_text(data: str) -> list:
+        get_attribute = BMFont.get_attribute
+        findall = attribute_re.findall
         result = []
-        for line in data_spl:
-            if not line:
+        for line in data.splitlines():
+            name, _, attrs = line.strip().partition(' ')
+            if not name:
                 continue
-            line_spl = line.split(' ')
-            name = line_spl[0]
-            data = {}
-            for attr_str in line_spl[1:]:
-                if not attr_str:
+            values = {}
+            for attr_name, quoted, raw in findall(attrs):
+                attr_name = sys.intern(attr_name)
+                if not raw:
+                    values[attr_name] = quoted
                     continue
-                attr_spl = attr_str.split('=')
-                attr_name = attr_spl[0]
-                attr_value = self.get_attribute(attr_spl[1])
-                data[attr_name] = attr_value
-            result.append((name, data))
+                try:
+                    values[attr_name] = int(raw)
+                except ValueError:
+                    values[attr_name] = get_attribute(raw)
+            result.append((sys.intern(name), values))
+        return result
+
+    @staticmethod
+    def parse_xml(data: str) -> list:
+        get_attribute = BMFont.get_attribute
+        result = []
+        for element in ElementTree.fromstring(data).iter():
+            if element.tag in ('font', 'pages'):
+                continue
+            result.append((sys.intern(element.tag), {
+                sys.intern(name): value if name in ('face', 'charset', 'file', 'letter') else get_attribute(value)
+                for name, value in element.attrib.items()
+            }))
+        return result
+
+    @staticmethod
+    def parse_binary(data: bytes) -> list:
+        if not data[3] == 3:
+            raise RuntimeError(f'Unsupported binary BMFont version {data[3]}')
+        result = []
+        pos = 4
+        while pos + 5 <= len(data):
+            block_type, block_size = struct.unpack_from('<BI', data, pos)
+            pos += 5
+            block = data[pos:pos + block_size]
+            pos += block_size
+            if block_type == 1:
+                values = struct.unpack_from('<hBBHBBBBBBBB', block)
+                bit_field = values[1]
+                result.append(('info', {
+                    'face': block[14:].split(b'\0', 1)[0].decode('utf-8', errors='replace'),
+                    'size': values[0], 'bold': bit_field >> 4 & 1, 'italic': bit_field >> 5 & 1,
+                    'charset': values[2], 'unicode': bit_field >> 6 & 1, 'stretchH': values[3],
+                    'smooth': bit_field >> 7 & 1, 'aa': values[4], 'padding': list(values[5:9]),
+                    'spacing': list(values[9:11]), 'outline': values[11]
+                }))
+            elif block_type == 2:
+                values = struct.unpack_from('<HHHHHBBBBB', block)
+                result.append(('common', {
+                    'lineHeight': values[0], 'base': values[1], 'scaleW': values[2], 'scaleH': values[3],
+                    'pages': values[4], 'packed': values[5] & 1, 'alphaChnl': values[6], 'redChnl': values[7],
+                    'greenChnl': values[8], 'blueChnl': values[9]
+                }))
+            elif block_type == 3:
+                result.extend(
+                    ('page', {'id': i, 'file': name.decode('utf-8', errors='replace')})
+                    for i, name in enumerate(block.split(b'\0')[:-1])
+                )
+            elif block_type == 4:
+                result.append(('chars', {'count': block_size // 20}))
+                result.extend(('char', {
+                    'id': values[0], 'x': values[1], 'y': values[2], 'width': values[3], 'height': values[4],
+                    'xoffset': values[5], 'yoffset': values[6], 'xadvance': values[7], 'page': values[8],
+                    'chnl': values[9]
+                }) for values in struct.iter_unpack('<IHHHHhhhBB', block[:block_size // 20 * 20]))
+            elif block_type == 5:
+                result.append(('kernings', {'count': block_size // 10}))
+                result.extend(
+                    ('kerning', {'first': values[0], 'second': values[1], 'amount': values[2]})
+                    for values in struct.iter_unpack('<IIh', block[:block_size // 10 * 10])
+                )
         return result
 
-    def get_attribute(self, attr_val: str) -> any:
-        if attr_val.replace('-', '').isdigit():
+    @staticmethod
+    def get_attribute(attr_val: str) -> any:
+        if number_re.match(attr_val):
             return int(attr_val)
-        if attr_val.startswith('"') and attr_val.endswith('"'):
-            return attr_val[1:-1].replace('\\"', '"')
         if ',' in attr_val:
-            return [self.get_attribute(_x) for _x in attr_val.split(',')]
+            return [int(_x) if number_re.match(_x) else _x for _x in attr_val.split(',')]
         return attr_val
 
     def destroy(self) -> bool:
@@ -166,6 +347,7 @@ class BMFont:
             return True
         self.pages.clear()
         self.files.clear()
+        self.layouts.clear()
         del self.renderer
         self.destroyed = True
         return False
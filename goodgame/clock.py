@@ -1,34 +1,189 @@
+import heapq
+from array import array
+from collections import deque
 from sdl2 import *
 
 
 class Clock:
-    def __init__(self) -> None:
+    def __init__(
+            self, fps_limit: float = 0, pacing: bool = False, stats_size: int = 240, histogram_bin: float = 0.00025,
+            histogram_size: int = 400, stutter_threshold: float = 1 / 30
+    ) -> None:
         self.freq = SDL_GetPerformanceFrequency()
         self.delta = 0.0
         self.speed_hack = 1.0
         self.last_tick = 0
-        self.fps_limit = 0
+        self.fps_limit = fps_limit
+        self.pacing = pacing
+        self.next_frame = 0
+        self.sleep_margin = 0.002
+        self.jitter = 0.0
+        self.max_jitter = 0.0
+        self.frame_times = array('d', [0.0]) * max(stats_size, 1)
+        self.frame_index = 0
+        self.frame_count = 0
+        self.frame_serial = 0
+        self.frame_sum = 0.0
+        self.min_frames = deque()
+        self.max_frames = deque()
+        self.histogram_bin = histogram_bin
+        self.histogram = array('I', [0]) * (histogram_size + 1)
+        self.stutter_threshold = stutter_threshold
+        self.stutter_count = 0
 
     @staticmethod
     def get_time() -> float:
         return SDL_GetTicks64() / 1000
 
     def sleep(self, time: float) -> None:
-        wait_for = self.get_time() + time
-        while self.get_time() < wait_for:
+        self.sleep_until(SDL_GetPerformanceCounter() + int(time * self.freq))
+
+    def sleep_until(self, deadline: int) -> None:
+        now = SDL_GetPerformanceCounter()
+        remaining = (deadline - now) / self.freq
+        if remaining > self.sleep_margin:
+            requested_ms = int((remaining - self.sleep_margin) * 1000)
+            if requested_ms > 0:
+                SDL_Delay(requested_ms)
+                after = SDL_GetPerformanceCounter()
+                overshoot = (after - now) / self.freq - requested_ms / 1000 + 0.0005
+                if overshoot > self.sleep_margin:
+                    self.sleep_margin = min(overshoot, 0.02)
+                else:
+                    self.sleep_margin = max(self.sleep_margin * 0.95 + overshoot * 0.05, 0.0005)
+        while SDL_GetPerformanceCounter() < deadline:
             continue
+        late = (SDL_GetPerformanceCounter() - deadline) / self.freq
+        self.jitter = self.jitter * 0.9 + late * 0.1
+        self.max_jitter = max(self.max_jitter, late)
+
+    def wait_frame(self) -> None:
+        if not self.fps_limit:
+            return
+        frame_ticks = int(self.freq / self.fps_limit)
+        now = SDL_GetPerformanceCounter()
+        if not self.next_frame or now - self.next_frame > frame_ticks:
+            self.next_frame = now
+        elif now < self.next_frame:
+            self.sleep_until(self.next_frame)
+        self.next_frame += frame_ticks
 
     def reset(self) -> None:
         self.last_tick = SDL_GetPerformanceCounter()
+        self.next_frame = 0
+
+    def reset_jitter(self) -> None:
+        self.jitter = 0.0
+        self.max_jitter = 0.0
 
     def tick(self) -> bool:
+        if self.pacing:
+            self.wait_frame()
         now = SDL_GetPerformanceCounter()
-        if self.fps_limit and self.freq > self.fps_limit * (now - self.last_tick):
+        if not self.pacing and self.fps_limit and self.freq > self.fps_limit * (now - self.last_tick):
             return False
-        self.delta = (now - self.last_tick) / self.freq * self.speed_hack
+        frame_time = (now - self.last_tick) / self.freq
+        self.delta = frame_time * self.speed_hack
+        self.last_tick and self.add_frame_time(frame_time)
         self.last_tick = now
         return True
 
+    def get_histogram_index(self, frame_time: float) -> int:
+        return min(int(frame_time / self.histogram_bin), len(self.histogram) - 1)
+
+    def add_frame_time(self, frame_time: float) -> None:
+        frame_times = self.frame_times
+        index = self.frame_index
+        if self.frame_count == len(frame_times):
+            old = frame_times[index]
+            self.frame_sum -= old
+            self.histogram[self.get_histogram_index(old)] -= 1
+            if old > self.stutter_threshold:
+                self.stutter_count -= 1
+        else:
+            self.frame_count += 1
+        frame_times[index] = frame_time
+        self.frame_sum += frame_time
+        self.histogram[self.get_histogram_index(frame_time)] += 1
+        if frame_time > self.stutter_threshold:
+            self.stutter_count += 1
+        self.frame_index = (index + 1) % len(frame_times)
+        serial = self.frame_serial
+        self.frame_serial += 1
+        expired = serial - len(frame_times)
+        min_frames, max_frames = self.min_frames, self.max_frames
+        while min_frames and min_frames[-1][1] >= frame_time:
+            min_frames.pop()
+        min_frames.append((serial, frame_time))
+        if min_frames[0][0] <= expired:
+            min_frames.popleft()
+        while max_frames and max_frames[-1][1] <= frame_time:
+            max_frames.pop()
+        max_frames.append((serial, frame_time))
+        if max_frames[0][0] <= expired:
+            max_frames.popleft()
+
+    def reset_stats(self) -> None:
+        for i in range(len(self.frame_times)):
+            self.frame_times[i] = 0.0
+        for i in range(len(self.histogram)):
+            self.histogram[i] = 0
+        self.frame_index = 0
+        self.frame_count = 0
+        self.frame_serial = 0
+        self.frame_sum = 0.0
+        self.min_frames.clear()
+        self.max_frames.clear()
+        self.stutter_count = 0
+
+    def set_stutter_threshold(self, threshold: float) -> None:
+        self.stutter_threshold = threshold
+        self.stutter_count = sum(1 for frame_time in self.get_frame_times() if frame_time > threshold)
+
+    def get_frame_times(self) -> memoryview:
+        return memoryview(self.frame_times)[:self.frame_count]
+
+    def get_average_frame_time(self) -> float:
+        return self.frame_sum / self.frame_count if self.frame_count else 0.0
+
+    def get_average_fps(self) -> float:
+        return self.frame_count / self.frame_sum if self.frame_sum > 0 else 0.0
+
+    def get_min_frame_time(self) -> float:
+        return self.min_frames[0][1] if self.frame_count else 0.0
+
+    def get_max_frame_time(self) -> float:
+        return self.max_frames[0][1] if self.frame_count else 0.0
+
+    def get_percentile(self, percentile: float) -> float:
+        if not self.frame_count:
+            return 0.0
+        target = max(percentile / 100 * self.frame_count, 1)
+        total = 0
+        for i, count in enumerate(self.histogram):
+            total += count
+            if total >= target:
+                break
+        max_frame_time = self.get_max_frame_time()
+        if i == len(self.histogram) - 1:
+            return max_frame_time
+        return min(max((i + 0.5) * self.histogram_bin, self.get_min_frame_time()), max_frame_time)
+
+    def get_p50(self) -> float:
+        return self.get_percentile(50)
+
+    def get_p95(self) -> float:
+        return self.get_percentile(95)
+
+    def get_p99(self) -> float:
+        return self.get_percentile(99)
+
+    def get_stutter_count(self) -> int:
+        return self.stutter_count
+
+    def get_histogram(self) -> array:
+        return self.histogram
+
     def get_fps(self) -> int:
         try:
             return int(self.speed_hack / self.delta)
@@ -48,7 +203,8 @@ class Timer:
             duration: float,
             repeat: bool = True,
             enabled: bool = False,
-            smooth: bool = False
+            smooth: bool = False,
+            callback: any = None
     ) -> None:
         self.duration = duration
         self.repeat = repeat
@@ -56,33 +212,49 @@ class Timer:
         self.counter = 0.0
         self.triggered = 0
         self.smooth = smooth
+        self.callback = callback
+        self.scheduler = None
 
     def reset(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.triggered = 0
         self.counter = 0.0
+        self.scheduler and self.scheduler.schedule(self)
 
     def run(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.enabled = True
+        self.scheduler and self.scheduler.schedule(self)
 
     def pause(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.enabled = False
 
     def stop(self) -> None:
         self.pause()
         self.reset()
 
+    def trigger(self) -> None:
+        self.triggered += 1
+        self.callback and self.callback(self)
+
+    def get_counter(self) -> float:
+        return self.scheduler.get_counter(self) if self.scheduler else self.counter
+
     def tick(self, dt: float) -> None:
         if not self.enabled:
             return
         self.counter += dt
-        if self.smooth:
-            if self.counter >= self.duration:
-                self.counter -= self.duration
-                self.triggered += 1
-            return
-        while self.counter >= self.duration:
+        while self.enabled and self.counter >= self.duration:
+            if not self.repeat or self.duration <= 0:
+                self.enabled = False
+                self.counter = 0.0
+                self.trigger()
+                return
             self.counter -= self.duration
-            self.triggered += 1
+            self.trigger()
+            if self.smooth:
+                return
 
 
 class Animation:
@@ -90,19 +262,23 @@ class Animation:
             self,
             duration: float = 0.0,
             repeat: bool = False,
-            enabled: bool = False
+            enabled: bool = False,
+            callback: any = None
     ) -> None:
         self.duration = duration
         self.repeat = repeat
         self.enabled = enabled
         self.counter = 0.0
         self.value: any = None
+        self.callback = callback
+        self.scheduler = None
 
     def reset(self) -> None:
         self.counter = 0.0
 
     def run(self) -> None:
         self.enabled = True
+        self.scheduler and self.scheduler.schedule(self)
 
     def stop(self) -> None:
         self.pause()
@@ -110,6 +286,7 @@ class Animation:
 
     def pause(self) -> None:
         self.enabled = False
+        self.scheduler and self.scheduler.unschedule(self)
 
     def tick(self, dt: float) -> None:
         if not self.enabled:
@@ -118,9 +295,12 @@ class Animation:
         if self.duration and self.counter >= self.duration:
             if self.repeat:
                 self.counter -= self.duration
+                self.callback and self.callback(self)
             else:
                 self.value = self.calc(self.duration)
-                return self.stop()
+                self.stop()
+                self.callback and self.callback(self)
+                return
         self.value = self.calc(self.counter)
 
     @staticmethod
@@ -134,34 +314,159 @@ class Counter:
             duration: float,
             repeat: bool = True,
             enabled: bool = False,
-            smooth: bool = False
+            smooth: bool = False,
+            callback: any = None
     ) -> None:
         self.duration = duration
         self.repeat = repeat
         self.enabled = enabled
         self.counter = 0.0
         self.smooth = smooth
+        self.callback = callback
+        self.scheduler = None
 
     def reset(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.counter = 0.0
+        self.scheduler and self.scheduler.schedule(self)
 
     def run(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.enabled = True
+        self.scheduler and self.scheduler.schedule(self)
 
     def pause(self) -> None:
+        self.scheduler and self.scheduler.unschedule(self)
         self.enabled = False
 
     def stop(self) -> None:
         self.pause()
         self.reset()
 
+    def trigger(self) -> None:
+        self.callback and self.callback(self)
+
+    def get_counter(self) -> float:
+        return self.scheduler.get_counter(self) if self.scheduler else self.counter
+
     def tick(self, dt: float) -> None:
         if not self.enabled:
             return
         self.counter += dt
-        if self.smooth:
-            if self.counter >= self.duration:
-                self.counter -= self.duration
-            return
-        while self.counter >= self.duration:
+        while self.enabled and self.counter >= self.duration:
+            if not self.repeat or self.duration <= 0:
+                self.enabled = False
+                self.counter = 0.0
+                self.trigger()
+                return
             self.counter -= self.duration
+            self.trigger()
+            if self.smooth:
+                return
+
+
+class Scheduler:
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.queue = []
+        self.sequence = 0
+        self.entries = {}
+        self.animations = {}
+
+    def add(self, handle: any) -> any:
+        if handle.scheduler is not None:
+            handle.scheduler.remove(handle)
+        handle.scheduler = self
+        self.schedule(handle)
+        return handle
+
+    def remove(self, handle: any) -> None:
+        if not handle.scheduler == self:
+            return
+        self.unschedule(handle)
+        handle.scheduler = None
+
+    def call_later(self, delay: float, callback: any, repeat: bool = False) -> Timer:
+        return self.add(Timer(delay, repeat=repeat, enabled=True, callback=callback))
+
+    def cancel(self, handle: any) -> None:
+        handle.pause()
+        self.remove(handle)
+
+    def schedule(self, handle: any) -> None:
+        if not handle.enabled or handle in self.entries:
+            return
+        if isinstance(handle, Animation):
+            self.animations[handle] = None
+            return
+        self.push(handle, self.time + max(handle.duration - handle.counter, 0.0))
+
+    def push(self, handle: any, deadline: float) -> None:
+        entry = [deadline, self.sequence, handle]
+        self.sequence += 1
+        self.entries[handle] = entry
+        heapq.heappush(self.queue, entry)
+
+    def get_counter(self, handle: any) -> float:
+        entry = self.entries.get(handle)
+        if entry is None:
+            return handle.counter
+        return max(handle.duration - (entry[0] - self.time), 0.0)
+
+    def unschedule(self, handle: any) -> None:
+        self.animations.pop(handle, None)
+        handle.counter = self.get_counter(handle)
+        entry = self.entries.pop(handle, None)
+        if entry is None:
+            return
+        entry[2] = None
+
+    def tick(self, dt: float) -> int:
+        self.time += dt
+        now = self.time
+        queue = self.queue
+        entries = self.entries
+        deferred = []
+        fired = 0
+        while queue and queue[0][0] <= now:
+            entry = heapq.heappop(queue)
+            handle = entry[2]
+            if handle is None:
+                continue
+            del entries[handle]
+            deadline = entry[0]
+            if handle.repeat and handle.duration > 0:
+                deadline += handle.duration
+                if handle.smooth and deadline <= now:
+                    deferred.append((handle, deadline))
+                else:
+                    self.push(handle, deadline)
+                handle.counter = max(handle.duration - (deadline - now), 0.0)
+            else:
+                handle.enabled = False
+                handle.counter = 0.0
+            handle.trigger()
+            fired += 1
+        for handle, deadline in deferred:
+            if handle.enabled and handle not in entries:
+                self.push(handle, deadline)
+        if self.animations:
+            for animation in tuple(self.animations):
+                animation.tick(dt)
+        if len(queue) > 64 and len(queue) > len(entries) * 2:
+            self.compact()
+        return fired
+
+    def compact(self) -> None:
+        self.queue = [entry for entry in self.queue if entry[2] is not None]
+        heapq.heapify(self.queue)
+
+    def clear(self) -> None:
+        for handle in tuple(self.entries) + tuple(self.animations):
+            handle.scheduler = None
+        self.queue.clear()
+        self.entries.clear()
+        self.animations.clear()
+
+    def get_count(self) -> int:
+        return len(self.entries) + len(self.animations)
@@ -0,0 +1,294 @@
+import contextlib
+from .batch import SpriteBatch
+from sdl2 import *
+
+try:
+    import numpy
+except:  # noqa
+    numpy = None
+
+CMD_CALL = 0
+CMD_CLEAR = 1
+CMD_BLIT = 2
+CMD_FILL_RECT = 3
+CMD_DRAW_RECT = 4
+CMD_POINT = 5
+CMD_LINE = 6
+
+recorded_methods = (
+    'blit', 'blit_ex', 'draw_point', 'draw_points', 'sdl_fill_rect', 'sdl_fill_rects', 'sdl_draw_rect',
+    'sdl_draw_rects', 'sdl_draw_line', 'sdl_draw_lines', 'clear'
+)
+barrier_methods = (
+    'set_target', 'set_scale', 'set_clip_rect', 'set_viewport', 'set_logical_size', 'set_integer_scale',
+    'set_blend_mode', 'draw_points_array', 'draw_rects_array', 'fill_rects_array', 'draw_lines_array',
+    'draw_bezier', 'draw_polygon', 'draw_textured_polygon', 'fill_polygon', 'draw_trigon',
+    'fill_trigon', 'fill_pie', 'fill_pie_tl', 'draw_pie', 'draw_pie_tl', 'draw_arc', 'draw_arc_tl', 'fill_circle',
+    'fill_circle_tl', 'draw_circle_tl', 'draw_circle', 'draw_ellipse', 'draw_ellipse_tl', 'fill_ellipse',
+    'fill_ellipse_tl', 'gfx_draw_rounded_rect', 'gfx_fill_rounded_rect', 'gfx_draw_line', 'gfx_draw_thick_line'
+)
+
+
+class CommandBuffer:
+    def __init__(self, renderer: any, sort: bool = False) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.sort = sort
+        self.commands = []
+        self.batch = SpriteBatch(renderer)
+        self.saved_methods = {}
+        self.original_methods = {}
+        self.calls = 0
+        self.recorded = 0
+        self.draw_color = None
+        self.recording = False
+        self.destroyed = False
+
+    def install(self) -> None:
+        renderer_dict = self.renderer.__dict__
+        for name in recorded_methods + barrier_methods:
+            self.saved_methods[name] = renderer_dict.get(name)
+            self.original_methods[name] = getattr(self.renderer, name)
+        for name in recorded_methods:
+            setattr(self.renderer, name, getattr(self, name))
+        for name in barrier_methods:
+            setattr(self.renderer, name, self.make_barrier(self.original_methods[name]))
+        self.renderer.set_target = self.set_target
+        self.recording = True
+
+    def uninstall(self) -> None:
+        for name, method in self.saved_methods.items():
+            if method is None:
+                delattr(self.renderer, name)
+            else:
+                setattr(self.renderer, name, method)
+        self.saved_methods.clear()
+        self.original_methods.clear()
+        self.recording = False
+
+    @contextlib.contextmanager
+    def paused(self) -> any:
+        if not self.recording:
+            yield
+            return
+        self.flush()
+        self.uninstall()
+        try:
+            yield
+        finally:
+            self.install()
+
+    @staticmethod
+    def copy_arg(arg: any) -> any:
+        if numpy is not None and isinstance(arg, numpy.ndarray):
+            return arg.copy()
+        if isinstance(arg, (list, bytearray)):
+            return arg.copy()
+        return arg
+
+    def make_barrier(self, func: any) -> any:
+        copy_arg = self.copy_arg
+
+        def barrier(*args: any, **kwargs: any) -> None:
+            self.commands.append((CMD_CALL, None, (
+                func, tuple(copy_arg(arg) for arg in args), {key: copy_arg(arg) for key, arg in kwargs.items()}
+            )))
+        return barrier
+
+    def set_target(self, target: any = None) -> None:
+        self.renderer.target = target
+        self.commands.append((CMD_CALL, None, (self.original_methods['set_target'], (target, ), {})))
+
+    @staticmethod
+    def color_key(color: any) -> tuple:
+        if len(color) > 3:
+            return int(color[0]), int(color[1]), int(color[2]), int(color[3])
+        return int(color[0]), int(color[1]), int(color[2]), 255
+
+    def blit(self, texture: any, src_rect: any = None, dst_rect: any = None) -> None:
+        self.commands.append((CMD_BLIT, texture.texture, (
+            texture, src_rect, dst_rect, 0.0, None, False, False, texture.color_mod, texture.alpha_mod
+        )))
+
+    def blit_ex(
+            self, texture: any, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
+            center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False
+    ) -> None:
+        self.commands.append((CMD_BLIT, texture.texture, (
+            texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical,
+            texture.color_mod, texture.alpha_mod
+        )))
+
+    def draw(
+            self, texture: any, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
+            center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False,
+            color_mod: any = None, alpha_mod: float = None
+    ) -> None:
+        self.commands.append((CMD_BLIT, texture.texture, (
+            texture, src_rect, dst_rect, angle, center, flip_horizontal, flip_vertical,
+            color_mod or texture.color_mod, texture.alpha_mod if alpha_mod is None else alpha_mod
+        )))
+
+    def clear(self, color: any = (0, 0, 0, 255)) -> None:
+        self.commands.append((CMD_CLEAR, self.color_key(color), None))
+
+    def draw_point(self, color: any, point: any) -> None:
+        self.commands.append((CMD_POINT, self.color_key(color), (point[0], point[1])))
+
+    def draw_points(self, color: any, points: any) -> None:
+        color = self.color_key(color)
+        self.commands.extend((CMD_POINT, color, (point[0], point[1])) for point in points)
+
+    def sdl_fill_rect(self, color: any, fill_rect: any = None) -> None:
+        if not fill_rect:
+            return self.commands.append((CMD_CALL, None, (self.original_methods['sdl_fill_rect'], (color, ), {})))
+        self.commands.append((CMD_FILL_RECT, self.color_key(color), fill_rect))
+
+    def sdl_fill_rects(self, color: any, fill_rects: any) -> None:
+        color = self.color_key(color)
+        self.commands.extend((CMD_FILL_RECT, color, fill_rect) for fill_rect in fill_rects)
+
+    def sdl_draw_rect(self, color: any, draw_rect: any = None) -> None:
+        if not draw_rect:
+            return self.commands.append((CMD_CALL, None, (self.original_methods['sdl_draw_rect'], (color, ), {})))
+        self.commands.append((CMD_DRAW_RECT, self.color_key(color), draw_rect))
+
+    def sdl_draw_rects(self, color: any, draw_rects: any) -> None:
+        color = self.color_key(color)
+        self.commands.extend((CMD_DRAW_RECT, color, draw_rect) for draw_rect in draw_rects)
+
+    def sdl_draw_line(self, color: any, start: any, end: any) -> None:
+        self.commands.append((CMD_LINE, self.color_key(color), (start[0], start[1], end[0], end[1])))
+
+    def sdl_draw_lines(self, color: any, points: any) -> None:
+        color = self.color_key(color)
+        self.commands.extend(
+            (CMD_LINE, color, (points[i - 1][0], points[i - 1][1], points[i][0], points[i][1]))
+            for i in range(1, len(points))
+        )
+
+    def sort_commands(self) -> None:
+        result = []
+        run = []
+        for command in self.commands:
+            if command[0] <= CMD_CLEAR or run and not run[0][0] == command[0]:
+                result.extend(sorted(run, key=self.sort_key))
+                run = []
+            if command[0] <= CMD_CLEAR:
+                result.append(command)
+            else:
+                run.append(command)
+        result.extend(sorted(run, key=self.sort_key))
+        self.commands = result
+
+    @staticmethod
+    def sort_key(command: tuple) -> tuple:
+        if command[0] == CMD_BLIT:
+            return id(command[1]), command[2][0].blend_mode
+        return command[1]
+
+    def set_draw_color(self, color: tuple) -> None:
+        if color == self.draw_color:
+            return
+        renderer = self.renderer.renderer
+        SDL_SetRenderDrawColor(renderer, color[0], color[1], color[2], color[3])
+        self.calls += 1
+        if not self.draw_color or (self.draw_color[3] >= 255) != (color[3] >= 255):
+            SDL_SetRenderDrawBlendMode(renderer, SDL_BLENDMODE_NONE if color[3] >= 255 else SDL_BLENDMODE_BLEND)
+            self.calls += 1
+        self.draw_color = color
+
+    def flush(self) -> None:
+        if not self.commands:
+            return
+        if self.sort:
+            self.sort_commands()
+        commands = self.commands
+        self.commands = []
+        self.recorded = len(commands)
+        self.calls = 0
+        self.draw_color = None
+        renderer = self.renderer.renderer
+        use_float = not self.renderer.force_int
+        batch = self.batch
+        i = 0
+        count = len(commands)
+        while i < count:
+            kind, key, data = commands[i]
+            if kind == CMD_BLIT:
+                batch.draw(data[0], data[1], data[2], data[3], data[4], data[5], data[6], data[7], data[8])
+                i += 1
+                continue
+            if batch.count:
+                batch.flush()
+                self.calls += 1
+            if kind == CMD_CALL:
+                data[0](*data[1], **data[2])
+                self.draw_color = None
+                self.calls += 1
+                i += 1
+                continue
+            self.set_draw_color(key)
+            if kind == CMD_CLEAR:
+                SDL_RenderClear(renderer)
+                self.calls += 1
+                i += 1
+                continue
+            j = i + 1
+            while j < count and commands[j][0] == kind and commands[j][1] == key:
+                j += 1
+            run = [command[2] for command in commands[i:j]]
+            if kind == CMD_LINE:
+                for line in run:
+                    if use_float:
+                        SDL_RenderDrawLineF(renderer, line[0], line[1], line[2], line[3])
+                    else:
+                        SDL_RenderDrawLine(renderer, int(line[0]), int(line[1]), int(line[2]), int(line[3]))
+                self.calls += len(run)
+            elif kind == CMD_POINT:
+                if use_float:
+                    SDL_RenderDrawPointsF(
+                        renderer, (SDL_FPoint * len(run))(*(SDL_FPoint(point[0], point[1]) for point in run)),
+                        len(run)
+                    )
+                else:
+                    SDL_RenderDrawPoints(
+                        renderer,
+                        (SDL_Point * len(run))(*(SDL_Point(int(point[0]), int(point[1])) for point in run)),
+                        len(run)
+                    )
+                self.calls += 1
+            else:
+                if use_float:
+                    rects = (SDL_FRect * len(run))(*(SDL_FRect(rect[0], rect[1], rect[2], rect[3]) for rect in run))
+                    (SDL_RenderFillRectsF if kind == CMD_FILL_RECT else SDL_RenderDrawRectsF)(
+                        renderer, rects, len(run)
+                    )
+                else:
+                    rects = (SDL_Rect * len(run))(*(
+                        SDL_Rect(int(rect[0]), int(rect[1]), int(rect[2]), int(rect[3])) for rect in run
+                    ))
+                    (SDL_RenderFillRects if kind == CMD_FILL_RECT else SDL_RenderDrawRects)(
+                        renderer, rects, len(run)
+                    )
+                self.calls += 1
+            i = j
+        if batch.count:
+            batch.flush()
+            self.calls += 1
+
+    def clear_commands(self) -> None:
+        self.commands.clear()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.commands.clear()
+        self.saved_methods.clear()
+        self.batch.destroy()
+        del self.renderer
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
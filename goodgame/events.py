@@ -1,3 +1,4 @@
+import ctypes
 from sdl2 import *
 from .video import Display
 
@@ -9,7 +10,145 @@ except NameError:
 default_window_id = [1]
 
 
+def has_field(struct: any, field_name: str) -> bool:
+    return any(field[0] == field_name for field in struct._fields_)
+
+
+drop_has_window_id = has_field(SDL_DropEvent, 'windowID')
+finger_has_window_id = has_field(SDL_TouchFingerEvent, 'windowID')
+sensor_has_timestamp_us = has_field(SDL_ControllerSensorEvent, 'timestamp_us')
+joystick_power_map = {
+    SDL_JOYSTICK_POWER_UNKNOWN: 'unknown',
+    SDL_JOYSTICK_POWER_EMPTY: 'empty',
+    SDL_JOYSTICK_POWER_LOW: 'low',
+    SDL_JOYSTICK_POWER_MEDIUM: 'medium',
+    SDL_JOYSTICK_POWER_FULL: 'full',
+    SDL_JOYSTICK_POWER_WIRED: 'wired',
+    SDL_JOYSTICK_POWER_MAX: 'max'
+}
+hat_state_map = {
+    SDL_HAT_CENTERED: 'centered',
+    SDL_HAT_UP: 'up',
+    SDL_HAT_RIGHT: 'right',
+    SDL_HAT_DOWN: 'down',
+    SDL_HAT_LEFT: 'left',
+    SDL_HAT_RIGHTUP: 'right_up',
+    SDL_HAT_RIGHTDOWN: 'right_down',
+    SDL_HAT_LEFTUP: 'left_up',
+    SDL_HAT_LEFTDOWN: 'left_down'
+}
+controller_axis_map = {
+    SDL_CONTROLLER_AXIS_INVALID: 'invalid',
+    SDL_CONTROLLER_AXIS_LEFTX: 'left_x',
+    SDL_CONTROLLER_AXIS_LEFTY: 'left_y',
+    SDL_CONTROLLER_AXIS_RIGHTX: 'right_x',
+    SDL_CONTROLLER_AXIS_RIGHTY: 'right_y',
+    SDL_CONTROLLER_AXIS_TRIGGERLEFT: 'trigger_left',
+    SDL_CONTROLLER_AXIS_TRIGGERRIGHT: 'trigger_right',
+    SDL_CONTROLLER_AXIS_MAX: 'max'
+}
+controller_button_map = {
+    SDL_CONTROLLER_BUTTON_INVALID: 'invalid',
+    SDL_CONTROLLER_BUTTON_A: 'a',
+    SDL_CONTROLLER_BUTTON_B: 'b',
+    SDL_CONTROLLER_BUTTON_X: 'x',
+    SDL_CONTROLLER_BUTTON_Y: 'y',
+    SDL_CONTROLLER_BUTTON_BACK: 'back',
+    SDL_CONTROLLER_BUTTON_GUIDE: 'guide',
+    SDL_CONTROLLER_BUTTON_START: 'start',
+    SDL_CONTROLLER_BUTTON_LEFTSTICK: 'left_stick',
+    SDL_CONTROLLER_BUTTON_RIGHTSTICK: 'right_stick',
+    SDL_CONTROLLER_BUTTON_LEFTSHOULDER: 'left_shoulder',
+    SDL_CONTROLLER_BUTTON_RIGHTSHOULDER: 'right_shoulder',
+    SDL_CONTROLLER_BUTTON_DPAD_UP: 'd_pad_up',
+    SDL_CONTROLLER_BUTTON_DPAD_DOWN: 'd_pad_down',
+    SDL_CONTROLLER_BUTTON_DPAD_LEFT: 'd_pad_left',
+    SDL_CONTROLLER_BUTTON_DPAD_RIGHT: 'd_pad_right',
+    SDL_CONTROLLER_BUTTON_MISC1: 'misc1',
+    SDL_CONTROLLER_BUTTON_PADDLE1: 'paddle1',
+    SDL_CONTROLLER_BUTTON_PADDLE2: 'paddle2',
+    SDL_CONTROLLER_BUTTON_PADDLE3: 'paddle3',
+    SDL_CONTROLLER_BUTTON_PADDLE4: 'paddle4',
+    SDL_CONTROLLER_BUTTON_TOUCHPAD: 'touchpad',
+    SDL_CONTROLLER_BUTTON_MAX: 'max'
+}
+mouse_button_map = {
+    SDL_BUTTON_LEFT: 0,
+    SDL_BUTTON_MIDDLE: 1,
+    SDL_BUTTON_RIGHT: 2,
+    SDL_BUTTON_X1: 3,
+    SDL_BUTTON_X2: 4
+}
+display_event_map = {
+    SDL_DISPLAYEVENT_ORIENTATION: 'orientation_change',
+    SDL_DISPLAYEVENT_CONNECTED: 'connect',
+    SDL_DISPLAYEVENT_DISCONNECTED: 'disconnect'
+}
+scancode_names = {}
+key_names = {}
+
+
+class EventBlock:
+    def __init__(self, size: int) -> None:
+        self.size = max(int(size), 1)
+        self.event_size = ctypes.sizeof(SDL_Event)
+        self.events = (SDL_Event * self.size)()
+        base = ctypes.addressof(self.events)
+        self.addresses = tuple(base + i * self.event_size for i in range(self.size))
+        self.u8 = memoryview(self.events).cast('B')
+        self.u32 = self.u8.cast('I')
+        self.i32 = self.u8.cast('i')
+        self.i16 = self.u8.cast('h')
+        self.f32 = self.u8.cast('f')
+        self.coalesced = 0
+
+    def peep(self) -> int:
+        return SDL_PeepEvents(self.events, self.size, SDL_GETEVENT, SDL_FIRSTEVENT, SDL_LASTEVENT)
+
+    def coalesce(self, count: int) -> list:
+        stride = self.event_size >> 2
+        ints = self.i32[:count * stride].tolist()
+        indices = []
+        latest = {}
+        for i in range(count):
+            word = i * stride
+            event_type = ints[word]
+            if event_type == SDL_MOUSEMOTION:
+                key = event_type, ints[word + 2], ints[word + 3], ints[word + 4]
+            elif event_type == SDL_CONTROLLERSENSORUPDATE:
+                key = event_type, ints[word + 2], ints[word + 3]
+            elif event_type == SDL_CONTROLLERAXISMOTION or event_type == SDL_JOYAXISMOTION or\
+                    event_type == SDL_JOYBALLMOTION:
+                key = event_type, ints[word + 2], self.u8[(word << 2) + 12]
+            elif event_type == SDL_FINGERMOTION:
+                key = event_type, ints[word + 2], ints[word + 3], ints[word + 4], ints[word + 5]
+            else:
+                latest.clear()
+                indices.append(i)
+                continue
+            j = latest.get(key)
+            if j is not None:
+                old_word = indices[j] * stride
+                if event_type == SDL_MOUSEMOTION:
+                    ints[word + 7] = self.i32[word + 7] = ints[word + 7] + ints[old_word + 7]
+                    ints[word + 8] = self.i32[word + 8] = ints[word + 8] + ints[old_word + 8]
+                elif event_type == SDL_FINGERMOTION:
+                    self.f32[word + 8] += self.f32[old_word + 8]
+                    self.f32[word + 9] += self.f32[old_word + 9]
+                elif event_type == SDL_JOYBALLMOTION:
+                    half, old_half = word << 1, old_word << 1
+                    self.i16[half + 8] = max(min(self.i16[half + 8] + self.i16[old_half + 8], 32767), -32768)
+                    self.i16[half + 9] = max(min(self.i16[half + 9] + self.i16[old_half + 9], 32767), -32768)
+                indices[j] = -1
+                self.coalesced += 1
+            latest[key] = len(indices)
+            indices.append(i)
+        return [i for i in indices if i >= 0]
+
+
 class CommonEvent:
+    __slots__ = ('sdl_event', 'timestamp', 'type')
+
     def __init__(self, event: any) -> None:
         self.sdl_event = event
         self.timestamp = event.timestamp
@@ -17,10 +156,12 @@ class CommonEvent:
 
 
 class QuitEvent(CommonEvent):
-    pass
+    __slots__ = ()
 
 
 class JoyAxisEvent(CommonEvent):
+    __slots__ = ('instance_id', 'axis', 'value')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
@@ -29,6 +170,8 @@ class JoyAxisEvent(CommonEvent):
 
 
 class JoyBallEvent(CommonEvent):
+    __slots__ = ('instance_id', 'ball', 'rel')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
@@ -37,6 +180,8 @@ class JoyBallEvent(CommonEvent):
 
 
 class JoyButtonEvent(CommonEvent):
+    __slots__ = ('instance_id', 'button', 'state')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
@@ -45,22 +190,17 @@ class JoyButtonEvent(CommonEvent):
 
 
 class JoyBatteryEvent(CommonEvent):
+    __slots__ = ('instance_id', 'level')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
-        self.button = event.button
-        self.level = {
-            SDL_JOYSTICK_POWER_UNKNOWN: 'unknown',
-            SDL_JOYSTICK_POWER_EMPTY: 'empty',
-            SDL_JOYSTICK_POWER_LOW: 'low',
-            SDL_JOYSTICK_POWER_MEDIUM: 'medium',
-            SDL_JOYSTICK_POWER_FULL: 'full',
-            SDL_JOYSTICK_POWER_WIRED: 'wired',
-            SDL_JOYSTICK_POWER_MAX: 'max'
-        }.get(event.level)
+        self.level = joystick_power_map.get(event.level)
 
 
 class JoyDeviceEvent(CommonEvent):
+    __slots__ = ('index', 'instance_id')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         if self.type == SDL_JOYDEVICEADDED:
@@ -72,74 +212,41 @@ class JoyDeviceEvent(CommonEvent):
 
 
 class JoyHatEvent(CommonEvent):
+    __slots__ = ('instance_id', 'hat', 'state')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
         self.hat = event.hat
-        self.state = {
-            SDL_JOYSTICK_POWER_UNKNOWN: 'unknown',
-            SDL_JOYSTICK_POWER_EMPTY: 'empty',
-            SDL_JOYSTICK_POWER_LOW: 'low',
-            SDL_JOYSTICK_POWER_MEDIUM: 'medium',
-            SDL_JOYSTICK_POWER_FULL: 'full',
-            SDL_JOYSTICK_POWER_WIRED: 'wired',
-            SDL_JOYSTICK_POWER_MAX: 'max'
-        }.get(event.value)
+        self.state = hat_state_map.get(event.value)
 
 
 class ControllerAxisEvent(CommonEvent):
+    __slots__ = ('instance_id', 'axis', 'value')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
-        self.axis = {
-            SDL_CONTROLLER_AXIS_INVALID: 'invalid',
-            SDL_CONTROLLER_AXIS_LEFTX: 'left_x',
-            SDL_CONTROLLER_AXIS_LEFTY: 'left_y',
-            SDL_CONTROLLER_AXIS_RIGHTX: 'right_x',
-            SDL_CONTROLLER_AXIS_RIGHTY: 'right_y',
-            SDL_CONTROLLER_AXIS_TRIGGERLEFT: 'trigger_left',
-            SDL_CONTROLLER_AXIS_TRIGGERRIGHT: 'trigger_right',
-            SDL_CONTROLLER_AXIS_MAX: 'max'
-        }.get(event.axis)
+        self.axis = controller_axis_map.get(event.axis)
         self.value = event.value
 
 
 class ControllerButtonEvent(CommonEvent):
+    __slots__ = ('instance_id', 'button', 'state')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
-        self.button = {
-            SDL_CONTROLLER_BUTTON_INVALID: 'invalid',
-            SDL_CONTROLLER_BUTTON_A: 'a',
-            SDL_CONTROLLER_BUTTON_B: 'b',
-            SDL_CONTROLLER_BUTTON_X: 'x',
-            SDL_CONTROLLER_BUTTON_Y: 'y',
-            SDL_CONTROLLER_BUTTON_BACK: 'back',
-            SDL_CONTROLLER_BUTTON_GUIDE: 'guide',
-            SDL_CONTROLLER_BUTTON_START: 'start',
-            SDL_CONTROLLER_BUTTON_LEFTSTICK: 'left_stick',
-            SDL_CONTROLLER_BUTTON_RIGHTSTICK: 'right_stick',
-            SDL_CONTROLLER_BUTTON_LEFTSHOULDER: 'left_shoulder',
-            SDL_CONTROLLER_BUTTON_RIGHTSHOULDER: 'right_shoulder',
-            SDL_CONTROLLER_BUTTON_DPAD_UP: 'd_pad_up',
-            SDL_CONTROLLER_BUTTON_DPAD_DOWN: 'd_pad_down',
-            SDL_CONTROLLER_BUTTON_DPAD_LEFT: 'd_pad_left',
-            SDL_CONTROLLER_BUTTON_DPAD_RIGHT: 'd_pad_right',
-            SDL_CONTROLLER_BUTTON_MISC1: 'misc1',
-            SDL_CONTROLLER_BUTTON_PADDLE1: 'paddle1',
-            SDL_CONTROLLER_BUTTON_PADDLE2: 'paddle2',
-            SDL_CONTROLLER_BUTTON_PADDLE3: 'paddle2',
-            SDL_CONTROLLER_BUTTON_PADDLE4: 'paddle3',
-            SDL_CONTROLLER_BUTTON_TOUCHPAD: 'touchpad',
-            SDL_CONTROLLER_BUTTON_MAX: 'max'
-        }.get(event.button)
+        self.button = controller_button_map.get(event.button)
         self.state = 'pressed' if event.state == SDL_PRESSED else 'released'
 
 
 class ControllerDeviceEvent(CommonEvent):
+    __slots__ = ('index', 'instance_id')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
-        if self.type == SDL_JOYDEVICEADDED:
+        if self.type == SDL_CONTROLLERDEVICEADDED:
             self.index = event.which
             self.instance_id = 0
         else:
@@ -148,6 +255,8 @@ class ControllerDeviceEvent(CommonEvent):
 
 
 class ControllerTouchpadEvent(CommonEvent):
+    __slots__ = ('instance_id', 'touchpad', 'finger', 'pos', 'pressure')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
@@ -158,31 +267,29 @@ class ControllerTouchpadEvent(CommonEvent):
 
 
 class ControllerSensorEvent(CommonEvent):
+    __slots__ = ('instance_id', 'sensor', 'data', 'time')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
         self.instance_id = event.which
         self.sensor = event.sensor
-        self.pos = (event.x, event.y)
         self.data = (event.data[0], event.data[1], event.data[2])
-        self.time = event.timestamp_us / 1000000
+        self.time = event.timestamp_us / 1000000 if sensor_has_timestamp_us else event.timestamp / 1000
 
 
 class AudioDeviceEvent(CommonEvent):
+    __slots__ = ('which', 'event', 'device_type')
+
     def __init__(self, event: any) -> None:
         super().__init__(event)
-        if self.type == SDL_AUDIODEVICEADDED:
-            self.which = event.which
-            self.event = 'add'
-        else:
-            self.which = event.which
-            self.event = 'remove'
-        if event.iscapture == 0:
-            self.device_type = 'playback'
-        else:
-            self.device_type = 'recording'
+        self.which = event.which
+        self.event = 'add' if self.type == SDL_AUDIODEVICEADDED else 'remove'
+        self.device_type = 'playback' if event.iscapture == 0 else 'recording'
 
 
 class DropEvent(CommonEvent):
+    __slots__ = ('file', 'drop_type', 'drop_state', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         if self.type == SDL_DROPFILE or self.type == SDL_DROPTEXT:
@@ -193,11 +300,13 @@ class DropEvent(CommonEvent):
             self.file = None
             self.drop_type = None
             self.drop_state = 'begin' if self.type == SDL_DROPBEGIN else 'complete'
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID if drop_has_window_id else default_window_id[0]
         self.window = app.windows[self.window_id]
 
 
 class TouchFingerEvent(CommonEvent):
+    __slots__ = ('event', 'touch_id', 'finger_id', 'pos', 'd_pos', 'pressure', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         if self.type == SDL_FINGERMOTION:
@@ -209,68 +318,90 @@ class TouchFingerEvent(CommonEvent):
         self.pos = (event.x, event.y)
         self.d_pos = (event.dx, event.dy)
         self.pressure = event.pressure
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID if finger_has_window_id else default_window_id[0]
         self.window = app.windows[self.window_id]
 
 
 class KeyboardEvent(CommonEvent):
+    __slots__ = ('app', 'event', 'state', 'repeat', 'scancode_id', 'sym_id', 'mod', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
-        self.event = 'down' if self.type == SDL_KEYDOWN else 'up'
+        self.app = app
         self.state = 'pressed' if event.state == SDL_PRESSED else 'released'
         self.repeat = event.repeat
         if self.repeat:
             self.event = 'hold'
-        self.scancode_id = event.keysym.scancode
-        self.scancode = app.bts(SDL_GetScancodeName(self.scancode_id))
-        self.sym_id = event.keysym.sym
-        self.sym = app.bts(SDL_GetKeyName(self.sym_id))
-        self.mod = event.keysym.mod
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        else:
+            self.event = 'down' if self.type == SDL_KEYDOWN else 'up'
+        keysym = event.keysym
+        self.scancode_id = keysym.scancode
+        self.sym_id = keysym.sym
+        self.mod = keysym.mod
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
+    @property
+    def scancode(self) -> str:
+        name = scancode_names.get(self.scancode_id)
+        if name is None:
+            name = scancode_names[self.scancode_id] = self.app.bts(SDL_GetScancodeName(self.scancode_id))
+        return name
+
+    @property
+    def sym(self) -> str:
+        name = key_names.get(self.sym_id)
+        if name is None:
+            name = key_names[self.sym_id] = self.app.bts(SDL_GetKeyName(self.sym_id))
+        return name
+
 
 class MouseMotionEvent(CommonEvent):
+    __slots__ = ('which', 'emulated', 'state_num', 'pos', 'rel', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         self.which = event.which
         self.emulated = self.which == SDL_TOUCH_MOUSEID
         self.state_num = event.state
-        self.state = (
-            bool(event.state & SDL_BUTTON_LMASK),
-            bool(event.state & SDL_BUTTON_MMASK),
-            bool(event.state & SDL_BUTTON_RMASK),
-            bool(event.state & SDL_BUTTON_X1MASK),
-            bool(event.state & SDL_BUTTON_X2MASK)
-        )
         self.pos = (event.x, event.y)
         self.rel = (event.xrel, event.yrel)
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
+    @property
+    def state(self) -> tuple:
+        return (
+            bool(self.state_num & SDL_BUTTON_LMASK),
+            bool(self.state_num & SDL_BUTTON_MMASK),
+            bool(self.state_num & SDL_BUTTON_RMASK),
+            bool(self.state_num & SDL_BUTTON_X1MASK),
+            bool(self.state_num & SDL_BUTTON_X2MASK)
+        )
+
 
 class MouseButtonEvent(CommonEvent):
+    __slots__ = (
+        'button_event', 'which', 'emulated', 'button_id', 'button', 'state', 'clicks', 'pos', 'window_id', 'window'
+    )
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         self.button_event = 'down' if event.type == SDL_MOUSEBUTTONDOWN else 'up'
         self.which = event.which
         self.emulated = self.which == SDL_TOUCH_MOUSEID
         self.button_id = event.button
-        self.button = {
-            SDL_BUTTON_LEFT: 0,
-            SDL_BUTTON_MIDDLE: 1,
-            SDL_BUTTON_RIGHT: 2,
-            SDL_BUTTON_X1: 3,
-            SDL_BUTTON_X2: 4
-        }.get(self.button_id)
+        self.button = mouse_button_map.get(self.button_id)
         self.state = 'pressed' if event.state == SDL_PRESSED else 'released'
         self.clicks = event.clicks
         self.pos = (event.x, event.y)
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
 
 class MouseWheelEvent(CommonEvent):
+    __slots__ = ('which', 'emulated', 'pos', 'direction', 'precise_x', 'precise_y', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         self.which = event.which
@@ -279,44 +410,63 @@ class MouseWheelEvent(CommonEvent):
         self.direction = 'flipped' if event.direction == SDL_MOUSEWHEEL_FLIPPED else 'normal'
         self.precise_x = event.preciseX
         self.precise_y = event.preciseY
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
 
 class TextEditingEvent(CommonEvent):
+    __slots__ = ('app', 'raw_text', 'start', 'length', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
-        self.text = app.bts(event.text, 'utf-8')
+        self.app = app
+        self.raw_text = event.text
         self.start = event.start
         self.length = event.length
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
+    @property
+    def text(self) -> str:
+        return self.app.bts(self.raw_text, 'utf-8')
+
 
 class TextInputEvent(CommonEvent):
+    __slots__ = ('app', 'raw_text', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
-        self.text = app.bts(event.text, 'utf-8')
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.app = app
+        self.raw_text = event.text
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
 
+    @property
+    def text(self) -> str:
+        return self.app.bts(self.raw_text, 'utf-8')
+
 
 class DisplayEvent(CommonEvent):
+    __slots__ = ('app', 'display_id', 'display_cache', 'event', 'data')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
-        self.display = Display(event.display, app)
-        if event.event == SDL_DISPLAYEVENT_ORIENTATION:
-            self.event = 'orientation_change'
-        elif event.event == SDL_DISPLAYEVENT_CONNECTED:
-            self.event = 'connect'
-        elif event.event == SDL_DISPLAYEVENT_DISCONNECTED:
-            self.event = 'disconnect'
-        else:
-            self.event = None
+        self.app = app
+        self.display_id = event.display
+        self.display_cache = None
+        self.event = display_event_map.get(event.event)
         self.data = event.data1
 
+    @property
+    def display(self) -> Display:
+        if self.display_cache is None:
+            self.display_cache = Display(self.display_id, self.app)
+        return self.display_cache
+
 
 class WindowEvent(CommonEvent):
+    __slots__ = ('data1', 'data2', 'event', 'padding1', 'padding2', 'padding3', 'window_id', 'window')
+
     def __init__(self, event: any, app: any) -> None:
         super().__init__(event)
         self.data1 = event.data1
@@ -325,5 +475,5 @@ class WindowEvent(CommonEvent):
         self.padding1 = event.padding1
         self.padding2 = event.padding2
         self.padding3 = event.padding3
-        self.window_id = event.windowID if hasattr(event, 'windowID') else default_window_id[0]
+        self.window_id = event.windowID
         self.window = app.windows[self.window_id]
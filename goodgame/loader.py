@@ -1,4 +1,8 @@
+import os
+import heapq
 import threading
+from collections import deque
+from concurrent.futures import Future
 from sdl2 import *
 try:
     from sdl2.sdlimage import *
@@ -7,48 +11,204 @@ except:  # noqa
 
 
 class Loader:
-    def __init__(self, app: any, to_load: any, extra_data: any = None) -> None:
+    def __init__(
+            self, app: any, to_load: any, extra_data: any = None, workers: int = None, priorities: any = None
+    ) -> None:
         self.destroyed = True
         self.app = app
         self.extra_data = extra_data
-        self.destroyed = False
+        self.workers = max(int(workers or min(4, os.cpu_count() or 1)), 1)
+        self.lock = threading.Lock()
+        self.done_event = threading.Event()
+        self.notifications = deque()
+        self.finish_callbacks = []
+        self.threads = []
+        self.queue = []
+        self.generation = 0
+        self.running = False
+        self.event_type = 0
+        self.event_pending = False
+        self.on_progress = None
+        self.on_finish = None
         self.finished = False
         self.progress = 0.0
         self.counter = 0
-        self.total_len = len(to_load)
+        self.total_len = 0
         self.to_load = list(to_load)
+        self.priorities = list(priorities) if priorities else [0] * len(self.to_load)
+        self.futures = []
         self.result = []
+        self.destroyed = False
+        self.reset()
 
     def reset(self) -> None:
+        with self.lock:
+            for future in self.futures:
+                future.cancel()
+            self.generation += 1
+            self.queue.clear()
+            self.notifications.clear()
+            self.futures = []
+            self.result = []
+            self.finished = False
+            self.progress = 0.0
+            self.counter = 0
+            self.total_len = 0
+            self.done_event.clear()
+            for index in range(len(self.to_load)):
+                self.enqueue(index, self.priorities[index])
+        self.running and self.start_workers()
+
+    def enqueue(self, index: int, priority: float) -> Future:
+        future = Future()
+        self.futures.append(future)
+        self.result.append(None)
+        self.total_len += 1
+        self.progress = self.counter / self.total_len
         self.finished = False
-        self.progress = 0.0
-        self.counter = 0
-        self.total_len = len(self.to_load)
-        self.result.clear()
+        self.done_event.clear()
+        heapq.heappush(self.queue, (-priority, index))
+        return future
+
+    def add(self, to_load: any, priority: float = 0) -> Future:
+        with self.lock:
+            self.to_load.append(to_load)
+            self.priorities.append(priority)
+            future = self.enqueue(len(self.to_load) - 1, priority)
+        self.running and self.start_workers()
+        return future
 
     def run(self) -> None:
-        threading.Thread(target=self.thread).start()
+        if not self.event_type and SDL_WasInit(SDL_INIT_EVENTS):
+            self.event_type = SDL_RegisterEvents(1)
+            if self.event_type == 0xFFFFFFFF:
+                self.event_type = 0
+                self.app.raise_error()
+            self.app.event_map[self.event_type] = self.on_event
+        self.running = True
+        with self.lock:
+            empty = not self.total_len and not self.finished
+            if empty:
+                self.finished = True
+                self.progress = 1.0
+                self.notifications.append((-1, None, True))
+        if empty:
+            self.done_event.set()
+            self.notify()
+        self.start_workers()
+
+    def start_workers(self) -> None:
+        with self.lock:
+            while len(self.threads) < min(self.workers, len(self.queue)):
+                thread = threading.Thread(target=self.thread, daemon=True)
+                self.threads.append(thread)
+                thread.start()
 
     def thread(self) -> None:
-        while self.to_load:
-            self.result.append(self.load(self.to_load.pop(0)))
+        while True:
+            with self.lock:
+                if not self.queue or not self.running:
+                    self.threads.remove(threading.current_thread())
+                    return
+                index = heapq.heappop(self.queue)[1]
+                generation = self.generation
+                future, to_load = self.futures[index], self.to_load[index]
+            if not future.set_running_or_notify_cancel():
+                self.complete(index, None, generation)
+                continue
+            try:
+                result = self.load(to_load)
+            except Exception as err:
+                future.set_exception(err)
+                self.complete(index, None, generation)
+            else:
+                future.set_result(result)
+                self.complete(index, result, generation)
+
+    def complete(self, index: int, result: any, generation: int) -> None:
+        with self.lock:
+            if not generation == self.generation:
+                return
+            self.result[index] = result
             self.counter += 1
             self.progress = self.counter / self.total_len
-        self.finished = True
+            finished = self.counter >= self.total_len
+            if finished:
+                self.finished = True
+            self.notifications.append((index, result, finished))
+        if finished:
+            self.done_event.set()
+        self.notify()
+
+    def notify(self) -> None:
+        with self.lock:
+            if self.event_pending or not self.event_type:
+                return
+            self.event_pending = True
+        event = SDL_Event()
+        event.type = self.event_type
+        if SDL_PushEvent(event) < 1:
+            self.event_pending = False
+
+    def on_event(self) -> None:
+        self.event_pending = False
+        self.dispatch()
+
+    def dispatch(self) -> None:
+        while self.notifications:
+            index, result, finished = self.notifications.popleft()
+            if self.on_progress and index >= 0:
+                self.on_progress(index, result)
+            if not finished:
+                continue
+            self.on_finish and self.on_finish()
+            with self.lock:
+                callbacks = self.finish_callbacks
+                self.finish_callbacks = []
+            for cb in callbacks:
+                cb()
+
+    def wait(self, timeout: float = None) -> bool:
+        if not self.running:
+            self.run()
+        if not self.done_event.wait(timeout):
+            return False
+        self.dispatch()
+        return True
+
+    def cancel(self, index: int) -> bool:
+        return self.futures[index].cancel()
+
+    def cancel_all(self) -> None:
+        for future in self.futures:
+            future.cancel()
 
     def load(self, to_load: any) -> any:
         pass
-    
+
     def call_on_finish(self, cb: any) -> None:
-        while not self.finished:
-            pass
+        with self.lock:
+            if not self.finished:
+                self.finish_callbacks.append(cb)
+                return
         cb()
 
     def destroy(self) -> bool:
         if self.destroyed:
             return True
+        self.running = False
+        self.cancel_all()
+        with self.lock:
+            self.queue.clear()
+            self.finish_callbacks.clear()
+        self.notifications.clear()
+        if self.event_type and self.app.event_map.get(self.event_type) == self.on_event:
+            del self.app.event_map[self.event_type]
+        if 'load' in self.__dict__:
+            del self.load
+        self.on_progress = None
+        self.on_finish = None
         del self.app
-        del self.load
         self.destroyed = True
         return False
 
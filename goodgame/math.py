@@ -1,5 +1,6 @@
 import os
 import sys
+import math
 import ctypes
 from .sdl import sdl_dir
 from sdl2 import *
@@ -12,6 +13,11 @@ if os.getenv('GG_ENABLE_NUMBA') == '1':
         print(f'Failed to import numba [{_err}]. JIT for Math will be disabled!')
 else:
     from . import numba
+try:
+    import numpy
+except:  # noqa
+    numpy = None
+jit_enabled = numba.__name__ == 'numba'
 
 
 class Math:
@@ -23,6 +29,11 @@ class Math:
             self.union = self.union_i
             self.intersect_rect_and_line = self.intersect_rect_and_line_i
             self.enclose_points = self.enclose_points_i
+            self.intersect_many = self.intersect_many_i
+            self.has_intersection_many = self.has_intersection_many_i
+            self.union_many = self.union_many_i
+            self.collide_one_vs_many = self.collide_one_vs_many_i
+            self.points_in_rects = self.points_in_rects_i
         self.destroyed = False
         # TODO
         #  add more functions
@@ -142,6 +153,142 @@ class Math:
     def rect_equals_i(a: any, b: any) -> bool:
         return int(a[0]) == int(b[0]) and int(a[1]) == int(b[1]) and int(a[2]) == int(b[2]) and int(a[3]) == int(b[3])
 
+    @staticmethod
+    @numba.njit(nopython=True, cache=True)
+    def intersect_kernel(a: any, b: any, out: any, mask: any) -> None:
+        step_a = 1 if len(a) > 1 else 0
+        step_b = 1 if len(b) > 1 else 0
+        for i in range(len(mask)):
+            ra, rb = a[i * step_a], b[i * step_b]
+            mask[i] = False
+            if ra[2] <= 0 or ra[3] <= 0 or rb[2] <= 0 or rb[3] <= 0:
+                continue
+            x_min, x_max = max(ra[0], rb[0]), min(ra[0] + ra[2], rb[0] + rb[2])
+            if x_max <= x_min:
+                continue
+            y_min, y_max = max(ra[1], rb[1]), min(ra[1] + ra[3], rb[1] + rb[3])
+            if y_max <= y_min:
+                continue
+            out[i, 0], out[i, 1], out[i, 2], out[i, 3] = x_min, y_min, x_max - x_min, y_max - y_min
+            mask[i] = True
+
+    @staticmethod
+    @numba.njit(nopython=True, cache=True)
+    def points_in_rects_kernel(points: any, rects: any, mask: any) -> None:
+        for i in range(len(points)):
+            px, py = points[i, 0], points[i, 1]
+            for j in range(len(rects)):
+                r = rects[j]
+                mask[i, j] = r[0] <= px < r[0] + r[2] and r[1] <= py < r[1] + r[3]
+
+    @staticmethod
+    def as_rects(rects: any, dtype: any) -> any:
+        return numpy.ascontiguousarray(rects, dtype).reshape(-1, 4)
+
+    @staticmethod
+    def as_points(points: any, dtype: any) -> any:
+        return numpy.ascontiguousarray(points, dtype).reshape(-1, 2)
+
+    def intersect_arrays(self, a: any, b: any, dtype: any) -> tuple:
+        a, b = self.as_rects(a, dtype), self.as_rects(b, dtype)
+        if not len(a) == len(b) and not len(a) == 1 and not len(b) == 1:
+            raise ValueError(f'Cannot intersect {len(a)} rects with {len(b)} rects')
+        count = max(len(a), len(b)) if len(a) and len(b) else 0
+        out = numpy.zeros((count, 4), dtype)
+        if not count:
+            return numpy.zeros(0, numpy.bool_), out
+        if jit_enabled:
+            mask = numpy.empty(count, numpy.bool_)
+            self.intersect_kernel(a, b, out, mask)
+            return mask, out
+        x_min = numpy.maximum(a[:, 0], b[:, 0])
+        y_min = numpy.maximum(a[:, 1], b[:, 1])
+        w = numpy.minimum(a[:, 0] + a[:, 2], b[:, 0] + b[:, 2]) - x_min
+        h = numpy.minimum(a[:, 1] + a[:, 3], b[:, 1] + b[:, 3]) - y_min
+        mask = (a[:, 2] > 0) & (a[:, 3] > 0) & (b[:, 2] > 0) & (b[:, 3] > 0) & (w > 0) & (h > 0)
+        out[mask] = numpy.stack((x_min, y_min, w, h), axis=1)[mask]
+        return mask, out
+
+    def intersect_many(self, a: any, b: any) -> tuple:
+        if not numpy:
+            result = [self.intersect(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+            return [rect is not None for rect in result], [rect or (0.0, 0.0, 0.0, 0.0) for rect in result]
+        return self.intersect_arrays(a, b, numpy.float32)
+
+    def intersect_many_i(self, a: any, b: any) -> tuple:
+        if not numpy:
+            result = [self.intersect_i(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+            return [rect is not None for rect in result], [rect or (0, 0, 0, 0) for rect in result]
+        return self.intersect_arrays(a, b, numpy.int32)
+
+    def has_intersection_many(self, a: any, b: any) -> any:
+        if not numpy:
+            return [self.has_intersection(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+        return self.intersect_arrays(a, b, numpy.float32)[0]
+
+    def has_intersection_many_i(self, a: any, b: any) -> any:
+        if not numpy:
+            return [self.has_intersection_i(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+        return self.intersect_arrays(a, b, numpy.int32)[0]
+
+    def collide_one_vs_many(self, rect: any, rects: any) -> any:
+        if not numpy:
+            return [i for i, other in enumerate(rects) if self.has_intersection(rect, other)]
+        return numpy.flatnonzero(self.intersect_arrays(rect, rects, numpy.float32)[0])
+
+    def collide_one_vs_many_i(self, rect: any, rects: any) -> any:
+        if not numpy:
+            return [i for i, other in enumerate(rects) if self.has_intersection_i(rect, other)]
+        return numpy.flatnonzero(self.intersect_arrays(rect, rects, numpy.int32)[0])
+
+    def union_arrays(self, a: any, b: any, dtype: any) -> any:
+        a, b = numpy.broadcast_arrays(self.as_rects(a, dtype), self.as_rects(b, dtype))
+        x_min = numpy.minimum(a[:, 0], b[:, 0])
+        y_min = numpy.minimum(a[:, 1], b[:, 1])
+        out = numpy.stack((
+            x_min, y_min,
+            numpy.maximum(a[:, 0] + a[:, 2], b[:, 0] + b[:, 2]) - x_min,
+            numpy.maximum(a[:, 1] + a[:, 3], b[:, 1] + b[:, 3]) - y_min
+        ), axis=1)
+        a_empty = (a[:, 2] <= 0) | (a[:, 3] <= 0)
+        b_empty = (b[:, 2] <= 0) | (b[:, 3] <= 0)
+        out[b_empty] = a[b_empty]
+        out[a_empty] = b[a_empty]
+        out[a_empty & b_empty] = 0
+        return out
+
+    def union_many(self, a: any, b: any) -> any:
+        if not numpy:
+            return [self.union(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+        return self.union_arrays(a, b, numpy.float32)
+
+    def union_many_i(self, a: any, b: any) -> any:
+        if not numpy:
+            return [self.union_i(rect_a, rect_b) for rect_a, rect_b in zip(a, b)]
+        return self.union_arrays(a, b, numpy.int32)
+
+    def points_in_rects_arrays(self, points: any, rects: any, dtype: any) -> any:
+        points, rects = self.as_points(points, dtype), self.as_rects(rects, dtype)
+        if jit_enabled:
+            mask = numpy.empty((len(points), len(rects)), numpy.bool_)
+            self.points_in_rects_kernel(points, rects, mask)
+            return mask
+        px, py = points[:, 0, None], points[:, 1, None]
+        return (rects[:, 0] <= px) & (px < rects[:, 0] + rects[:, 2]) & (rects[:, 1] <= py) & \
+            (py < rects[:, 1] + rects[:, 3])
+
+    def points_in_rects(self, points: any, rects: any) -> any:
+        if not numpy:
+            return [[self.point_in_rect(rect, point) for rect in rects] for point in points]
+        return self.points_in_rects_arrays(points, rects, numpy.float32)
+
+    def points_in_rects_i(self, points: any, rects: any) -> any:
+        if not numpy:
+            return [[bool(SDL_PointInRect(
+                SDL_Point(int(point[0]), int(point[1])), SDL_Rect(int(r[0]), int(r[1]), int(r[2]), int(r[3]))
+            )) for r in rects] for point in points]
+        return self.points_in_rects_arrays(points, rects, numpy.int32)
+
     def destroy(self) -> bool:
         if self.destroyed:
             return True
@@ -150,5 +297,352 @@ class Math:
         self.union = None
         self.intersect_rect_and_line = None
         self.enclose_points = None
+        self.intersect_many = None
+        self.has_intersection_many = None
+        self.union_many = None
+        self.collide_one_vs_many = None
+        self.points_in_rects = None
         self.destroyed = True
         return False
+
+
+class BroadPhase:
+    def __init__(self) -> None:
+        self.rects = {}
+
+    @staticmethod
+    def overlaps(a: any, b: any) -> bool:
+        return a[2] > 0 and a[3] > 0 and b[2] > 0 and b[3] > 0 and\
+            a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+
+    @staticmethod
+    def contains_point(r: any, x: float, y: float) -> bool:
+        return r[0] <= x < r[0] + r[2] and r[1] <= y < r[1] + r[3]
+
+    @staticmethod
+    def touches_circle(r: any, x: float, y: float, radius: float) -> bool:
+        dx = x - min(max(x, r[0]), r[0] + r[2])
+        dy = y - min(max(y, r[1]), r[1] + r[3])
+        return dx * dx + dy * dy <= radius * radius
+
+    @staticmethod
+    def to_list(rects: any) -> list:
+        if numpy is not None and isinstance(rects, numpy.ndarray):
+            return rects.reshape(-1, 4).tolist()
+        return [tuple(rect) for rect in rects]
+
+    def get_rect(self, item_id: any) -> tuple:
+        return self.rects.get(item_id)
+
+    def rebuild(self, rects: any, ids: any = None) -> None:
+        self.clear()
+        rects = self.to_list(rects)
+        for item_id, rect in zip(range(len(rects)) if ids is None else ids, rects):
+            self.insert(item_id, rect)
+
+    def query_pairs(self) -> set:
+        pairs = set()
+        for item_id, rect in self.rects.items():
+            for other_id in self.query_rect(rect):
+                if other_id != item_id:
+                    pairs.add((item_id, other_id) if item_id < other_id else (other_id, item_id))
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def __contains__(self, item_id: any) -> bool:
+        return item_id in self.rects
+
+
+class SpatialHash(BroadPhase):
+    def __init__(self, cell_size: float = 64.0) -> None:
+        super().__init__()
+        self.cell_size = float(cell_size)
+        self.inv_cell_size = 1.0 / self.cell_size
+        self.cells = {}
+        self.ranges = {}
+
+    def get_range(self, rect: any) -> tuple:
+        inv = self.inv_cell_size
+        return (
+            math.floor(rect[0] * inv), math.floor(rect[1] * inv),
+            math.floor((rect[0] + rect[2]) * inv), math.floor((rect[1] + rect[3]) * inv)
+        )
+
+    def add_to_cells(self, item_id: any, cell_range: tuple) -> None:
+        cells = self.cells
+        for cx in range(cell_range[0], cell_range[2] + 1):
+            for cy in range(cell_range[1], cell_range[3] + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {item_id}
+                else:
+                    cell.add(item_id)
+
+    def remove_from_cells(self, item_id: any, cell_range: tuple) -> None:
+        cells = self.cells
+        for cx in range(cell_range[0], cell_range[2] + 1):
+            for cy in range(cell_range[1], cell_range[3] + 1):
+                cell = cells[(cx, cy)]
+                cell.discard(item_id)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def insert(self, item_id: any, rect: any) -> None:
+        if item_id in self.rects:
+            return self.move(item_id, rect)
+        rect = (rect[0], rect[1], rect[2], rect[3])
+        cell_range = self.get_range(rect)
+        self.rects[item_id] = rect
+        self.ranges[item_id] = cell_range
+        self.add_to_cells(item_id, cell_range)
+
+    def move(self, item_id: any, rect: any) -> None:
+        rect = (rect[0], rect[1], rect[2], rect[3])
+        cell_range = self.get_range(rect)
+        self.rects[item_id] = rect
+        old_range = self.ranges[item_id]
+        if cell_range == old_range:
+            return
+        self.remove_from_cells(item_id, old_range)
+        self.ranges[item_id] = cell_range
+        self.add_to_cells(item_id, cell_range)
+
+    def remove(self, item_id: any) -> None:
+        self.remove_from_cells(item_id, self.ranges.pop(item_id))
+        del self.rects[item_id]
+
+    def query_cells(self, cell_range: tuple) -> set:
+        result = set()
+        cells = self.cells
+        for cx in range(cell_range[0], cell_range[2] + 1):
+            for cy in range(cell_range[1], cell_range[3] + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    result.update(cell)
+        return result
+
+    def query_rect(self, rect: any) -> list:
+        rects, overlaps = self.rects, self.overlaps
+        return [item_id for item_id in self.query_cells(self.get_range(rect)) if overlaps(rects[item_id], rect)]
+
+    def query_point(self, point: any) -> list:
+        x, y = point[0], point[1]
+        cell = self.cells.get((math.floor(x * self.inv_cell_size), math.floor(y * self.inv_cell_size)))
+        if not cell:
+            return []
+        rects, contains_point = self.rects, self.contains_point
+        return [item_id for item_id in cell if contains_point(rects[item_id], x, y)]
+
+    def query_radius(self, center: any, radius: float) -> list:
+        x, y = center[0], center[1]
+        candidates = self.query_cells(self.get_range((x - radius, y - radius, radius * 2, radius * 2)))
+        rects, touches_circle = self.rects, self.touches_circle
+        return [item_id for item_id in candidates if touches_circle(rects[item_id], x, y, radius)]
+
+    def query_pairs(self) -> set:
+        pairs = set()
+        rects, overlaps = self.rects, self.overlaps
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+            items = list(cell)
+            for i in range(len(items) - 1):
+                a = items[i]
+                rect_a = rects[a]
+                for b in items[i + 1:]:
+                    if overlaps(rect_a, rects[b]):
+                        pairs.add((a, b) if a < b else (b, a))
+        return pairs
+
+    def rebuild(self, rects: any, ids: any = None) -> None:
+        if numpy is None or not isinstance(rects, numpy.ndarray):
+            return super().rebuild(rects, ids)
+        self.clear()
+        rects = rects.reshape(-1, 4)
+        inv = self.inv_cell_size
+        x0 = numpy.floor(rects[:, 0] * inv).astype(numpy.int64)
+        y0 = numpy.floor(rects[:, 1] * inv).astype(numpy.int64)
+        x1 = numpy.floor((rects[:, 0] + rects[:, 2]) * inv).astype(numpy.int64)
+        y1 = numpy.floor((rects[:, 1] + rects[:, 3]) * inv).astype(numpy.int64)
+        ids = range(len(rects)) if ids is None else ids
+        cells = self.cells
+        for item_id, rect, cell_range in zip(
+                ids, rects.tolist(), zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist())
+        ):
+            self.rects[item_id] = tuple(rect)
+            self.ranges[item_id] = cell_range
+            if cell_range[0] == cell_range[2] and cell_range[1] == cell_range[3]:
+                cell = cells.get(cell_range[:2])
+                if cell is None:
+                    cells[cell_range[:2]] = {item_id}
+                else:
+                    cell.add(item_id)
+            else:
+                self.add_to_cells(item_id, cell_range)
+
+    def clear(self) -> None:
+        self.rects.clear()
+        self.ranges.clear()
+        self.cells.clear()
+
+
+class QuadTreeNode:
+    __slots__ = ('bounds', 'loose', 'depth', 'parent', 'items', 'children', 'count')
+
+    def __init__(self, bounds: tuple, depth: int, parent: any = None) -> None:
+        self.bounds = bounds
+        self.loose = (bounds[0] - bounds[2] / 2, bounds[1] - bounds[3] / 2, bounds[2] * 2, bounds[3] * 2)
+        self.depth = depth
+        self.parent = parent
+        self.items = set()
+        self.children = None
+        self.count = 0
+
+    def contains(self, rect: any) -> bool:
+        b = self.loose
+        return b[0] <= rect[0] and rect[0] + rect[2] <= b[0] + b[2] and\
+            b[1] <= rect[1] and rect[1] + rect[3] <= b[1] + b[3]
+
+    def get_child(self, rect: any) -> any:
+        b = self.bounds
+        if rect[2] > b[2] / 2 or rect[3] > b[3] / 2:
+            return None
+        center_x, center_y = rect[0] + rect[2] / 2, rect[1] + rect[3] / 2
+        if not (b[0] <= center_x < b[0] + b[2] and b[1] <= center_y < b[1] + b[3]):
+            return None
+        return self.children[(center_x >= b[0] + b[2] / 2) + (center_y >= b[1] + b[3] / 2) * 2]
+
+    def split(self) -> None:
+        x, y, w, h = self.bounds
+        half_w, half_h = w / 2, h / 2
+        self.children = (
+            QuadTreeNode((x, y, half_w, half_h), self.depth + 1, self),
+            QuadTreeNode((x + half_w, y, half_w, half_h), self.depth + 1, self),
+            QuadTreeNode((x, y + half_h, half_w, half_h), self.depth + 1, self),
+            QuadTreeNode((x + half_w, y + half_h, half_w, half_h), self.depth + 1, self)
+        )
+
+
+class QuadTree(BroadPhase):
+    def __init__(self, bounds: any, max_items: int = 8, max_depth: int = 8) -> None:
+        super().__init__()
+        self.bounds = (float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3]))
+        self.max_items = int(max_items)
+        self.max_depth = int(max_depth)
+        self.nodes = {}
+        self.root = QuadTreeNode(self.bounds, 0)
+
+    def insert(self, item_id: any, rect: any) -> None:
+        if item_id in self.rects:
+            return self.move(item_id, rect)
+        rect = (rect[0], rect[1], rect[2], rect[3])
+        self.rects[item_id] = rect
+        self.insert_into(self.root, item_id, rect)
+
+    def insert_into(self, node: QuadTreeNode, item_id: any, rect: tuple) -> None:
+        node.count += 1
+        while node.children:
+            child = node.get_child(rect)
+            if not child:
+                break
+            node = child
+            node.count += 1
+        node.items.add(item_id)
+        self.nodes[item_id] = node
+        if not node.children and len(node.items) > self.max_items and node.depth < self.max_depth:
+            node.split()
+            rects, nodes = self.rects, self.nodes
+            for other_id in list(node.items):
+                child = node.get_child(rects[other_id])
+                if child:
+                    node.items.discard(other_id)
+                    child.items.add(other_id)
+                    child.count += 1
+                    nodes[other_id] = child
+
+    def remove_from(self, node: QuadTreeNode, item_id: any) -> None:
+        node.items.discard(item_id)
+        collapse = None
+        while node:
+            node.count -= 1
+            if node.children and node.count < self.max_items:
+                collapse = node
+            node = node.parent
+        collapse and self.collapse(collapse)
+
+    def collapse(self, node: QuadTreeNode) -> None:
+        nodes = self.nodes
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+            for item_id in child.items:
+                node.items.add(item_id)
+                nodes[item_id] = node
+            if child.children:
+                stack.extend(child.children)
+        node.children = None
+
+    def move(self, item_id: any, rect: any) -> None:
+        rect = (rect[0], rect[1], rect[2], rect[3])
+        self.rects[item_id] = rect
+        node = self.nodes[item_id]
+        if (node is self.root or node.contains(rect)) and not (node.children and node.get_child(rect)):
+            return
+        self.remove_from(node, item_id)
+        self.insert_into(self.root, item_id, rect)
+
+    def remove(self, item_id: any) -> None:
+        self.remove_from(self.nodes.pop(item_id), item_id)
+        del self.rects[item_id]
+
+    def query_rect(self, rect: any) -> list:
+        if rect[2] <= 0 or rect[3] <= 0:
+            return []
+        x1, y1, x2, y2 = rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3]
+        result = []
+        rects = self.rects
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for item_id in node.items:
+                r = rects[item_id]
+                if r[0] < x2 and x1 < r[0] + r[2] and r[1] < y2 and y1 < r[1] + r[3] and r[2] > 0 and r[3] > 0:
+                    result.append(item_id)
+            if node.children:
+                for child in node.children:
+                    b = child.loose
+                    if (child.items or child.children) and b[0] < x2 and x1 < b[0] + b[2] and\
+                            b[1] < y2 and y1 < b[1] + b[3]:
+                        stack.append(child)
+        return result
+
+    def query_point(self, point: any) -> list:
+        x, y = point[0], point[1]
+        result = []
+        rects, contains_point = self.rects, self.contains_point
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            result.extend(item_id for item_id in node.items if contains_point(rects[item_id], x, y))
+            if node.children:
+                stack.extend(child for child in node.children if contains_point(child.loose, x, y))
+        return result
+
+    def query_radius(self, center: any, radius: float) -> list:
+        x, y = center[0], center[1]
+        result = []
+        rects, touches_circle = self.rects, self.touches_circle
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            result.extend(item_id for item_id in node.items if touches_circle(rects[item_id], x, y, radius))
+            if node.children:
+                stack.extend(child for child in node.children if touches_circle(child.loose, x, y, radius))
+        return result
+
+    def clear(self) -> None:
+        self.rects.clear()
+        self.nodes.clear()
+        self.root = QuadTreeNode(self.bounds, 0)
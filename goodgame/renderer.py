@@ -3,6 +3,9 @@ from .video import Backend, BackendManager
 from .surface import Surface
 from .video import PixelFormat
 from .texture import Texture
+from .batch import SpriteBatch
+from .commands import CommandBuffer
+from .uploader import TextureUploader
 from .sdl import sdl_dir
 from sdl2 import *
 
@@ -10,6 +13,10 @@ try:
     from sdl2.sdlimage import *
 except:  # noqa
     pass
+try:
+    import numpy
+except:  # noqa
+    numpy = None
 try:
     from sdl2.sdlgfx import *
 except Exception as _err:
@@ -36,7 +43,8 @@ class Renderer:
             'target': SDL_TEXTUREACCESS_TARGET,
             'streaming': SDL_TEXTUREACCESS_STREAMING
         }
-        if force_int or 'SDL_RenderCopyF' not in sdl_dir:
+        self.force_int = force_int or 'SDL_RenderCopyF' not in sdl_dir
+        if self.force_int:
             self.blit = self.blit_i
             self.blit_ex = self.blit_ex_i
             self.draw_point = self.draw_point_i
@@ -47,6 +55,10 @@ class Renderer:
             self.sdl_fill_rects = self.sdl_fill_rects_i
             self.sdl_draw_line = self.sdl_draw_line_i
             self.sdl_draw_lines = self.sdl_draw_lines_i
+            self.draw_points_array = self.draw_points_array_i
+            self.draw_rects_array = self.draw_rects_array_i
+            self.fill_rects_array = self.fill_rects_array_i
+            self.draw_lines_array = self.draw_lines_array_i
         self.renderer = SDL_CreateRenderer(
             window.window,
             self.backend.backend_id,
@@ -55,10 +67,13 @@ class Renderer:
         self.integer_scale = bool(SDL_RenderGetIntegerScale(self.renderer))
         self.render_target_supported = bool(SDL_RenderTargetSupported(self.renderer))
         self.target = None
+        self.batch = None
+        self.command_buffer = None
+        self.uploader = None
         self.destroyed = False
         # TODO:
         #  check out of bounds (check if this handled automatic by sdl)
-        #  SDL_RenderReadPixels, SDL_RenderGeometry, SDL_RenderGeometryRaw
+        #  SDL_RenderReadPixels
         #  Fix Scaling for SDL2_gfx
 
     @staticmethod
@@ -72,7 +87,7 @@ class Renderer:
         bak_target = self.target
         result = self.create_texture(
             (crop_rect[2], crop_rect[3]),
-            texture.get_format()
+            texture.format
         )
         self.copy_attributes(texture, result)
         self.set_target(result)
@@ -84,7 +99,7 @@ class Renderer:
         bak_target = self.target
         result = self.create_texture(
             size,
-            texture.get_format()
+            texture.format
         )
         self.copy_attributes(texture, result)
         self.set_target(result)
@@ -93,7 +108,7 @@ class Renderer:
         return result
 
     def scale_texture(self, texture: Texture, scale: any) -> Texture:
-        return self.scale_texture_size(texture, (scale[0] * texture.get_w(), scale[1] * texture.get_h()))
+        return self.scale_texture_size(texture, (scale[0] * texture.w, scale[1] * texture.h))
 
     def pixel_format_from_str(self, format_str: str) -> PixelFormat:
         return PixelFormat(self.app.format_map[format_str], self.app)
@@ -114,12 +129,14 @@ class Renderer:
         return scale_x_ptr.value, scale_y_ptr.value
 
     def set_scale(self, scale: any = (1.0, 1.0)) -> None:
+        self.batch and self.batch.flush()
         SDL_RenderSetScale(self.renderer, scale[0], scale[1])
 
     def is_clip_enabled(self) -> bool:
         return bool(SDL_RenderIsClipEnabled(self.renderer))
 
     def set_clip_rect(self, clip_rect: any = None) -> None:
+        self.batch and self.batch.flush()
         SDL_RenderSetClipRect(
             self.renderer,
             clip_rect and SDL_Rect(int(clip_rect[0]), int(clip_rect[1]), int(clip_rect[2]), int(clip_rect[3]))
@@ -131,6 +148,7 @@ class Renderer:
         return clip_rect_ptr.x, clip_rect_ptr.y, clip_rect_ptr.w, clip_rect_ptr.h
 
     def set_viewport(self, viewport_rect: any = None) -> None:
+        self.batch and self.batch.flush()
         SDL_RenderSetViewport(
             self.renderer,
             viewport_rect and SDL_Rect(int(viewport_rect[0]), int(viewport_rect[1]),
@@ -155,6 +173,7 @@ class Renderer:
         SDL_RenderSetIntegerScale(self.renderer, enabled)
 
     def set_target(self, target: any = None) -> None:
+        self.batch and self.batch.flush()
         self.target = target
         SDL_SetRenderTarget(self.renderer, target and target.texture)
 
@@ -173,35 +192,52 @@ class Renderer:
             self.app.raise_error(IMG_GetError)
         return Texture(texture, self)
 
+    def get_uploader(self, budget: float = 0.002, workers: int = None) -> TextureUploader:
+        if not self.uploader:
+            self.uploader = TextureUploader(self, budget, workers)
+        return self.uploader
+
+    def texture_from_file_async(self, path: str, priority: float = 0) -> any:
+        return self.get_uploader().load(path, priority)
+
     def blit(self, texture: Texture, src_rect: any = None, dst_rect: any = None) -> None:
+        self.batch and self.batch.flush()
+        if texture.region:
+            src_rect = texture.map_rect(src_rect)
         SDL_RenderCopyF(
             self.renderer,
             texture.texture,
             src_rect and SDL_Rect(int(src_rect[0]), int(src_rect[1]), int(src_rect[2]), int(src_rect[3])),
             dst_rect and (SDL_FRect(dst_rect[0], dst_rect[1], dst_rect[2], dst_rect[3]) if len(dst_rect) > 2 else
-                          SDL_FRect(dst_rect[0], dst_rect[1], texture.get_w(), texture.get_h()))
+                          SDL_FRect(dst_rect[0], dst_rect[1], texture.w, texture.h))
         )
 
     def blit_i(self, texture: Texture, src_rect: any = None, dst_rect: any = None) -> None:
+        self.batch and self.batch.flush()
+        if texture.region:
+            src_rect = texture.map_rect(src_rect)
         SDL_RenderCopy(
             self.renderer,
             texture.texture,
             src_rect and SDL_Rect(int(src_rect[0]), int(src_rect[1]), int(src_rect[2]), int(src_rect[3])),
             dst_rect and (SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), int(dst_rect[2]), int(dst_rect[3]))
                           if len(dst_rect) > 2 else
-                          SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), texture.get_w(), texture.get_h()))
+                          SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), texture.w, texture.h))
         )
 
     def blit_ex(
             self, texture: Texture, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
             center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False
     ) -> None:
+        self.batch and self.batch.flush()
+        if texture.region:
+            src_rect = texture.map_rect(src_rect)
         SDL_RenderCopyExF(
             self.renderer,
             texture.texture,
             src_rect and SDL_Rect(int(src_rect[0]), int(src_rect[1]), int(src_rect[2]), int(src_rect[3])),
             dst_rect and (SDL_FRect(dst_rect[0], dst_rect[1], dst_rect[2], dst_rect[3]) if len(dst_rect) > 2 else
-                          SDL_FRect(dst_rect[0], dst_rect[1], texture.get_w(), texture.get_h())),
+                          SDL_FRect(dst_rect[0], dst_rect[1], texture.w, texture.h)),
             angle,
             center and SDL_FPoint(center[0], center[1]),
             ((flip_horizontal and SDL_FLIP_HORIZONTAL) | (flip_vertical and SDL_FLIP_VERTICAL)) or SDL_FLIP_NONE
@@ -211,22 +247,36 @@ class Renderer:
             self, texture: Texture, src_rect: any = None, dst_rect: any = None, angle: float = 0.0,
             center: any = None, flip_horizontal: bool = False, flip_vertical: bool = False
     ) -> None:
+        self.batch and self.batch.flush()
+        if texture.region:
+            src_rect = texture.map_rect(src_rect)
         SDL_RenderCopyEx(
             self.renderer,
             texture.texture,
             src_rect and SDL_Rect(int(src_rect[0]), int(src_rect[1]), int(src_rect[2]), int(src_rect[3])),
             dst_rect and (SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), int(dst_rect[2]), int(dst_rect[3]))
                           if len(dst_rect) > 2 else
-                          SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), texture.get_w(), texture.get_h())),
+                          SDL_Rect(int(dst_rect[0]), int(dst_rect[1]), texture.w, texture.h)),
             angle,
             center and SDL_FPoint(center[0], center[1]),
             ((flip_horizontal and SDL_FLIP_HORIZONTAL) | (flip_vertical and SDL_FLIP_VERTICAL)) or SDL_FLIP_NONE
         )
 
+    def begin_batch(self, capacity: int = 1024) -> SpriteBatch:
+        if not self.batch or self.batch.capacity < capacity:
+            self.batch and self.batch.destroy()
+            self.batch = SpriteBatch(self, capacity)
+        self.batch.begin()
+        return self.batch
+
+    def end_batch(self) -> None:
+        self.batch and self.batch.end()
+
     def texture_from_surface(self, surf: Surface) -> Texture:
         return Texture(SDL_CreateTextureFromSurface(self.renderer, surf.surface), self)
 
     def draw_bezier(self, color: any, points: any, steps: float) -> None:
+        self.batch and self.batch.flush()
         bezierRGBA(
             self.renderer,
             (ctypes.c_short * len(points))(*(int(point[0]) for point in points)),
@@ -236,6 +286,7 @@ class Renderer:
         )
 
     def draw_polygon(self, color: any, points: any, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aapolygonRGBA if aa else polygonRGBA)(
             self.renderer,
             (ctypes.c_short * len(points))(*(int(point[0]) for point in points)),
@@ -244,6 +295,7 @@ class Renderer:
         )
 
     def draw_textured_polygon(self, points: any, surf: Surface, texture_offset: any = (0, 0)) -> None:
+        self.batch and self.batch.flush()
         texturedPolygon(
             self.renderer,
             (ctypes.c_short * len(points))(*(int(point[0]) for point in points)),
@@ -253,6 +305,7 @@ class Renderer:
         )
 
     def fill_polygon(self, color: any, points: any) -> None:
+        self.batch and self.batch.flush()
         filledPolygonRGBA(
             self.renderer,
             (ctypes.c_short * len(points))(*(int(point[0]) for point in points)),
@@ -261,6 +314,7 @@ class Renderer:
         )
 
     def draw_trigon(self, color: any, pos1: any, pos2: any, pos3: any, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aatrigonRGBA if aa else trigonRGBA)(
             self.renderer,
             int(pos1[0]), int(pos1[1]), int(pos2[0]), int(pos2[1]), int(pos3[0]), int(pos3[1]),
@@ -268,6 +322,7 @@ class Renderer:
         )
 
     def fill_trigon(self, color: any, pos1: any, pos2: any, pos3: any) -> None:
+        self.batch and self.batch.flush()
         filledTrigonRGBA(
             self.renderer,
             int(pos1[0]), int(pos1[1]), int(pos2[0]), int(pos2[1]), int(pos3[0]), int(pos3[1]),
@@ -275,6 +330,7 @@ class Renderer:
         )
 
     def fill_pie(self, color: any, center: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         filledPieRGBA(
             self.renderer,
             int(center[0]), int(center[1]), int(rad), int(start), int(end),
@@ -282,6 +338,7 @@ class Renderer:
         )
 
     def fill_pie_tl(self, color: any, pos: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         filledPieRGBA(
             self.renderer,
             int(pos[0] + rad), int(pos[1] + rad), int(rad), int(start), int(end),
@@ -289,6 +346,7 @@ class Renderer:
         )
 
     def draw_pie(self, color: any, center: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         pieRGBA(
             self.renderer,
             int(center[0]), int(center[1]), int(rad), int(start), int(end),
@@ -296,6 +354,7 @@ class Renderer:
         )
 
     def draw_pie_tl(self, color: any, pos: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         pieRGBA(
             self.renderer,
             int(pos[0] + rad), int(pos[1] + rad), int(rad), int(start), int(end),
@@ -303,6 +362,7 @@ class Renderer:
         )
 
     def draw_arc(self, color: any, center: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         arcRGBA(
             self.renderer,
             int(center[0]), int(center[1]), int(rad), int(start), int(end),
@@ -310,6 +370,7 @@ class Renderer:
         )
 
     def draw_arc_tl(self, color: any, pos: any, rad: float, start: float, end: float) -> None:
+        self.batch and self.batch.flush()
         arcRGBA(
             self.renderer,
             int(pos[0] + rad), int(pos[1] + rad), int(rad), int(start), int(end),
@@ -317,6 +378,7 @@ class Renderer:
         )
 
     def fill_circle(self, color: any, center: any, r: float) -> None:
+        self.batch and self.batch.flush()
         filledCircleRGBA(
             self.renderer,
             int(center[0]), int(center[1]), int(r),
@@ -324,6 +386,7 @@ class Renderer:
         )
 
     def fill_circle_tl(self, color: any, pos: any, r: float) -> None:
+        self.batch and self.batch.flush()
         filledCircleRGBA(
             self.renderer,
             int(pos[0] + r), int(pos[1] + r), int(r),
@@ -331,6 +394,7 @@ class Renderer:
         )
 
     def draw_circle_tl(self, color: any, pos: any, r: float, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aacircleRGBA if aa else circleRGBA)(
             self.renderer,
             int(pos[0] + r), int(pos[1] + r), int(r),
@@ -338,6 +402,7 @@ class Renderer:
         )
 
     def draw_circle(self, color: any, center: any, r: float, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aacircleRGBA if aa else circleRGBA)(
             self.renderer,
             int(center[0]), int(center[1]), int(r),
@@ -345,6 +410,7 @@ class Renderer:
         )
 
     def draw_ellipse(self, color: any, center: any, rx: float, ry: float, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aaellipseRGBA if aa else ellipseRGBA)(
             self.renderer,
             int(center[0]), int(center[1]), int(rx), int(ry),
@@ -352,6 +418,7 @@ class Renderer:
         )
 
     def draw_ellipse_tl(self, color: any, pos: any, rx: float, ry: float, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aaellipseRGBA if aa else ellipseRGBA)(
             self.renderer,
             int(pos[0] + rx), int(pos[1] + ry), int(rx), int(ry),
@@ -359,6 +426,7 @@ class Renderer:
         )
 
     def fill_ellipse(self, color: any, center: any, rx: float, ry: float) -> None:
+        self.batch and self.batch.flush()
         filledEllipseRGBA(
             self.renderer,
             int(center[0]), int(center[1]), int(rx), int(ry),
@@ -366,6 +434,7 @@ class Renderer:
         )
 
     def fill_ellipse_tl(self, color: any, pos: any, rx: float, ry: float) -> None:
+        self.batch and self.batch.flush()
         filledEllipseRGBA(
             self.renderer,
             int(pos[0] + rx), int(pos[1] + ry), int(rx), int(ry),
@@ -386,6 +455,8 @@ class Renderer:
         SDL_RenderDrawPoint(self.renderer, int(point[0]), int(point[1]))
 
     def draw_points(self, color: any, points: any) -> None:
+        if numpy:
+            return self.draw_points_array(color, points)
         self.set_draw_color(color)
         SDL_RenderDrawPointsF(
             self.renderer,
@@ -394,6 +465,8 @@ class Renderer:
         )
 
     def draw_points_i(self, color: any, points: any) -> None:
+        if numpy:
+            return self.draw_points_array_i(color, points)
         self.set_draw_color(color)
         SDL_RenderDrawPoints(
             self.renderer,
@@ -412,6 +485,7 @@ class Renderer:
         return self.sdl_fill_rect(color, fill_rect)
 
     def gfx_draw_rounded_rect(self, color: any, draw_rect: any, rad: float) -> None:
+        self.batch and self.batch.flush()
         roundedRectangleRGBA(
             self.renderer,
             int(draw_rect[0]), int(draw_rect[1]), int(draw_rect[0] + draw_rect[2]), int(draw_rect[1] + draw_rect[3]),
@@ -419,6 +493,7 @@ class Renderer:
         )
 
     def gfx_fill_rounded_rect(self, color: any, fill_rect: any, rad: float) -> None:
+        self.batch and self.batch.flush()
         roundedBoxRGBA(
             self.renderer,
             int(fill_rect[0]), int(fill_rect[1]), int(fill_rect[0] + fill_rect[2]), int(fill_rect[1] + fill_rect[3]),
@@ -440,6 +515,8 @@ class Renderer:
         )
 
     def sdl_draw_rects(self, color: any, draw_rects: any) -> None:
+        if numpy:
+            return self.draw_rects_array(color, draw_rects)
         self.set_draw_color(color)
         SDL_RenderDrawRectsF(
             self.renderer,
@@ -449,6 +526,8 @@ class Renderer:
         )
 
     def sdl_draw_rects_i(self, color: any, draw_rects: any) -> None:
+        if numpy:
+            return self.draw_rects_array_i(color, draw_rects)
         self.set_draw_color(color)
         SDL_RenderDrawRects(
             self.renderer,
@@ -472,6 +551,8 @@ class Renderer:
         )
 
     def sdl_fill_rects(self, color: any, fill_rects: any) -> None:
+        if numpy:
+            return self.fill_rects_array(color, fill_rects)
         self.set_draw_color(color)
         SDL_RenderFillRectsF(
             self.renderer,
@@ -481,6 +562,8 @@ class Renderer:
         )
 
     def sdl_fill_rects_i(self, color: any, fill_rects: any) -> None:
+        if numpy:
+            return self.fill_rects_array_i(color, fill_rects)
         self.set_draw_color(color)
         SDL_RenderFillRects(
             self.renderer,
@@ -490,6 +573,7 @@ class Renderer:
         )
 
     def gfx_draw_line(self, color: any, start: any, end: any, aa: bool = False) -> None:
+        self.batch and self.batch.flush()
         (aalineRGBA if aa else lineRGBA)(
             self.renderer,
             int(start[0]), int(start[1]), int(end[0]), int(end[1]),
@@ -497,6 +581,7 @@ class Renderer:
         )
 
     def gfx_draw_thick_line(self, color: any, start: any, end: any, width: float) -> None:
+        self.batch and self.batch.flush()
         thickLineRGBA(
             self.renderer,
             int(start[0]), int(start[1]), int(end[0]), int(end[1]),
@@ -512,6 +597,8 @@ class Renderer:
         SDL_RenderDrawLine(self.renderer, int(start[0]), int(start[1]), int(end[0]), int(end[1]))
 
     def sdl_draw_lines(self, color: any, points: any) -> None:
+        if numpy:
+            return self.draw_lines_array(color, points)
         self.set_draw_color(color)
         SDL_RenderDrawLinesF(
             self.renderer,
@@ -520,6 +607,8 @@ class Renderer:
         )
 
     def sdl_draw_lines_i(self, color: any, points: any) -> None:
+        if numpy:
+            return self.draw_lines_array_i(color, points)
         self.set_draw_color(color)
         SDL_RenderDrawLines(
             self.renderer,
@@ -527,11 +616,58 @@ class Renderer:
             len(points)
         )
 
+    @staticmethod
+    def as_array(data: any, dtype: any, columns: int) -> any:
+        if numpy is None:
+            raise RuntimeError('Renderer array drawing requires NumPy')
+        return numpy.ascontiguousarray(data, dtype).reshape(-1, columns)
+
+    def draw_points_array(self, color: any, points: any) -> None:
+        points = self.as_array(points, 'float32', 2)
+        self.set_draw_color(color)
+        SDL_RenderDrawPointsF(self.renderer, points.ctypes.data_as(ctypes.POINTER(SDL_FPoint)), len(points))
+
+    def draw_points_array_i(self, color: any, points: any) -> None:
+        points = self.as_array(points, 'int32', 2)
+        self.set_draw_color(color)
+        SDL_RenderDrawPoints(self.renderer, points.ctypes.data_as(ctypes.POINTER(SDL_Point)), len(points))
+
+    def draw_lines_array(self, color: any, points: any) -> None:
+        points = self.as_array(points, 'float32', 2)
+        self.set_draw_color(color)
+        SDL_RenderDrawLinesF(self.renderer, points.ctypes.data_as(ctypes.POINTER(SDL_FPoint)), len(points))
+
+    def draw_lines_array_i(self, color: any, points: any) -> None:
+        points = self.as_array(points, 'int32', 2)
+        self.set_draw_color(color)
+        SDL_RenderDrawLines(self.renderer, points.ctypes.data_as(ctypes.POINTER(SDL_Point)), len(points))
+
+    def draw_rects_array(self, color: any, draw_rects: any) -> None:
+        draw_rects = self.as_array(draw_rects, 'float32', 4)
+        self.set_draw_color(color)
+        SDL_RenderDrawRectsF(self.renderer, draw_rects.ctypes.data_as(ctypes.POINTER(SDL_FRect)), len(draw_rects))
+
+    def draw_rects_array_i(self, color: any, draw_rects: any) -> None:
+        draw_rects = self.as_array(draw_rects, 'int32', 4)
+        self.set_draw_color(color)
+        SDL_RenderDrawRects(self.renderer, draw_rects.ctypes.data_as(ctypes.POINTER(SDL_Rect)), len(draw_rects))
+
+    def fill_rects_array(self, color: any, fill_rects: any) -> None:
+        fill_rects = self.as_array(fill_rects, 'float32', 4)
+        self.set_draw_color(color)
+        SDL_RenderFillRectsF(self.renderer, fill_rects.ctypes.data_as(ctypes.POINTER(SDL_FRect)), len(fill_rects))
+
+    def fill_rects_array_i(self, color: any, fill_rects: any) -> None:
+        fill_rects = self.as_array(fill_rects, 'int32', 4)
+        self.set_draw_color(color)
+        SDL_RenderFillRects(self.renderer, fill_rects.ctypes.data_as(ctypes.POINTER(SDL_Rect)), len(fill_rects))
+
     def clear(self, color: any = (0, 0, 0, 255)) -> None:
         self.set_draw_color(color)
         SDL_RenderClear(self.renderer)
 
     def set_draw_color(self, color: any) -> None:
+        self.batch and self.batch.flush()
         if len(color) > 3:
             SDL_SetRenderDrawColor(self.renderer, int(color[0]), int(color[1]), int(color[2]), int(color[3]))
             SDL_SetRenderDrawBlendMode(self.renderer, SDL_BLENDMODE_NONE if color[3] >= 255 else SDL_BLENDMODE_BLEND)
@@ -546,8 +682,23 @@ class Renderer:
         self.vsync = vsync
         SDL_RenderSetVSync(self.renderer, vsync)
 
+    def set_command_buffer(self, enabled: bool, sort: bool = False) -> None:
+        if enabled and not self.command_buffer:
+            self.command_buffer = CommandBuffer(self, sort)
+            self.command_buffer.install()
+        elif not enabled and self.command_buffer:
+            self.command_buffer.flush()
+            self.command_buffer.uninstall()
+            self.command_buffer.destroy()
+            self.command_buffer = None
+        if self.command_buffer:
+            self.command_buffer.sort = sort
+
     def flip(self) -> None:
+        self.command_buffer and self.command_buffer.flush()
+        self.batch and self.batch.flush()
         SDL_RenderPresent(self.renderer)
+        self.uploader and self.uploader.update()
 
     def get_output_size(self) -> tuple:
         w_ptr, h_ptr = ctypes.c_int(), ctypes.c_int()
@@ -571,7 +722,20 @@ class Renderer:
         self.sdl_fill_rects = None
         self.sdl_draw_line = None
         self.sdl_draw_lines = None
+        self.draw_points_array = None
+        self.draw_rects_array = None
+        self.fill_rects_array = None
+        self.draw_lines_array = None
         self.target = None
+        if self.batch:
+            self.batch.destroy()
+            self.batch = None
+        if self.command_buffer:
+            self.command_buffer.destroy()
+            self.command_buffer = None
+        if self.uploader:
+            self.uploader.destroy()
+            self.uploader = None
         SDL_DestroyRenderer(self.renderer)
         del self.window
         del self.app
@@ -0,0 +1,164 @@
+import ctypes
+import struct
+from .app import event_dispatch_map, SDL_TEXTEDITING_EXT
+from sdl2 import *
+
+replay_magic = b'GGEV'
+replay_version = 1
+header_format = struct.Struct('<4sHH')
+frame_format = struct.Struct('<Bd')
+event_tag = 1
+frame_tag = 2
+skipped_event_types = (SDL_DROPFILE, SDL_DROPTEXT, SDL_TEXTEDITING_EXT)
+
+
+class EventRecorder:
+    def __init__(self, app: any, file: any, clock: any = None) -> None:
+        self.destroyed = True
+        self.app = app
+        self.clock = clock
+        self.own_file = isinstance(file, str)
+        self.file = open(file, 'wb') if self.own_file else file
+        self.event_size = ctypes.sizeof(SDL_Event)
+        self.event_ptr = ctypes.addressof(app.sdl_event)
+        self.tag = bytes((event_tag, ))
+        self.original_handlers = {}
+        self.frames = 0
+        self.events = 0
+        self.recording = False
+        self.file.write(header_format.pack(replay_magic, replay_version, self.event_size))
+        self.destroyed = False
+
+    def start(self) -> None:
+        if self.recording:
+            return
+        event_map = self.app.event_map
+        for event_type in event_dispatch_map:
+            if event_type in skipped_event_types or event_type not in event_map:
+                continue
+            self.original_handlers[event_type] = event_map[event_type]
+            event_map[event_type] = self.make_handler(event_map[event_type])
+        self.recording = True
+
+    def make_handler(self, handler: any) -> any:
+        def record() -> None:
+            self.file.write(self.tag + ctypes.string_at(self.event_ptr, self.event_size))
+            self.events += 1
+            handler()
+        return record
+
+    def record_frame(self, delta: float = None) -> None:
+        if delta is None:
+            delta = self.clock.delta if self.clock else 0.0
+        self.file.write(frame_format.pack(frame_tag, delta))
+        self.frames += 1
+
+    def stop(self) -> None:
+        if not self.recording:
+            return
+        self.app.event_map.update(self.original_handlers)
+        self.original_handlers.clear()
+        self.recording = False
+        self.file.closed or self.file.flush()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.stop()
+        if self.own_file:
+            self.file.close()
+        del self.app
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
+
+
+class EventPlayer:
+    def __init__(self, app: any, file: any, clock: any = None, push: bool = False, fixed_dt: float = None) -> None:
+        self.destroyed = True
+        self.app = app
+        self.clock = clock
+        self.push = push
+        self.fixed_dt = fixed_dt
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                data = f.read()
+        else:
+            data = file.read()
+        self.frames = self.parse(data)
+        self.frame_count = len(self.frames)
+        self.frame_index = 0
+        self.finished = not self.frames
+        self.destroyed = False
+
+    @staticmethod
+    def parse(data: bytes) -> list:
+        magic, version, event_size = header_format.unpack_from(data, 0)
+        if not magic == replay_magic or version > replay_version:
+            raise RuntimeError('Invalid event replay file')
+        if not event_size == ctypes.sizeof(SDL_Event):
+            raise RuntimeError(f'Event size mismatch ({event_size} != {ctypes.sizeof(SDL_Event)})')
+        frames = []
+        events = []
+        pos = header_format.size
+        while pos < len(data):
+            tag = data[pos]
+            if tag == event_tag:
+                events.append(data[pos + 1:pos + 1 + event_size])
+                pos += 1 + event_size
+            elif tag == frame_tag:
+                frames.append((frame_format.unpack_from(data, pos)[1], events))
+                events = []
+                pos += frame_format.size
+            else:
+                raise RuntimeError(f'Invalid record tag {tag} at {pos}')
+        if events:
+            frames.append((0.0, events))
+        return frames
+
+    def next_frame(self) -> float:
+        if self.finished:
+            return 0.0
+        delta, events = self.frames[self.frame_index]
+        self.frame_index += 1
+        self.finished = self.frame_index >= self.frame_count
+        if self.fixed_dt is not None:
+            delta = self.fixed_dt
+        if self.push:
+            event = SDL_Event()
+            event_ptr = ctypes.addressof(event)
+            for raw in events:
+                ctypes.memmove(event_ptr, raw, len(raw))
+                if SDL_PushEvent(event) < 0:
+                    self.app.raise_error()
+        else:
+            sdl_event = self.app.sdl_event
+            event_ptr = ctypes.addressof(sdl_event)
+            event_map = self.app.event_map
+            for raw in events:
+                ctypes.memmove(event_ptr, raw, len(raw))
+                (event_map.get(sdl_event.type) or self.app.on_unknown_event)()
+        if self.clock:
+            self.clock.delta = delta
+        return delta
+
+    def play(self, on_frame: any) -> None:
+        while not self.finished:
+            on_frame(self.next_frame())
+
+    def rewind(self) -> None:
+        self.frame_index = 0
+        self.finished = not self.frames
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.frames.clear()
+        del self.app
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
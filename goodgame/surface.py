@@ -1,6 +1,11 @@
 import ctypes
+import contextlib
 from .video import PixelFormat
 from sdl2 import *
+try:
+    import numpy
+except:  # noqa
+    numpy = None
 
 try:
     from sdl2.sdlimage import *
@@ -51,6 +56,8 @@ class Surface:
         except NameError:
             self.has_rle = False
         self.must_lock = self.has_rle
+        self.pitch = surf.contents.pitch
+        self.source = None
         self.destroyed = False
 
     def update_blend_mode_by_alpha(self) -> None:
@@ -90,6 +97,65 @@ class Surface:
     def unlock(self) -> None:
         SDL_UnlockSurface(self.surface)
 
+    def pixels_view(self, channels: bool = True) -> any:
+        if self.must_lock:
+            raise RuntimeError('Surface.pixels_view cannot access surfaces that must be locked, use locked_pixels()')
+        return self.make_pixels_view(
+            self.surface.contents.pixels, self.size, self.pitch, self.bytes_per_pixel, channels
+        )
+
+    @staticmethod
+    def make_pixels_view(address: int, size: any, pitch: int, bytes_per_pixel: int, channels: bool = True) -> any:
+        w, h = size
+        buffer = (ctypes.c_ubyte * (pitch * (h - 1) + w * bytes_per_pixel)).from_address(address or 0)
+        if numpy is None:
+            return memoryview(buffer).cast('B')
+        rows = numpy.lib.stride_tricks.as_strided(
+            numpy.frombuffer(buffer, numpy.uint8), (h, w * bytes_per_pixel), (pitch, 1)
+        )
+        if channels or bytes_per_pixel == 3:
+            return rows.reshape(h, w, bytes_per_pixel) if bytes_per_pixel > 1 else rows
+        return rows.view({2: numpy.uint16, 4: numpy.uint32}.get(bytes_per_pixel, numpy.uint8))
+
+    @contextlib.contextmanager
+    def locked_pixels(self, channels: bool = True) -> any:
+        if self.must_lock and SDL_LockSurface(self.surface) < 0:
+            self.app.raise_error()
+        try:
+            yield self.make_pixels_view(
+                self.surface.contents.pixels, self.size, self.pitch, self.bytes_per_pixel, channels
+            )
+        finally:
+            self.must_lock and SDL_UnlockSurface(self.surface)
+
+    @staticmethod
+    def from_array(app: any, array: any, pixel_format: any = None) -> any:
+        if numpy is None:
+            raise RuntimeError('Surface.from_array requires NumPy')
+        if array.ndim == 2 and array.dtype.itemsize > 1:
+            bytes_per_pixel = array.dtype.itemsize
+            default_format = {2: 'rgb565', 4: 'rgba32'}.get(bytes_per_pixel)
+        elif array.ndim == 2 or array.ndim == 3 and array.dtype == numpy.uint8:
+            bytes_per_pixel = array.shape[2] if array.ndim == 3 else 1
+            default_format = {1: 'index8', 3: 'rgb24', 4: 'rgba32'}.get(bytes_per_pixel)
+        else:
+            raise RuntimeError(f'Unsupported pixel array (shape {array.shape}, dtype {array.dtype})')
+        if not array.strides[1] == bytes_per_pixel or not array.strides[-1] == array.dtype.itemsize or\
+                array.strides[0] < array.shape[1] * bytes_per_pixel:
+            array = numpy.ascontiguousarray(array)
+        if isinstance(pixel_format, str):
+            pixel_format = PixelFormat(app.format_map[pixel_format], app)
+        elif pixel_format is None:
+            pixel_format = PixelFormat(app.format_map[default_format], app)
+        if not pixel_format.bytes_per_pixel == bytes_per_pixel:
+            raise RuntimeError(f'Pixel format {pixel_format.string} does not match {bytes_per_pixel} bytes per pixel')
+        surf = app.surface_from_bytes(
+            ctypes.c_void_p(array.ctypes.data), (array.shape[1], array.shape[0]), pixel_format.bits_per_pixel,
+            array.strides[0], pixel_format=pixel_format
+        )
+        surf.source = array
+        return surf
+
     def set_rle(self, enabled: bool) -> None:
         SDL_SetSurfaceRLE(self.surface, enabled)
         try:
@@ -150,6 +216,7 @@ class Surface:
             return True
         if self.app.init_flags['has_sdl']:
             SDL_FreeSurface(self.surface)
+        self.source = None
         self.destroyed = True
         del self.app
         return False
@@ -0,0 +1,635 @@
+import math
+import bisect
+import ctypes
+from array import array
+from collections import OrderedDict
+from .atlas import TextureAtlas
+from .texture import Texture
+from sdl2 import *
+
+try:
+    from sdl2.sdlttf import *
+except:  # noqa
+    pass
+
+
+class GlyphAtlas:
+    def __init__(self, renderer: any, font: any, atlas: TextureAtlas = None, page_size: any = (512, 512)) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.font = font
+        self.own_atlas = not atlas
+        self.atlas = atlas or TextureAtlas(renderer, page_size)
+        self.styles = {}
+        self.destroyed = False
+
+    def get_style_key(self) -> tuple:
+        return self.font.get_style_key()
+
+    def get_glyphs(self) -> dict:
+        style_key = self.get_style_key()
+        glyphs = self.styles.get(style_key)
+        if glyphs is None:
+            glyphs = self.styles[style_key] = {}
+        return glyphs
+
+    def get_glyph(self, char: str, glyphs: dict = None) -> tuple:
+        if glyphs is None:
+            glyphs = self.get_glyphs()
+        glyph = glyphs.get(char)
+        if glyph is None:
+            glyph = glyphs[char] = self.rasterize(char)
+        return glyph
+
+    def rasterize(self, char: str) -> tuple:
+        advance = self.font.char_info(char)[4]
+        if char.isspace() or not self.font.has_char(char):
+            return None, advance
+        surf = self.font.render_char(char, (255, 255, 255), blend=True)
+        region = self.atlas.add_surface(surf) if surf.w and surf.h else None
+        surf.destroy()
+        return region, advance
+
+    def measure(self, text: str) -> tuple:
+        glyphs = self.get_glyphs()
+        kerning = self.font.kerning
+        kernings = self.font.get_kernings()
+        width = cur_x = 0
+        lines = 1
+        prev_char = None
+        for char in text:
+            if char == '\n':
+                width = max(width, cur_x)
+                cur_x = 0
+                lines += 1
+                prev_char = None
+                continue
+            if kerning and prev_char:
+                cur_x += self.font.get_kerning(prev_char, char, kernings)
+            cur_x += self.get_glyph(char, glyphs)[1]
+            prev_char = char
+        return max(width, cur_x), self.font.height + self.font.line_skip * (lines - 1)
+
+    def draw(self, text: str, pos: any, color: any = (255, 255, 255), scale: float = 1.0) -> None:
+        glyphs = self.get_glyphs()
+        kerning = self.font.kerning
+        kernings = self.font.get_kernings()
+        own_batch = not (self.renderer.batch and self.renderer.batch.drawing)
+        batch = self.renderer.begin_batch() if own_batch else self.renderer.batch
+        color_mod = (color[0], color[1], color[2])
+        alpha_mod = color[3] if len(color) > 3 else 255
+        cur_x, cur_y = pos[0], pos[1]
+        prev_char = None
+        for char in text:
+            if char == '\n':
+                cur_x = pos[0]
+                cur_y += self.font.line_skip * scale
+                prev_char = None
+                continue
+            if kerning and prev_char:
+                cur_x += self.font.get_kerning(prev_char, char, kernings) * scale
+            region, advance = self.get_glyph(char, glyphs)
+            if region:
+                batch.draw(
+                    region, dst_rect=(cur_x, cur_y, region.w * scale, region.h * scale),
+                    color_mod=color_mod, alpha_mod=alpha_mod
+                )
+            cur_x += advance * scale
+            prev_char = char
+        own_batch and self.renderer.end_batch()
+
+    def clear(self) -> None:
+        self.styles.clear()
+        if self.own_atlas:
+            self.atlas.clear()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.styles.clear()
+        if self.own_atlas:
+            self.atlas.destroy()
+        del self.renderer
+        del self.font
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
+
+
+class SDFGlyphAtlas(GlyphAtlas):
+    def __init__(
+            self, renderer: any, font: any, base_size: int = 48, spread: int = 8, softness: float = 1.0,
+            threshold: bool = None, atlas: TextureAtlas = None, page_size: any = (1024, 1024)
+    ) -> None:
+        self.destroyed = True
+        self.source_font = font
+        self.base_size = int(base_size)
+        self.spread = spread
+        self.softness = softness
+        self.min_doublings = 3
+        self.max_doublings = 6
+        self.targets = [None, None]
+        self.target_size = (0, 0)
+        self.max_blend_mode = self.sub_blend_mode = self.add_blend_mode = None
+        sdf_font = type(font)(font.app, font.path, self.base_size, font.index, font.data)
+        if font.bold or font.italic:
+            sdf_font.bold, sdf_font.italic = font.bold, font.italic
+            sdf_font.update_ttf_styles()
+            sdf_font.update_styles()
+        sdf_font.set_sdf(True)
+        sdf_font.update_vars()
+        GlyphAtlas.__init__(
+            self, renderer, sdf_font, atlas or TextureAtlas(renderer, page_size, scale_mode='linear'), page_size
+        )
+        self.own_atlas = not atlas
+        self.threshold = self.check_threshold() if threshold is None else threshold
+        doublings, bias = self.get_ramp(1.0)
+        self.coverage_lut = bytes(min(max((i - bias) << doublings, 0), 255) for i in range(256))
+        self.destroyed = False
+
+    def get_style_key(self) -> tuple:
+        return self.base_size, self.font.bold, self.font.italic
+
+    def check_threshold(self) -> bool:
+        try:
+            self.max_blend_mode = SDL_ComposeCustomBlendMode(
+                SDL_BLENDFACTOR_ZERO, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_ADD,
+                SDL_BLENDFACTOR_ONE, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_MAXIMUM
+            )
+            self.sub_blend_mode = SDL_ComposeCustomBlendMode(
+                SDL_BLENDFACTOR_ZERO, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_ADD,
+                SDL_BLENDFACTOR_ONE, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_REV_SUBTRACT
+            )
+            self.add_blend_mode = SDL_ComposeCustomBlendMode(
+                SDL_BLENDFACTOR_ZERO, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_ADD,
+                SDL_BLENDFACTOR_ONE, SDL_BLENDFACTOR_ONE, SDL_BLENDOPERATION_ADD
+            )
+        except NameError:
+            return False
+        if not self.renderer.render_target_supported:
+            return False
+        texture = self.renderer.create_texture((1, 1), self.renderer.pixel_format_from_str('rgba32'))
+        result = SDL_SetTextureBlendMode(texture.texture, self.max_blend_mode) == 0 and\
+            SDL_SetTextureBlendMode(texture.texture, self.add_blend_mode) == 0 and\
+            SDL_SetRenderDrawBlendMode(self.renderer.renderer, self.sub_blend_mode) == 0
+        SDL_SetRenderDrawBlendMode(self.renderer.renderer, SDL_BLENDMODE_BLEND)
+        texture.destroy()
+        return result
+
+    def get_ramp(self, pixel_scale: float) -> tuple:
+        doublings = int(round(math.log2(max(self.spread * pixel_scale / self.softness, 1.0))))
+        doublings = min(max(doublings, self.min_doublings), self.max_doublings)
+        return doublings, 255 - (255 + (1 << doublings) - 1 >> doublings)
+
+    @staticmethod
+    def get_bounds(surf: any, threshold: int) -> tuple:
+        pitch, w = surf.pitch, surf.w
+        alpha_byte = (surf.mask[3].bit_length() - 1) // 8
+        mask_table = bytes(int(i > threshold) for i in range(256))
+        data = ctypes.string_at(surf.surface.contents.pixels, pitch * surf.h)
+        x1, y1, x2, y2 = w, -1, -1, -1
+        for y in range(surf.h):
+            row = data[y * pitch + alpha_byte:y * pitch + w * 4:4].translate(mask_table)
+            first = row.find(1)
+            if first < 0:
+                continue
+            x1, x2 = min(x1, first), max(x2, row.rfind(1))
+            y1 = y if y1 < 0 else y1
+            y2 = y
+        return (x1, y1, x2, y2) if y1 >= 0 else None
+
+    def prepare_surface(self, surf: any) -> None:
+        size = surf.pitch * surf.h
+        alpha_byte = (surf.mask[3].bit_length() - 1) // 8
+        data = bytearray(ctypes.string_at(surf.surface.contents.pixels, size))
+        alpha = data[alpha_byte::4]
+        data[:] = b'\xff' * size
+        data[alpha_byte::4] = alpha if self.threshold else alpha.translate(self.coverage_lut)
+        ctypes.memmove(surf.surface.contents.pixels, bytes(data), size)
+
+    def rasterize(self, char: str) -> tuple:
+        font = self.font
+        advance = font.char_info(char)[4]
+        if char.isspace() or not font.has_char(char):
+            return None, advance, 0.0, 0.0
+        font.set_sdf(False)
+        surf = font.render_char(char, (255, 255, 255), blend=True)
+        bounds = self.get_bounds(surf, 127)
+        surf.destroy()
+        font.set_sdf(True)
+        surf = font.render_char(char, (255, 255, 255), blend=True)
+        sdf_bounds = self.get_bounds(surf, 255 - 128 // self.spread)
+        if not bounds or not sdf_bounds:
+            surf.destroy()
+            return None, advance, 0.0, 0.0
+        self.prepare_surface(surf)
+        region = self.atlas.add_surface(surf)
+        surf.destroy()
+        return (
+            region, advance, round((bounds[0] + bounds[2] - sdf_bounds[0] - sdf_bounds[2]) / 2),
+            round((bounds[1] + bounds[3] - sdf_bounds[1] - sdf_bounds[3]) / 2)
+        )
+
+    def get_scale(self, size: float = None) -> float:
+        return (self.source_font.size if size is None else size) / self.base_size
+
+    def measure(self, text: str, size: float = None) -> tuple:
+        scale = self.get_scale(size)
+        w, h = GlyphAtlas.measure(self, text)
+        return w * scale, h * scale
+
+    def draw_glyphs(self, batch: any, text: str, pos: any, color: any, scale: float) -> None:
+        glyphs = self.get_glyphs()
+        kerning = self.font.kerning
+        kernings = self.font.get_kernings()
+        color_mod = (color[0], color[1], color[2])
+        alpha_mod = color[3] if len(color) > 3 else 255
+        cur_x, cur_y = pos[0], pos[1]
+        prev_char = None
+        for char in text:
+            if char == '\n':
+                cur_x = pos[0]
+                cur_y += self.font.line_skip * scale
+                prev_char = None
+                continue
+            if kerning and prev_char:
+                cur_x += self.font.get_kerning(prev_char, char, kernings) * scale
+            region, advance, offset_x, offset_y = self.get_glyph(char, glyphs)
+            if region:
+                batch.draw(
+                    region, dst_rect=(
+                        cur_x + offset_x * scale, cur_y + offset_y * scale, region.w * scale, region.h * scale
+                    ), color_mod=color_mod, alpha_mod=alpha_mod
+                )
+            cur_x += advance * scale
+            prev_char = char
+
+    def draw(self, text: str, pos: any, color: any = (255, 255, 255), size: float = None) -> None:
+        scale = self.get_scale(size)
+        if self.threshold:
+            return self.draw_threshold(text, pos, color, scale)
+        own_batch = not (self.renderer.batch and self.renderer.batch.drawing)
+        batch = self.renderer.begin_batch() if own_batch else self.renderer.batch
+        self.draw_glyphs(batch, text, pos, color, scale)
+        own_batch and self.renderer.end_batch()
+
+    def get_targets(self, size: any) -> list:
+        if size[0] > self.target_size[0] or size[1] > self.target_size[1]:
+            self.target_size = (max(size[0], self.target_size[0]), max(size[1], self.target_size[1]))
+            for i in range(2):
+                self.targets[i] and self.targets[i].destroy()
+                self.targets[i] = self.renderer.create_texture(
+                    self.target_size, self.renderer.pixel_format_from_str('rgba32')
+                )
+                self.targets[i].set_scale_mode('nearest')
+        return self.targets
+
+    def draw_threshold(self, text: str, pos: any, color: any, scale: float) -> None:
+        renderer = self.renderer
+        if renderer.command_buffer:
+            with renderer.command_buffer.paused():
+                src, size, render_scale = self.render_threshold(text, scale)
+        else:
+            src, size, render_scale = self.render_threshold(text, scale)
+        pad = 2 / render_scale
+        own_batch = not (renderer.batch and renderer.batch.drawing)
+        batch = renderer.begin_batch() if own_batch else renderer.batch
+        batch.draw(
+            src, src_rect=(0, 0, size[0], size[1]),
+            dst_rect=(pos[0] - pad, pos[1] - pad, size[0] / render_scale, size[1] / render_scale),
+            color_mod=(color[0], color[1], color[2]), alpha_mod=color[3] if len(color) > 3 else 255
+        )
+        own_batch and renderer.end_batch()
+
+    def render_threshold(self, text: str, scale: float) -> tuple:
+        renderer = self.renderer
+        render_scale = max(renderer.gt_scale()) if renderer.target is None else 1.0
+        pixel_scale = scale * render_scale
+        pad = 2
+        w, h = GlyphAtlas.measure(self, text)
+        w, h = int(math.ceil(w * pixel_scale)) + pad * 2, int(math.ceil(h * pixel_scale)) + pad * 2
+        doublings, bias = self.get_ramp(pixel_scale)
+        src, dst = self.get_targets((w, h))
+        rect = SDL_Rect(0, 0, w, h)
+        bak_target = renderer.target
+        own_batch = not (renderer.batch and renderer.batch.drawing)
+        batch = renderer.begin_batch() if own_batch else renderer.batch
+        renderer.set_target(src)
+        renderer.clear((255, 255, 255, 0))
+        for page in self.atlas.pages:
+            SDL_SetTextureBlendMode(page.texture, self.max_blend_mode)
+        self.draw_glyphs(batch, text, (pad, pad), (255, 255, 255), pixel_scale)
+        batch.flush()
+        for page in self.atlas.pages:
+            SDL_SetTextureBlendMode(page.texture, page.blend_mode)
+        SDL_SetRenderDrawBlendMode(renderer.renderer, self.sub_blend_mode)
+        SDL_SetRenderDrawColor(renderer.renderer, 255, 255, 255, bias)
+        SDL_RenderFillRect(renderer.renderer, rect)
+        for _ in range(doublings):
+            renderer.set_target(dst)
+            renderer.clear((255, 255, 255, 0))
+            SDL_SetTextureBlendMode(src.texture, self.add_blend_mode)
+            SDL_RenderCopy(renderer.renderer, src.texture, rect, rect)
+            SDL_RenderCopy(renderer.renderer, src.texture, rect, rect)
+            src, dst = dst, src
+        renderer.set_target(bak_target)
+        own_batch and renderer.end_batch()
+        src.set_blend_mode_int(SDL_BLENDMODE_BLEND)
+        return src, (w, h), render_scale
+
+    def clear(self) -> None:
+        GlyphAtlas.clear(self)
+        for i in range(2):
+            self.targets[i] and self.targets[i].destroy()
+            self.targets[i] = None
+        self.target_size = (0, 0)
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        for i in range(2):
+            self.targets[i] and self.targets[i].destroy()
+            self.targets[i] = None
+        sdf_font = self.font
+        GlyphAtlas.destroy(self)
+        sdf_font.destroy()
+        del self.source_font
+        return False
+
+
+class TextLayout:
+    def __init__(self, font: any, text: str = '', wrap_width: float = 0, align: str = 'left') -> None:
+        self.font = font
+        self.text = ''
+        self.wrap_width = wrap_width
+        self.align = align
+        self.style_key = None
+        self.advance_cache = {}
+        self.advances = array('f')
+        self.line_starts = []
+        self.line_ends = []
+        self.line_widths = []
+        self.set_text(text)
+
+    def get_style_key(self) -> tuple:
+        return self.font.get_style_key() + (self.font.kerning, )
+
+    def check_style(self) -> bool:
+        style_key = self.get_style_key()
+        if style_key == self.style_key:
+            return False
+        self.style_key = style_key
+        self.advance_cache.clear()
+        return True
+
+    def get_advance(self, char: str) -> int:
+        advance = self.advance_cache.get(char)
+        if advance is None:
+            advance = self.advance_cache[char] = 0 if char == '\n' else self.font.char_info(char)[4]
+        return advance
+
+    def measure_range(self, start: int, end: int) -> array:
+        text = self.text
+        kerning = self.font.kerning
+        kernings = self.font.get_kernings()
+        get_advance = self.get_advance
+        advances = array('f', bytes(4 * (end - start)))
+        prev_char = text[start - 1] if start > 0 else '\n'
+        for i in range(start, end):
+            char = text[i]
+            advance = get_advance(char)
+            if kerning and not prev_char == '\n' and not char == '\n':
+                advance += self.font.get_kerning(prev_char, char, kernings)
+            advances[i - start] = advance
+            prev_char = char
+        return advances
+
+    def break_line(self, start: int) -> tuple:
+        text = self.text
+        advances = self.advances
+        wrap_width = self.wrap_width
+        count = len(text)
+        x = word_end_x = 0.0
+        last_break = -1
+        i = start
+        while i < count:
+            char = text[i]
+            if char == '\n':
+                return i, i + 1, x if last_break < i else word_end_x, True
+            advance = advances[i]
+            if char == ' ':
+                if i == start or not text[i - 1] == ' ':
+                    word_end_x = x
+                last_break = i + 1
+            elif wrap_width and x + advance > wrap_width and i > start:
+                if last_break > start:
+                    return last_break, last_break, word_end_x, False
+                return i, i, x, False
+            x += advance
+            i += 1
+        return count, count, x if last_break < count else word_end_x, False
+
+    def layout_from(self, start: int) -> tuple:
+        starts, ends, widths = [], [], []
+        count = len(self.text)
+        while True:
+            end, next_start, width, hard = self.break_line(start)
+            starts.append(start)
+            ends.append(end)
+            widths.append(width)
+            if not hard and next_start >= count:
+                return starts, ends, widths
+            start = next_start
+
+    def set_text(self, text: str) -> None:
+        self.check_style()
+        self.text = text
+        self.advances = self.measure_range(0, len(text))
+        self.line_starts, self.line_ends, self.line_widths = self.layout_from(0)
+
+    def relayout(self) -> None:
+        self.set_text(self.text)
+
+    def set_wrap_width(self, wrap_width: float) -> None:
+        if not wrap_width == self.wrap_width:
+            self.wrap_width = wrap_width
+            self.line_starts, self.line_ends, self.line_widths = self.layout_from(0)
+
+    def set_align(self, align: str) -> None:
+        self.align = align
+
+    def insert(self, index: int, text: str) -> None:
+        self.replace(index, index, text)
+
+    def delete(self, start: int, end: int) -> None:
+        self.replace(start, end, '')
+
+    def replace(self, start: int, end: int, new_text: str) -> None:
+        if self.check_style():
+            return self.set_text(self.text[:start] + new_text + self.text[end:])
+        delta = len(new_text) - (end - start)
+        self.text = self.text[:start] + new_text + self.text[end:]
+        measure_end = min(start + len(new_text) + 1, len(self.text))
+        self.advances[start:min(end + 1, len(self.advances))] = self.measure_range(start, measure_end)
+        old_starts, old_ends, old_widths = self.line_starts, self.line_ends, self.line_widths
+        line = max(bisect.bisect_right(old_starts, start) - 2, 0)
+        j = bisect.bisect_right(old_starts, end)
+        starts, ends, widths = [], [], []
+        count = len(self.text)
+        pos = old_starts[line]
+        while True:
+            line_end, next_start, width, hard = self.break_line(pos)
+            starts.append(pos)
+            ends.append(line_end)
+            widths.append(width)
+            if not hard and next_start >= count:
+                j = len(old_starts)
+                break
+            while j < len(old_starts) and old_starts[j] + delta < next_start:
+                j += 1
+            if j < len(old_starts) and old_starts[j] + delta == next_start:
+                break
+            pos = next_start
+        self.line_starts = old_starts[:line] + starts + [line_start + delta for line_start in old_starts[j:]]
+        self.line_ends = old_ends[:line] + ends + [line_end + delta for line_end in old_ends[j:]]
+        self.line_widths = old_widths[:line] + widths + old_widths[j:]
+
+    def get_line_count(self) -> int:
+        return len(self.line_starts)
+
+    def get_line(self, index: int) -> int:
+        return max(bisect.bisect_right(self.line_starts, index) - 1, 0)
+
+    def get_line_height(self) -> int:
+        return self.font.line_skip
+
+    def get_width(self) -> float:
+        return self.wrap_width or max(self.line_widths)
+
+    def get_size(self) -> tuple:
+        return self.get_width(), self.font.height + self.font.line_skip * (len(self.line_starts) - 1)
+
+    def get_line_offset(self, line: int) -> float:
+        if self.align == 'center':
+            return (self.get_width() - self.line_widths[line]) / 2
+        if self.align == 'right':
+            return self.get_width() - self.line_widths[line]
+        return 0.0
+
+    def get_caret_pos(self, index: int) -> tuple:
+        index = min(max(index, 0), len(self.text))
+        line = self.get_line(index)
+        start = self.line_starts[line]
+        x = self.get_line_offset(line) + sum(self.advances[start:min(index, self.line_ends[line])])
+        return x, line * self.font.line_skip, self.font.height
+
+    def hit_test(self, x: float, y: float) -> int:
+        line = min(max(int(y // self.font.line_skip), 0), len(self.line_starts) - 1)
+        start, end = self.line_starts[line], self.line_ends[line]
+        cur_x = self.get_line_offset(line)
+        advances = self.advances
+        for i in range(start, end):
+            advance = advances[i]
+            if x < cur_x + advance / 2:
+                return i
+            cur_x += advance
+        return end
+
+    def draw(
+            self, renderer: any, pos: any, color: any = (255, 255, 255), first_line: int = 0, last_line: int = None
+    ) -> None:
+        if self.check_style():
+            self.relayout()
+        glyph_atlas = self.font.get_glyph_atlas(renderer)
+        glyphs = glyph_atlas.get_glyphs()
+        get_glyph = glyph_atlas.get_glyph
+        own_batch = not (renderer.batch and renderer.batch.drawing)
+        batch = renderer.begin_batch() if own_batch else renderer.batch
+        color_mod = (color[0], color[1], color[2])
+        alpha_mod = color[3] if len(color) > 3 else 255
+        text = self.text
+        advances = self.advances
+        line_skip = self.font.line_skip
+        last_line = len(self.line_starts) if last_line is None else min(last_line, len(self.line_starts))
+        for line in range(max(first_line, 0), last_line):
+            cur_x = pos[0] + self.get_line_offset(line)
+            cur_y = pos[1] + line * line_skip
+            for i in range(self.line_starts[line], self.line_ends[line]):
+                region, advance = get_glyph(text[i], glyphs)
+                cur_x += advances[i] - advance
+                if region:
+                    batch.draw(
+                        region, dst_rect=(cur_x, cur_y, region.w, region.h), color_mod=color_mod, alpha_mod=alpha_mod
+                    )
+                cur_x += advance
+        own_batch and renderer.end_batch()
+
+
+class TextCache:
+    def __init__(self, renderer: any, budget: int = 8 * 1024 * 1024) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.budget = int(budget)
+        self.used = 0
+        self.textures = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.destroyed = False
+
+    @staticmethod
+    def make_key(font: any, text: str, fg: any, bg: any, blend: bool, wrap_length: float) -> tuple:
+        return (
+            font, text, tuple(fg), bg and tuple(bg), blend, int(wrap_length), font.size, tuple(font.scale),
+            font.bold, font.italic, font.underline, font.strike_through, font.outline, font.hinting,
+            font.wrapped_align
+        )
+
+    def get(
+            self, font: any, text: str, fg: any, bg: any = None, blend: bool = True, wrap_length: float = 0.0
+    ) -> Texture:
+        key = self.make_key(font, text, fg, bg, blend, wrap_length)
+        texture = self.textures.get(key)
+        if texture:
+            self.hits += 1
+            self.textures.move_to_end(key)
+            return texture
+        self.misses += 1
+        if wrap_length:
+            surf = font.render_utf8_wrapped(text or ' ', fg, bg, blend, wrap_length)
+        else:
+            surf = font.render_utf8(text or ' ', fg, bg, blend)
+        texture = self.renderer.texture_from_surface(surf)
+        surf.destroy()
+        self.textures[key] = texture
+        self.used += self.get_texture_bytes(texture)
+        self.evict()
+        return texture
+
+    @staticmethod
+    def get_texture_bytes(texture: Texture) -> int:
+        w, h = texture.get_size()
+        return w * h * 4
+
+    def evict(self) -> None:
+        while self.used > self.budget and len(self.textures) > 1:
+            key, texture = self.textures.popitem(last=False)
+            self.used -= self.get_texture_bytes(texture)
+
+    def clear(self) -> None:
+        for texture in self.textures.values():
+            texture.destroy()
+        self.textures.clear()
+        self.used = 0
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.clear()
+        del self.renderer
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
@@ -1,20 +1,34 @@
 import ctypes
+import contextlib
 from .video import PixelFormat
+from .surface import Surface, numpy
 from sdl2 import *
 
 
 class Texture:
+    __slots__ = (
+        'destroyed', 'app', 'texture', 'w', 'h', 'size', 'format', 'access', 'scale_mode', 'color_mod', 'alpha_mod',
+        'blend_mode', '__weakref__'
+    )
+    region = False
+    access_names = {
+        SDL_TEXTUREACCESS_STREAMING: 'streaming',
+        SDL_TEXTUREACCESS_TARGET: 'target',
+        SDL_TEXTUREACCESS_STATIC: 'static'
+    }
+
     def __init__(self, texture: SDL_Texture, renderer: any) -> None:
         self.destroyed = True
         if not texture:
             renderer.app.raise_error()
         self.app = renderer.app
         self.texture = texture
+        self.query()
         self.scale_mode = self.get_scale_mode()
         self.color_mod = self.get_color_mod()
         self.alpha_mod = self.get_alpha_mod()
         self.blend_mode = self.get_blend_mode_int()
-        if 'a' in self.get_format().string:
+        if 'a' in self.format.string:
             self.set_blend_mode_int(SDL_BLENDMODE_BLEND)
         self.destroyed = False
 
@@ -82,39 +96,50 @@ class Texture:
         self.alpha_mod = self.get_alpha_mod()
         self.update_blend_mode_by_alpha()
 
+    def query(self) -> None:
+        format_ptr, access_ptr, w_ptr, h_ptr = ctypes.c_uint32(), ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+        if SDL_QueryTexture(self.texture, format_ptr, access_ptr, w_ptr, h_ptr) < 0:
+            self.app.raise_error()
+        self.w, self.h = w_ptr.value, h_ptr.value
+        self.size = self.w, self.h
+        self.format = PixelFormat(format_ptr.value, self.app)
+        self.access = self.access_names.get(access_ptr.value, 'none')
+
     def get_size(self) -> tuple:
-        w_ptr, h_ptr = ctypes.c_int(), ctypes.c_int()
-        SDL_QueryTexture(self.texture, None, None, w_ptr, h_ptr)
-        return w_ptr.value, h_ptr.value
+        return self.size
 
     def get_w(self) -> int:
-        w_ptr = ctypes.c_int()
-        SDL_QueryTexture(self.texture, None, None, w_ptr, None)
-        return w_ptr.value
+        return self.w
 
     def get_h(self) -> int:
-        h_ptr = ctypes.c_int()
-        SDL_QueryTexture(self.texture, None, None, None, h_ptr)
-        return h_ptr.value
+        return self.h
 
     def get_access_type(self) -> str:
-        access_ptr = ctypes.c_int()
-        SDL_QueryTexture(self.texture, None, access_ptr, None, None)
-        if access_ptr.value == SDL_TEXTUREACCESS_STREAMING:
-            return 'streaming'
-        if access_ptr.value == SDL_TEXTUREACCESS_TARGET:
-            return 'target'
-        if access_ptr.value == SDL_TEXTUREACCESS_STATIC:
-            return 'static'
-        return 'none'
+        return self.access
 
     def get_format(self) -> PixelFormat:
-        format_ptr = ctypes.c_uint32()
-        SDL_QueryTexture(self.texture, format_ptr, None, None, None)
-        return PixelFormat(format_ptr.value, self.app)
-
-    def lock(self) -> None:
-        SDL_LockTexture(self.texture)
+        return self.format
+
+    def lock(self, lock_rect: any = None) -> tuple:
+        pixels_ptr, pitch_ptr = ctypes.c_void_p(), ctypes.c_int()
+        if SDL_LockTexture(
+                self.texture,
+                lock_rect and SDL_Rect(int(lock_rect[0]), int(lock_rect[1]), int(lock_rect[2]), int(lock_rect[3])),
+                ctypes.byref(pixels_ptr),
+                ctypes.byref(pitch_ptr)
+        ) < 0:
+            self.app.raise_error()
+        return pixels_ptr.value, pitch_ptr.value
+
+    @contextlib.contextmanager
+    def locked(self, lock_rect: any = None, channels: bool = True) -> any:
+        address, pitch = self.lock(lock_rect)
+        try:
+            yield Surface.make_pixels_view(
+                address, lock_rect[2:4] if lock_rect else self.size, pitch, self.format.bytes_per_pixel, channels
+            )
+        finally:
+            SDL_UnlockTexture(self.texture)
 
     def unlock(self) -> None:
         SDL_UnlockTexture(self.texture)
@@ -128,6 +153,31 @@ class Texture:
             pitch
         )
 
+    def update_from_array(self, array: any, update_rect: any = None) -> None:
+        if numpy is None:
+            raise RuntimeError('Texture.update_from_array requires NumPy')
+        if array.ndim < 2:
+            raise RuntimeError(f'Unsupported pixel array (shape {array.shape}, dtype {array.dtype})')
+        if not array.strides[-1] == array.itemsize or\
+                array.ndim == 3 and not array.strides[1] == array.shape[2] * array.itemsize or\
+                array.strides[0] < array.shape[1] * array.strides[1]:
+            array = numpy.ascontiguousarray(array)
+        if not update_rect:
+            update_rect = (0, 0, array.shape[1], array.shape[0])
+        row_size = array.shape[1] * array.strides[1]
+        if not row_size == int(update_rect[2]) * self.format.bytes_per_pixel or array.shape[0] < int(update_rect[3]):
+            raise RuntimeError(
+                f'Pixel array (shape {array.shape}, dtype {array.dtype}) does not match {self.format.string} '
+                f'update rect {tuple(update_rect)}'
+            )
+        if SDL_UpdateTexture(
+                self.texture,
+                SDL_Rect(int(update_rect[0]), int(update_rect[1]), int(update_rect[2]), int(update_rect[3])),
+                ctypes.c_void_p(array.ctypes.data),
+                array.strides[0]
+        ) < 0:
+            self.app.raise_error()
+
     def update_yuv(
             self, y_plane: any, y_pitch: int, u_plane: any, u_pitch: int,
             v_plane: any, v_pitch: int, update_rect: any = None
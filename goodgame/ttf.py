@@ -1,6 +1,8 @@
 import ctypes
 import struct
+from collections import OrderedDict
 from .surface import Surface
+from .text import GlyphAtlas, SDFGlyphAtlas
 from .sdl import SDLVersion
 from sdl2 import *
 
@@ -28,11 +30,16 @@ except NameError:
 
 
 class TTF:
-    def __init__(self, app: any, path: str, size: float, index: int = 0) -> None:
+    def __init__(
+            self, app: any, path: str, size: float, index: int = 0, data: bytes = None, scale: any = (1.0, 1.0)
+    ) -> None:
         self.destroyed = True
         self.app = app
+        self.path = path
+        self.index = index
+        self.data = data
         self.size = int(size)
-        self.scale = (1.0, 1.0)
+        self.scale = (float(scale[0]), float(scale[1]))
         self.encoding = app.encoding
         self.unicode_encoding = 'utf-16'
         self.hint_map = {
@@ -43,7 +50,12 @@ class TTF:
             'light_subpixel': TTF_HINTING_LIGHT_SUBPIXEL
         }
         self.r_hint_map = {b: a for a, b in self.hint_map.items()}
-        self.font = TTF_OpenFontIndex(app.stb(path), self.size, index)
+        if data is None:
+            self.font = TTF_OpenFontIndex(app.stb(path), self.size, index)
+            if self.font and not self.scale == (1.0, 1.0):
+                TTF_SetFontSizeDPI(self.font, self.size, int(72 * self.scale[0]), int(72 * self.scale[1]))
+        else:
+            self.font = self.open_data(data, self.size, index, self.scale)
         if not self.font:
             app.raise_error(TTF_GetError)
         self.normal = False
@@ -66,11 +78,40 @@ class TTF:
         self.descent = 0
         self.line_skip = 0
         self.kerning = False
+        self.kernings = {}
         self.wrapped_align = 'left'
+        self.glyph_atlas = None
+        self.sdf_atlas = None
         self.update_styles()
         self.update_vars()
         self.destroyed = False
 
+    def get_sdf_atlas(self, renderer: any, base_size: int = 48) -> SDFGlyphAtlas:
+        if not self.sdf_atlas or self.sdf_atlas.renderer is not renderer or not self.sdf_atlas.base_size == base_size:
+            self.sdf_atlas and self.sdf_atlas.destroy()
+            self.sdf_atlas = SDFGlyphAtlas(renderer, self, base_size)
+        return self.sdf_atlas
+
+    @staticmethod
+    def open_data(data: bytes, size: int, index: int = 0, scale: any = (1.0, 1.0)) -> any:
+        rw = SDL_RWFromConstMem(data, len(data))
+        if not rw:
+            return rw
+        if scale == (1.0, 1.0):
+            return TTF_OpenFontIndexRW(rw, 1, size, index)
+        try:
+            return TTF_OpenFontIndexDPIRW(rw, 1, size, index, int(72 * scale[0]), int(72 * scale[1]))
+        except NameError:
+            font = TTF_OpenFontIndexRW(rw, 1, size, index)
+            font and TTF_SetFontSizeDPI(font, size, int(72 * scale[0]), int(72 * scale[1]))
+            return font
+
+    def get_glyph_atlas(self, renderer: any) -> GlyphAtlas:
+        if not self.glyph_atlas or self.glyph_atlas.renderer is not renderer:
+            self.glyph_atlas and self.glyph_atlas.destroy()
+            self.glyph_atlas = GlyphAtlas(renderer, self)
+        return self.glyph_atlas
+
     def set_sdf(self, sdf: bool) -> None:
         TTF_SetFontSDF(self.font, sdf)
 
@@ -97,6 +138,32 @@ class TTF:
     def has_char(self, char: str) -> bool:
         return bool(TTF_GlyphIsProvided32(self.font, ord(char)))
 
+    def get_style_key(self) -> tuple:
+        return (
+            self.size, self.scale[0], self.scale[1], self.bold, self.italic, self.underline,
+            self.strike_through, self.outline, self.hinting
+        )
+
+    def get_kernings(self) -> dict:
+        style_key = self.get_style_key()
+        kernings = self.kernings.get(style_key)
+        if kernings is None:
+            kernings = self.kernings[style_key] = {}
+        return kernings
+
+    def get_kerning(self, prev_char: str, char: str, kernings: dict = None) -> int:
+        if kernings is None:
+            kernings = self.get_kernings()
+        pair = prev_char + char
+        kerning = kernings.get(pair)
+        if kerning is None:
+            try:
+                kerning = TTF_GetFontKerningSizeGlyphs32(self.font, ord(prev_char), ord(char))
+            except (NameError, RuntimeError):
+                kerning = 0
+            kernings[pair] = kerning
+        return kerning
+
     def update_vars(self) -> None:
         self.height = TTF_FontHeight(self.font)
         self.ascent = TTF_FontAscent(self.font)
@@ -452,6 +519,13 @@ class TTF:
     def destroy(self) -> bool:
         if self.destroyed:
             return True
+        if self.glyph_atlas:
+            self.glyph_atlas.destroy()
+            self.glyph_atlas = None
+        if self.sdf_atlas:
+            self.sdf_atlas.destroy()
+            self.sdf_atlas = None
+        self.kernings.clear()
         try:
             if self.app.init_flags['has_ttf']:
                 TTF_CloseFont(self.font)
@@ -463,3 +537,84 @@ class TTF:
 
     def __del__(self) -> None:
         self.destroy()
+
+
+class FontManager:
+    def __init__(self, app: any, max_fonts: int = 32) -> None:
+        self.destroyed = True
+        self.app = app
+        self.max_fonts = max_fonts
+        self.files = {}
+        self.fonts = OrderedDict()
+        self.destroyed = False
+
+    def load_file(self, path: str) -> bytes:
+        data = self.files.get(path)
+        if data is None:
+            with open(path, 'rb') as f:
+                data = self.files[path] = f.read()
+        return data
+
+    def get(
+            self, path: str, size: float, bold: bool = False, italic: bool = False, underline: bool = False,
+            strike_through: bool = False, outline: int = 0, scale: any = (1.0, 1.0), index: int = 0,
+            hinting: str = 'normal', kerning: bool = True
+    ) -> TTF:
+        key = (
+            path, int(size), bool(bold), bool(italic), bool(underline), bool(strike_through), int(outline),
+            float(scale[0]), float(scale[1]), index, hinting, bool(kerning)
+        )
+        font = self.fonts.get(key)
+        if font and not font.destroyed:
+            self.fonts.move_to_end(key)
+            return font
+        font = TTF(self.app, path, size, index, self.load_file(path), scale)
+        if bold or italic or underline or strike_through:
+            font.bold, font.italic, font.underline, font.strike_through = bold, italic, underline, strike_through
+            font.update_ttf_styles()
+            font.update_styles()
+            font.update_vars()
+        if outline:
+            font.set_outline(outline)
+            font.update_vars()
+        if not font.hinting == hinting:
+            font.set_hinting(hinting)
+        if not font.kerning == bool(kerning):
+            font.set_kerning(bool(kerning))
+        self.fonts[key] = font
+        self.fonts.move_to_end(key)
+        self.evict()
+        return font
+
+    def evict(self) -> None:
+        while len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)[1].destroy()
+
+    def set_max_fonts(self, max_fonts: int) -> None:
+        self.max_fonts = max_fonts
+        self.evict()
+
+    def get_count(self) -> int:
+        return len(self.fonts)
+
+    def unload(self, path: str) -> None:
+        for key in [key for key in self.fonts if key[0] == path]:
+            self.fonts.pop(key).destroy()
+        self.files.pop(path, None)
+
+    def clear(self) -> None:
+        for font in self.fonts.values():
+            font.destroy()
+        self.fonts.clear()
+        self.files.clear()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.clear()
+        del self.app
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
@@ -0,0 +1,403 @@
+import math
+try:
+    import numpy
+except:  # noqa
+    numpy = None
+
+
+def ease_linear(t: any) -> any:
+    return t
+
+
+def ease_in_quad(t: any) -> any:
+    return t * t
+
+
+def ease_out_quad(t: any) -> any:
+    return t * (2 - t)
+
+
+def ease_in_out_quad(t: any) -> any:
+    return numpy.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+
+
+def ease_in_cubic(t: any) -> any:
+    return t ** 3
+
+
+def ease_out_cubic(t: any) -> any:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: any) -> any:
+    return numpy.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2)
+
+
+def ease_in_quart(t: any) -> any:
+    return t ** 4
+
+
+def ease_out_quart(t: any) -> any:
+    return 1 - (1 - t) ** 4
+
+
+def ease_in_out_quart(t: any) -> any:
+    return numpy.where(t < 0.5, 8 * t ** 4, 1 - (-2 * t + 2) ** 4 / 2)
+
+
+def ease_in_quint(t: any) -> any:
+    return t ** 5
+
+
+def ease_out_quint(t: any) -> any:
+    return 1 - (1 - t) ** 5
+
+
+def ease_in_out_quint(t: any) -> any:
+    return numpy.where(t < 0.5, 16 * t ** 5, 1 - (-2 * t + 2) ** 5 / 2)
+
+
+def ease_in_sine(t: any) -> any:
+    return 1 - numpy.cos(t * math.pi / 2)
+
+
+def ease_out_sine(t: any) -> any:
+    return numpy.sin(t * math.pi / 2)
+
+
+def ease_in_out_sine(t: any) -> any:
+    return -(numpy.cos(t * math.pi) - 1) / 2
+
+
+def ease_in_expo(t: any) -> any:
+    return numpy.where(t <= 0, 0.0, 2.0 ** (10 * t - 10))
+
+
+def ease_out_expo(t: any) -> any:
+    return numpy.where(t >= 1, 1.0, 1 - 2.0 ** (-10 * t))
+
+
+def ease_in_out_expo(t: any) -> any:
+    return numpy.where(t <= 0, 0.0, numpy.where(
+        t >= 1, 1.0, numpy.where(t < 0.5, 2.0 ** (20 * t - 10) / 2, (2 - 2.0 ** (-20 * t + 10)) / 2)
+    ))
+
+
+def ease_in_circ(t: any) -> any:
+    return 1 - numpy.sqrt(1 - t * t)
+
+
+def ease_out_circ(t: any) -> any:
+    return numpy.sqrt(1 - (t - 1) ** 2)
+
+
+def ease_in_out_circ(t: any) -> any:
+    return numpy.where(
+        t < 0.5, (1 - numpy.sqrt(numpy.maximum(1 - (2 * t) ** 2, 0))) / 2,
+        (numpy.sqrt(numpy.maximum(1 - (-2 * t + 2) ** 2, 0)) + 1) / 2
+    )
+
+
+def ease_in_back(t: any) -> any:
+    return 2.70158 * t ** 3 - 1.70158 * t * t
+
+
+def ease_out_back(t: any) -> any:
+    return 1 + 2.70158 * (t - 1) ** 3 + 1.70158 * (t - 1) ** 2
+
+
+def ease_in_out_back(t: any) -> any:
+    c = 1.70158 * 1.525
+    return numpy.where(
+        t < 0.5, (2 * t) ** 2 * ((c + 1) * 2 * t - c) / 2, ((2 * t - 2) ** 2 * ((c + 1) * (t * 2 - 2) + c) + 2) / 2
+    )
+
+
+def ease_in_elastic(t: any) -> any:
+    return numpy.where(
+        (t <= 0) | (t >= 1), t, -2.0 ** (10 * t - 10) * numpy.sin((t * 10 - 10.75) * (2 * math.pi / 3))
+    )
+
+
+def ease_out_elastic(t: any) -> any:
+    return numpy.where(
+        (t <= 0) | (t >= 1), t, 2.0 ** (-10 * t) * numpy.sin((t * 10 - 0.75) * (2 * math.pi / 3)) + 1
+    )
+
+
+def ease_in_out_elastic(t: any) -> any:
+    s = numpy.sin((20 * t - 11.125) * (2 * math.pi / 4.5))
+    return numpy.where(
+        (t <= 0) | (t >= 1), t,
+        numpy.where(t < 0.5, -(2.0 ** (20 * t - 10) * s) / 2, 2.0 ** (-20 * t + 10) * s / 2 + 1)
+    )
+
+
+def ease_out_bounce(t: any) -> any:
+    return numpy.where(
+        t < 1 / 2.75, 7.5625 * t * t, numpy.where(
+            t < 2 / 2.75, 7.5625 * (t - 1.5 / 2.75) ** 2 + 0.75, numpy.where(
+                t < 2.5 / 2.75, 7.5625 * (t - 2.25 / 2.75) ** 2 + 0.9375, 7.5625 * (t - 2.625 / 2.75) ** 2 + 0.984375
+            )
+        )
+    )
+
+
+def ease_in_bounce(t: any) -> any:
+    return 1 - ease_out_bounce(1 - t)
+
+
+def ease_in_out_bounce(t: any) -> any:
+    return numpy.where(t < 0.5, (1 - ease_out_bounce(1 - 2 * t)) / 2, (1 + ease_out_bounce(2 * t - 1)) / 2)
+
+
+easing_functions = {
+    'linear': ease_linear,
+    'in_quad': ease_in_quad,
+    'out_quad': ease_out_quad,
+    'in_out_quad': ease_in_out_quad,
+    'in_cubic': ease_in_cubic,
+    'out_cubic': ease_out_cubic,
+    'in_out_cubic': ease_in_out_cubic,
+    'in_quart': ease_in_quart,
+    'out_quart': ease_out_quart,
+    'in_out_quart': ease_in_out_quart,
+    'in_quint': ease_in_quint,
+    'out_quint': ease_out_quint,
+    'in_out_quint': ease_in_out_quint,
+    'in_sine': ease_in_sine,
+    'out_sine': ease_out_sine,
+    'in_out_sine': ease_in_out_sine,
+    'in_expo': ease_in_expo,
+    'out_expo': ease_out_expo,
+    'in_out_expo': ease_in_out_expo,
+    'in_circ': ease_in_circ,
+    'out_circ': ease_out_circ,
+    'in_out_circ': ease_in_out_circ,
+    'in_back': ease_in_back,
+    'out_back': ease_out_back,
+    'in_out_back': ease_in_out_back,
+    'in_elastic': ease_in_elastic,
+    'out_elastic': ease_out_elastic,
+    'in_out_elastic': ease_in_out_elastic,
+    'in_bounce': ease_in_bounce,
+    'out_bounce': ease_out_bounce,
+    'in_out_bounce': ease_in_out_bounce
+}
+easing_names = tuple(easing_functions)
+easing_ids = {name: i for i, name in enumerate(easing_names)}
+easing_list = tuple(easing_functions[name] for name in easing_names)
+
+
+class TweenSystem:
+    def __init__(self, capacity: int = 256) -> None:
+        if numpy is None:
+            raise RuntimeError('TweenSystem requires NumPy')
+        self.capacity = 0
+        self.count = 0
+        self.next_id = 0
+        self.ids = None
+        self.start = None
+        self.end = None
+        self.duration = None
+        self.elapsed = None
+        self.easing = None
+        self.values = None
+        self.output = None
+        self.output_index = None
+        self.targets = []
+        self.target_count = 0
+        self.callbacks = []
+        self.outputs = []
+        self.grow(max(int(capacity), 1))
+
+    def grow(self, capacity: int) -> None:
+        def resize(old: any, dtype: any, fill: any = 0) -> any:
+            new = numpy.full(capacity, fill, dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+        self.ids = resize(self.ids, numpy.int64, -1)
+        self.start = resize(self.start, numpy.float64)
+        self.end = resize(self.end, numpy.float64)
+        self.duration = resize(self.duration, numpy.float64)
+        self.elapsed = resize(self.elapsed, numpy.float64)
+        self.easing = resize(self.easing, numpy.int32)
+        self.values = resize(self.values, numpy.float64)
+        self.output = resize(self.output, numpy.int32, -1)
+        self.output_index = resize(self.output_index, numpy.int64)
+        self.capacity = capacity
+
+    def reserve(self, count: int) -> None:
+        if self.count + count > self.capacity:
+            self.grow(max(self.capacity * 2, self.count + count))
+
+    def get_output_id(self, out: any) -> int:
+        free = -1
+        for i, output in enumerate(self.outputs):
+            if output is out:
+                return i
+            if output is None and free < 0:
+                free = i
+        if free >= 0:
+            self.outputs[free] = out
+            return free
+        self.outputs.append(out)
+        return len(self.outputs) - 1
+
+    def release_outputs(self) -> None:
+        outputs = self.outputs
+        used = set(numpy.unique(self.output[:self.count]).tolist())
+        for output_id in range(len(outputs)):
+            if output_id not in used:
+                outputs[output_id] = None
+        while outputs and outputs[-1] is None:
+            outputs.pop()
+
+    def add(
+            self, start: float, end: float, duration: float, easing: any = 'linear', target: any = None,
+            key: any = None, delay: float = 0.0, callback: any = None
+    ) -> int:
+        self.reserve(1)
+        i = self.count
+        tween_id = self.next_id
+        self.next_id += 1
+        self.ids[i] = tween_id
+        self.start[i] = start
+        self.end[i] = end
+        self.duration[i] = duration
+        self.elapsed[i] = -delay
+        self.easing[i] = easing if isinstance(easing, int) else easing_ids[easing]
+        self.values[i] = start
+        if isinstance(target, numpy.ndarray):
+            self.output[i] = self.get_output_id(target)
+            self.output_index[i] = key
+            target = None
+        else:
+            self.output[i] = -1
+        self.target_count += target is not None
+        self.targets.append((target, key) if target is not None else None)
+        self.callbacks.append(callback)
+        self.count += 1
+        return tween_id
+
+    def add_many(
+            self, start: any, end: any, duration: any, easing: any = 'linear', out: any = None, delay: any = 0.0
+    ) -> any:
+        start = numpy.asarray(start, numpy.float64).ravel()
+        count = len(start)
+        self.reserve(count)
+        i, j = self.count, self.count + count
+        ids = numpy.arange(self.next_id, self.next_id + count, dtype=numpy.int64)
+        self.next_id += count
+        self.ids[i:j] = ids
+        self.start[i:j] = start
+        self.end[i:j] = end
+        self.duration[i:j] = duration
+        self.elapsed[i:j] = -numpy.asarray(delay, numpy.float64)
+        self.easing[i:j] = easing if not isinstance(easing, str) else easing_ids[easing]
+        self.values[i:j] = start
+        if out is not None:
+            self.output[i:j] = self.get_output_id(out)
+            self.output_index[i:j] = numpy.arange(count)
+        else:
+            self.output[i:j] = -1
+        self.targets.extend([None] * count)
+        self.callbacks.extend([None] * count)
+        self.count = j
+        return ids
+
+    def find(self, tween_id: int) -> int:
+        found = numpy.flatnonzero(self.ids[:self.count] == tween_id)
+        return int(found[0]) if len(found) else -1
+
+    def is_active(self, tween_id: int) -> bool:
+        return self.find(tween_id) >= 0
+
+    def get_value(self, tween_id: int) -> float:
+        i = self.find(tween_id)
+        return float(self.values[i]) if i >= 0 else None
+
+    def get_count(self) -> int:
+        return self.count
+
+    def cancel(self, tween_id: int, finish: bool = False) -> bool:
+        i = self.find(tween_id)
+        if i < 0:
+            return False
+        if finish:
+            self.elapsed[i] = self.duration[i]
+            self.update(0.0)
+            return True
+        keep = numpy.ones(self.count, numpy.bool_)
+        keep[i] = False
+        self.compact(keep)
+        return True
+
+    def cancel_all(self) -> None:
+        self.count = 0
+        self.target_count = 0
+        self.targets.clear()
+        self.callbacks.clear()
+        self.outputs.clear()
+
+    def compact(self, keep: any) -> None:
+        count = self.count
+        new_count = int(numpy.count_nonzero(keep))
+        for array in (
+                self.ids, self.start, self.end, self.duration, self.elapsed, self.easing, self.values, self.output,
+                self.output_index
+        ):
+            array[:new_count] = array[:count][keep]
+        keep_list = keep.tolist()
+        self.targets = [target for target, kept in zip(self.targets, keep_list) if kept]
+        self.target_count = len(self.targets) - self.targets.count(None)
+        self.callbacks = [callback for callback, kept in zip(self.callbacks, keep_list) if kept]
+        self.count = new_count
+        self.outputs and self.release_outputs()
+
+    def update(self, dt: float) -> int:
+        count = self.count
+        if not count:
+            return 0
+        elapsed = self.elapsed[:count]
+        duration = self.duration[:count]
+        elapsed += dt
+        t = numpy.clip(numpy.divide(elapsed, duration, out=numpy.ones(count), where=duration > 0), 0.0, 1.0)
+        t[elapsed < 0] = 0.0
+        easing = self.easing[:count]
+        eased = numpy.empty(count)
+        first = easing[0]
+        if (easing == first).all():
+            eased[:] = easing_list[first](t)
+        else:
+            for easing_id in numpy.unique(easing).tolist():
+                mask = easing == easing_id
+                eased[mask] = easing_list[easing_id](t[mask])
+        values = self.values[:count]
+        start = self.start[:count]
+        numpy.multiply(self.end[:count] - start, eased, out=values)
+        values += start
+        output = self.output[:count]
+        if len(self.outputs) == 1:
+            mask = output == 0
+            self.outputs[0][self.output_index[:count][mask]] = values[mask]
+        else:
+            for output_id, out in enumerate(self.outputs):
+                mask = output == output_id
+                if mask.any():
+                    out[self.output_index[:count][mask]] = values[mask]
+        if self.target_count:
+            for i, target in enumerate(self.targets):
+                if target is not None:
+                    setattr(target[0], target[1], values[i].item())
+        finished = elapsed >= duration
+        if not finished.any():
+            return 0
+        callbacks = self.callbacks
+        done = [(int(self.ids[i]), callbacks[i]) for i in numpy.flatnonzero(finished).tolist() if callbacks[i]]
+        finished_count = int(numpy.count_nonzero(finished))
+        self.compact(~finished)
+        for tween_id, callback in done:
+            callback(tween_id)
+        return finished_count
@@ -0,0 +1,118 @@
+import time
+from collections import deque
+from concurrent.futures import Future
+from .loader import Loader
+from .surface import Surface
+from sdl2 import *
+
+
+class TextureUploader:
+    def __init__(self, renderer: any, budget: float = 0.002, workers: int = None, convert: bool = True) -> None:
+        self.destroyed = True
+        self.renderer = renderer
+        self.app = renderer.app
+        self.budget = budget
+        self.texture_formats = self.get_texture_formats() if convert else ()
+        self.ready = deque()
+        self.decoder = Loader(self.app, (), workers=workers)
+        self.decoder.load = self.decode
+        self.decoder.run()
+        self.byte_time = 0.0
+        self.uploaded = 0
+        self.uploaded_bytes = 0
+        self.destroyed = False
+
+    def get_texture_formats(self) -> tuple:
+        info = SDL_RendererInfo()
+        if SDL_GetRendererInfo(self.renderer.renderer, info) < 0:
+            self.app.raise_error()
+        return tuple(
+            info.texture_formats[i] for i in range(info.num_texture_formats)
+            if not SDL_ISPIXELFORMAT_FOURCC(info.texture_formats[i])
+        )
+
+    def get_texture_format(self, surf: Surface) -> int:
+        pixel_format = surf.format.pixel_format
+        if not self.texture_formats or pixel_format in self.texture_formats or surf.has_color_key or\
+                SDL_ISPIXELFORMAT_INDEXED(pixel_format):
+            return 0
+        need_alpha = bool(surf.mask[3])
+        for texture_format in self.texture_formats:
+            if bool(SDL_ISPIXELFORMAT_ALPHA(texture_format)) == need_alpha:
+                return texture_format
+        return 0
+
+    def decode(self, path: str) -> Surface:
+        surf = self.app.surface_from_file(path)
+        pixel_format = self.get_texture_format(surf)
+        if not pixel_format:
+            return surf
+        converted = Surface(SDL_ConvertSurfaceFormat(surf.surface, pixel_format, 0), self.app)
+        surf.destroy()
+        return converted
+
+    def load(self, path: str, priority: float = 0) -> Future:
+        future = Future()
+        decode_future = self.decoder.add(path, priority)
+        future.add_done_callback(lambda _future: _future.cancelled() and decode_future.cancel())
+        decode_future.add_done_callback(lambda _decode_future: self.on_decoded(_decode_future, future))
+        return future
+
+    def on_decoded(self, decode_future: Future, future: Future) -> None:
+        if decode_future.cancelled():
+            future.cancel()
+        elif decode_future.exception():
+            future.set_running_or_notify_cancel() and future.set_exception(decode_future.exception())
+        else:
+            self.ready.append((future, decode_future.result(), True))
+
+    def add_surface(self, surf: Surface, destroy_surface: bool = False) -> Future:
+        future = Future()
+        self.ready.append((future, surf, destroy_surface))
+        return future
+
+    def update(self) -> int:
+        deadline = time.perf_counter() + self.budget
+        count = 0
+        while self.ready:
+            future, surf, destroy_surface = self.ready[0]
+            surf_bytes = surf.w * surf.h * surf.bytes_per_pixel
+            start = time.perf_counter()
+            if count and start + surf_bytes * self.byte_time > deadline:
+                break
+            self.ready.popleft()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self.renderer.texture_from_surface(surf))
+                except Exception as err:
+                    future.set_exception(err)
+                elapsed = time.perf_counter() - start
+                self.byte_time = elapsed / max(surf_bytes, 1) if not self.byte_time else\
+                    self.byte_time * 0.75 + elapsed / max(surf_bytes, 1) * 0.25
+                self.uploaded += 1
+                self.uploaded_bytes += surf_bytes
+                count += 1
+            destroy_surface and surf.destroy()
+        return count
+
+    def get_pending(self) -> int:
+        return len(self.ready) + self.decoder.total_len - self.decoder.counter
+
+    def is_idle(self) -> bool:
+        return not self.get_pending()
+
+    def destroy(self) -> bool:
+        if self.destroyed:
+            return True
+        self.decoder.destroy()
+        while self.ready:
+            future, surf, destroy_surface = self.ready.popleft()
+            future.cancel()
+            destroy_surface and surf.destroy()
+        del self.renderer
+        del self.app
+        self.destroyed = True
+        return False
+
+    def __del__(self) -> None:
+        self.destroy()
@@ -80,10 +80,10 @@ class Renderer(gg.Renderer):
         )
         self.loader.load = self.load_file
         self.loader.run()
-        while not self.loader.finished:  # It's better to use call_on_finish (and create a loading screen)
-            continue
+        self.loader.wait()  # It's better to use call_on_finish (and create a loading screen)
         self.fps_font = self.loader.result[4]
         self.fps_font.set_kerning(False)
+        self.fps_glyphs = self.fps_font.get_glyph_atlas(self)
         self.bg = self.texture_from_surface(self.loader.result[0])
         self.bg.set_scale_mode('linear')
         self.music = self.loader.result[2]
@@ -139,21 +139,17 @@ class Renderer(gg.Renderer):
         if self.draw_rects:
             self.draw_rect((0, 255, 0), (100, 100, 100, 100))
             self.draw_rect((255, 0, 0), (100.5, 100.5, 100, 100), 20)
-        bm_tex = self.bm_font.render_lines(
-            f'{int(self.scale_animation.value * 100) / 100}\n{int(self.rotate_animation.value)}',
+        self.bm_font.draw(
+            f'{int(self.scale_animation.value * 100) / 100}\n{int(self.rotate_animation.value)}', (200, 200),
             y_offset=-self.bm_font.common['base'] / 2, wrap_align='center'
         )
-        bm_tex.set_scale_mode('linear')
-        self.blit(bm_tex, dst_rect=(200, 200))
         self.set_scale((1, 1))
         if self.circle_animation.enabled:
             self.draw_circle(
                 (0, 255, 255, 255 - self.circle_animation.value * 4),
                 self.circle_pos, self.circle_animation.value
             )
-        self.blit(self.texture_from_surface(
-            self.fps_font.render_text(f'FPS: {self.app.clock.get_fps()}', (0, 255, 255), blend=True)
-        ), dst_rect=(0, self.fps_font.descent))
+        self.fps_glyphs.draw(f'FPS: {self.app.clock.get_fps()}', (0, self.fps_font.descent), (0, 255, 255))
         self.flip()
 
 